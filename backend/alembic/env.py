@@ -1,9 +1,11 @@
 """Alembic environment configuration for async SQLModel."""
 
 import asyncio
+import logging
 from logging.config import fileConfig
 
 from alembic import context
+from alembic.runtime.migration import MigrationInfo
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
@@ -45,6 +47,24 @@ config.set_main_option("sqlalchemy.url", settings.async_database_url)
 # Target metadata for autogenerate
 target_metadata = SQLModel.metadata
 
+logger = logging.getLogger("alembic.env")
+
+# Session timeouts for migration connections. A DDL statement waiting for
+# its lock blocks every query queued behind it, so give up after a few
+# seconds rather than stall the site; rerun the migration once the
+# blocking transaction is gone. Override per run with
+# `alembic -x lock_timeout=30s upgrade head`.
+MIGRATION_TIMEOUTS = {
+    "lock_timeout": "5s",
+    "statement_timeout": "30min",
+}
+
+
+def migration_timeouts() -> dict[str, str]:
+    """MIGRATION_TIMEOUTS with any -x overrides from the command line applied."""
+    x_args = context.get_x_argument(as_dictionary=True)
+    return {name: x_args.get(name, value) for name, value in MIGRATION_TIMEOUTS.items()}
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -66,16 +86,60 @@ def run_migrations_offline() -> None:
     )
 
     with context.begin_transaction():
+        for name, value in migration_timeouts().items():
+            context.execute(f"SET {name} = '{value}'")
         context.run_migrations()
 
 
+def warn_unvalidated_constraints(connection: Connection) -> None:
+    """Log any constraints left NOT VALID (e.g. by an interrupted migration)."""
+    result = connection.exec_driver_sql(
+        "SELECT conrelid::regclass::text, conname FROM pg_constraint WHERE NOT convalidated"
+    )
+    for table_name, constraint_name in result:
+        logger.warning(
+            "Constraint %s on %s is NOT VALID; run ALTER TABLE %s VALIDATE CONSTRAINT %s",
+            constraint_name,
+            table_name,
+            table_name,
+            constraint_name,
+        )
+
+
+def warn_invalid_indexes(connection: Connection) -> None:
+    """Log any indexes left INVALID (e.g. a CONCURRENTLY build that hit lock_timeout)."""
+    result = connection.exec_driver_sql(
+        "SELECT indexrelid::regclass::text FROM pg_index WHERE NOT indisvalid"
+    )
+    for (index_name,) in result:
+        # if_not_exists would skip the rebuild, so it has to be dropped first
+        logger.warning(
+            "Index %s is INVALID; run DROP INDEX CONCURRENTLY %s and rerun the migration",
+            index_name,
+            index_name,
+        )
+
+
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with the given connection."""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    applied_steps: list[MigrationInfo] = []
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # Commit after each revision so a failed step does not roll back
+        # the revisions that completed before it
+        transaction_per_migration=True,
+        on_version_apply=lambda *, step, **_: applied_steps.append(step),
+    )
 
     with context.begin_transaction():
         context.run_migrations()
 
+    # The catalog scan is only worth doing when a revision actually ran
+    if any(not step.is_stamp for step in applied_steps):
+        warn_unvalidated_constraints(connection)
+        warn_invalid_indexes(connection)
+
 
 async def run_async_migrations() -> None:
     """Run migrations in async mode."""
@@ -83,6 +147,13 @@ async def run_async_migrations() -> None:
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        # Migrations are one-shot DDL; caching prepared statements only
+        # costs memory and extra round trips.
+        connect_args={
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "server_settings": migration_timeouts(),
+        },
     )
 
     async with connectable.connect() as connection:
@@ -7,11 +7,7 @@ Create Date: 2025-12-04 22:00:00.000000+00:00
 """
 from collections.abc import Sequence
 
-import sqlalchemy as sa
-import sqlmodel
-from sqlalchemy.dialects import postgresql
-
-from alembic import op
+from app.core.migrations import execute_script
 
 # revision identifiers, used by Alembic.
 revision: str = 'add_email_templates'
@@ -21,108 +17,122 @@ depends_on: str | Sequence[str] | None = None
 
 
 def upgrade() -> None:
-    # Email Template table
-    op.create_table('email_template',
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
-        sa.Column('id', sa.Uuid(), nullable=False),
-        sa.Column('tenant_id', sa.Uuid(), nullable=False),
-        sa.Column('name', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
-        sa.Column('description', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
-        sa.Column('subject', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
-        sa.Column('is_active', sa.Boolean(), nullable=False),
-        sa.Column('body_html', sa.Text(), nullable=False),
-        sa.Column('body_text', sa.Text(), nullable=True),
-        sa.Column('design_json', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('default_form_id', sa.Uuid(), nullable=True),
-        sa.Column('form_link_single_use', sa.Boolean(), nullable=False),
-        sa.Column('form_link_expires_days', sa.Integer(), nullable=True),
-        sa.Column('attachments', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('send_count', sa.Integer(), nullable=False),
-        sa.Column('last_sent_at', sa.DateTime(), nullable=True),
-        sa.ForeignKeyConstraint(['default_form_id'], ['form.id'], ),
-        sa.ForeignKeyConstraint(['tenant_id'], ['tenant.id'], ),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index(op.f('ix_email_template_name'), 'email_template', ['name'], unique=False)
-    op.create_index(op.f('ix_email_template_tenant_id'), 'email_template', ['tenant_id'], unique=False)
+    # All tables and indexes are created in one script so the migration costs a
+    # single round trip instead of one per statement. Each table keeps 15% of
+    # every page free so counter/timestamp updates (send_count,
+    # sends_this_hour, opened_at, ...) can be HOT updates that skip the indexes.
+    execute_script("""
+        -- Email Template table
+        CREATE TABLE email_template (
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            id UUID NOT NULL,
+            tenant_id UUID NOT NULL,
+            name VARCHAR NOT NULL,
+            description VARCHAR,
+            subject VARCHAR NOT NULL,
+            is_active BOOLEAN NOT NULL,
+            body_html TEXT NOT NULL,
+            body_text TEXT,
+            design_json JSONB,
+            default_form_id UUID,
+            form_link_single_use BOOLEAN NOT NULL,
+            form_link_expires_days INTEGER,
+            attachments JSONB,
+            send_count INTEGER NOT NULL,
+            last_sent_at TIMESTAMP WITHOUT TIME ZONE,
+            PRIMARY KEY (id),
+            FOREIGN KEY (default_form_id) REFERENCES form (id),
+            FOREIGN KEY (tenant_id) REFERENCES tenant (id)
+        ) WITH (fillfactor = 85);
+        CREATE INDEX ix_email_template_name ON email_template (name);
+        CREATE INDEX ix_email_template_tenant_id ON email_template (tenant_id);
+
+        -- Tenant Email Config table
+        CREATE TABLE tenant_email_config (
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            id UUID NOT NULL,
+            tenant_id UUID NOT NULL,
+            provider VARCHAR NOT NULL,
+            is_active BOOLEAN NOT NULL,
+            from_email VARCHAR NOT NULL,
+            from_name VARCHAR,
+            reply_to_email VARCHAR,
+            config JSONB,
+            max_sends_per_hour INTEGER NOT NULL,
+            sends_this_hour INTEGER NOT NULL,
+            hour_window_start TIMESTAMP WITHOUT TIME ZONE,
+            last_send_at TIMESTAMP WITHOUT TIME ZONE,
+            last_error VARCHAR,
+            PRIMARY KEY (id),
+            FOREIGN KEY (tenant_id) REFERENCES tenant (id),
+            UNIQUE (tenant_id)
+        ) WITH (fillfactor = 85);
+        CREATE UNIQUE INDEX ix_tenant_email_config_tenant_id ON tenant_email_config (tenant_id);
 
-    # Tenant Email Config table
-    op.create_table('tenant_email_config',
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
-        sa.Column('id', sa.Uuid(), nullable=False),
-        sa.Column('tenant_id', sa.Uuid(), nullable=False),
-        sa.Column('provider', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
-        sa.Column('is_active', sa.Boolean(), nullable=False),
-        sa.Column('from_email', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
-        sa.Column('from_name', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
-        sa.Column('reply_to_email', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
-        sa.Column('config', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('max_sends_per_hour', sa.Integer(), nullable=False),
-        sa.Column('sends_this_hour', sa.Integer(), nullable=False),
-        sa.Column('hour_window_start', sa.DateTime(), nullable=True),
-        sa.Column('last_send_at', sa.DateTime(), nullable=True),
-        sa.Column('last_error', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
-        sa.ForeignKeyConstraint(['tenant_id'], ['tenant.id'], ),
-        sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('tenant_id')
-    )
-    op.create_index(op.f('ix_tenant_email_config_tenant_id'), 'tenant_email_config', ['tenant_id'], unique=True)
+        -- Sent Email log table
+        CREATE TABLE sent_email (
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            id UUID NOT NULL,
+            tenant_id UUID NOT NULL,
+            template_id UUID,
+            to_email VARCHAR NOT NULL,
+            to_name VARCHAR,
+            contact_id UUID,
+            subject VARCHAR NOT NULL,
+            body_html TEXT NOT NULL,
+            body_text TEXT,
+            triggered_by VARCHAR,
+            workflow_id UUID,
+            workflow_execution_id UUID,
+            message_id UUID,
+            form_submission_id UUID,
+            form_link_id UUID,
+            status VARCHAR NOT NULL,
+            sent_at TIMESTAMP WITHOUT TIME ZONE,
+            provider_message_id VARCHAR,
+            error_message VARCHAR,
+            opened_at TIMESTAMP WITHOUT TIME ZONE,
+            clicked_at TIMESTAMP WITHOUT TIME ZONE,
+            bounced_at TIMESTAMP WITHOUT TIME ZONE,
+            unsubscribed_at TIMESTAMP WITHOUT TIME ZONE,
+            PRIMARY KEY (id)
+        ) WITH (fillfactor = 85);
+        CREATE INDEX ix_sent_email_contact_id ON sent_email (contact_id);
+        CREATE INDEX ix_sent_email_status ON sent_email (status);
+        CREATE INDEX ix_sent_email_template_id ON sent_email (template_id);
+        CREATE INDEX ix_sent_email_tenant_id ON sent_email (tenant_id);
+        CREATE INDEX ix_sent_email_to_email ON sent_email (to_email);
 
-    # Sent Email log table
-    op.create_table('sent_email',
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
-        sa.Column('id', sa.Uuid(), nullable=False),
-        sa.Column('tenant_id', sa.Uuid(), nullable=False),
-        sa.Column('template_id', sa.Uuid(), nullable=True),
-        sa.Column('to_email', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
-        sa.Column('to_name', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
-        sa.Column('contact_id', sa.Uuid(), nullable=True),
-        sa.Column('subject', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
-        sa.Column('body_html', sa.Text(), nullable=False),
-        sa.Column('body_text', sa.Text(), nullable=True),
-        sa.Column('triggered_by', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
-        sa.Column('workflow_id', sa.Uuid(), nullable=True),
-        sa.Column('workflow_execution_id', sa.Uuid(), nullable=True),
-        sa.Column('message_id', sa.Uuid(), nullable=True),
-        sa.Column('form_submission_id', sa.Uuid(), nullable=True),
-        sa.Column('form_link_id', sa.Uuid(), nullable=True),
-        sa.Column('status', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
-        sa.Column('sent_at', sa.DateTime(), nullable=True),
-        sa.Column('provider_message_id', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
-        sa.Column('error_message', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
-        sa.Column('opened_at', sa.DateTime(), nullable=True),
-        sa.Column('clicked_at', sa.DateTime(), nullable=True),
-        sa.Column('bounced_at', sa.DateTime(), nullable=True),
-        sa.Column('unsubscribed_at', sa.DateTime(), nullable=True),
-        sa.ForeignKeyConstraint(['contact_id'], ['contact.id'], ),
-        sa.ForeignKeyConstraint(['form_link_id'], ['form_link.id'], ),
-        sa.ForeignKeyConstraint(['form_submission_id'], ['form_submission.id'], ),
-        sa.ForeignKeyConstraint(['message_id'], ['message.id'], ),
-        sa.ForeignKeyConstraint(['template_id'], ['email_template.id'], ),
-        sa.ForeignKeyConstraint(['tenant_id'], ['tenant.id'], ),
-        sa.ForeignKeyConstraint(['workflow_execution_id'], ['workflow_execution.id'], ),
-        sa.ForeignKeyConstraint(['workflow_id'], ['workflow.id'], ),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index(op.f('ix_sent_email_contact_id'), 'sent_email', ['contact_id'], unique=False)
-    op.create_index(op.f('ix_sent_email_status'), 'sent_email', ['status'], unique=False)
-    op.create_index(op.f('ix_sent_email_template_id'), 'sent_email', ['template_id'], unique=False)
-    op.create_index(op.f('ix_sent_email_tenant_id'), 'sent_email', ['tenant_id'], unique=False)
-    op.create_index(op.f('ix_sent_email_to_email'), 'sent_email', ['to_email'], unique=False)
+        -- sent_email foreign keys are added NOT VALID after the table and its
+        -- indexes exist, so any bulk load is not checked row by row, then
+        -- validated separately (VALIDATE only takes SHARE UPDATE EXCLUSIVE).
+        ALTER TABLE sent_email
+            ADD CONSTRAINT sent_email_contact_id_fkey FOREIGN KEY (contact_id) REFERENCES contact (id) NOT VALID,
+            ADD CONSTRAINT sent_email_form_link_id_fkey FOREIGN KEY (form_link_id) REFERENCES form_link (id) NOT VALID,
+            ADD CONSTRAINT sent_email_form_submission_id_fkey FOREIGN KEY (form_submission_id) REFERENCES form_submission (id) NOT VALID,
+            ADD CONSTRAINT sent_email_message_id_fkey FOREIGN KEY (message_id) REFERENCES message (id) NOT VALID,
+            ADD CONSTRAINT sent_email_template_id_fkey FOREIGN KEY (template_id) REFERENCES email_template (id) NOT VALID,
+            ADD CONSTRAINT sent_email_tenant_id_fkey FOREIGN KEY (tenant_id) REFERENCES tenant (id) NOT VALID,
+            ADD CONSTRAINT sent_email_workflow_execution_id_fkey FOREIGN KEY (workflow_execution_id) REFERENCES workflow_execution (id) NOT VALID,
+            ADD CONSTRAINT sent_email_workflow_id_fkey FOREIGN KEY (workflow_id) REFERENCES workflow (id) NOT VALID;
+        ALTER TABLE sent_email VALIDATE CONSTRAINT sent_email_contact_id_fkey;
+        ALTER TABLE sent_email VALIDATE CONSTRAINT sent_email_form_link_id_fkey;
+        ALTER TABLE sent_email VALIDATE CONSTRAINT sent_email_form_submission_id_fkey;
+        ALTER TABLE sent_email VALIDATE CONSTRAINT sent_email_message_id_fkey;
+        ALTER TABLE sent_email VALIDATE CONSTRAINT sent_email_template_id_fkey;
+        ALTER TABLE sent_email VALIDATE CONSTRAINT sent_email_tenant_id_fkey;
+        ALTER TABLE sent_email VALIDATE CONSTRAINT sent_email_workflow_execution_id_fkey;
+        ALTER TABLE sent_email VALIDATE CONSTRAINT sent_email_workflow_id_fkey;
+    """)
 
 
 def downgrade() -> None:
-    op.drop_index(op.f('ix_sent_email_to_email'), table_name='sent_email')
-    op.drop_index(op.f('ix_sent_email_tenant_id'), table_name='sent_email')
-    op.drop_index(op.f('ix_sent_email_template_id'), table_name='sent_email')
-    op.drop_index(op.f('ix_sent_email_status'), table_name='sent_email')
-    op.drop_index(op.f('ix_sent_email_contact_id'), table_name='sent_email')
-    op.drop_table('sent_email')
-    op.drop_index(op.f('ix_tenant_email_config_tenant_id'), table_name='tenant_email_config')
-    op.drop_table('tenant_email_config')
-    op.drop_index(op.f('ix_email_template_tenant_id'), table_name='email_template')
-    op.drop_index(op.f('ix_email_template_name'), table_name='email_template')
-    op.drop_table('email_template')
+    # Dropping a table drops its indexes as well
+    execute_script("""
+        DROP TABLE sent_email;
+        DROP TABLE tenant_email_config;
+        DROP TABLE email_template;
+    """)
@@ -11,6 +11,7 @@ import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 
 from alembic import op
+from app.core.migrations import execute_script
 
 # revision identifiers, used by Alembic.
 revision: str = 'add_tone_stance'
@@ -28,11 +29,17 @@ def upgrade() -> None:
     op.alter_column('analysis', 'sentiment_label', existing_type=sa.String(), nullable=True)
     op.alter_column('analysis', 'sentiment_confidence', existing_type=sa.Float(), nullable=True)
 
-    # Add GIN index for efficient tone queries
-    op.execute("CREATE INDEX IF NOT EXISTS idx_analysis_tones ON analysis USING GIN (tones)")
+    # Add GIN index for efficient tone queries. Tone lookups are containment
+    # checks (tones @> '[{"label": "angry"}]'), which jsonb_path_ops serves
+    # with a smaller, faster index than the default jsonb_ops. Built
+    # CONCURRENTLY (outside the transaction) since analysis is populated.
+    with op.get_context().autocommit_block():
+        execute_script(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_analysis_tones ON analysis USING GIN (tones jsonb_path_ops)"
+        )
 
     # Add stance columns to message_category table
-    op.add_column('message_category', sa.Column('stance', sa.String(), nullable=True))
+    op.add_column('message_category', sa.Column('stance', sa.String(32), nullable=True))
     op.add_column('message_category', sa.Column('stance_confidence', sa.Float(), nullable=True))
 
     # Add dominant_tones column to contact table
@@ -44,11 +51,15 @@ def downgrade() -> None:
     op.drop_column('contact', 'dominant_tones')
 
     # Remove stance columns from message_category
-    op.drop_column('message_category', 'stance_confidence')
-    op.drop_column('message_category', 'stance')
+    execute_script("""
+        ALTER TABLE message_category
+            DROP COLUMN stance_confidence,
+            DROP COLUMN stance
+    """)
 
     # Remove tones index and column from analysis
-    op.execute("DROP INDEX IF EXISTS idx_analysis_tones")
+    with op.get_context().autocommit_block():
+        execute_script("DROP INDEX CONCURRENTLY IF EXISTS idx_analysis_tones")
     op.drop_column('analysis', 'tones')
 
     # Restore non-nullable sentiment columns (if data allows)
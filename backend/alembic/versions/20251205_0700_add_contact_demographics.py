@@ -8,7 +8,8 @@ Create Date: 2025-12-05 07:00:00.000000
 from typing import Sequence, Union
 
 from alembic import op
-import sqlalchemy as sa
+
+from app.core.migrations import execute_script
 
 
 # revision identifiers, used by Alembic.
@@ -19,116 +20,130 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Demographics
-    op.add_column('contact', sa.Column('date_of_birth', sa.Date(), nullable=True))
-    op.add_column('contact', sa.Column('age_estimate', sa.Integer(), nullable=True))
-    op.add_column('contact', sa.Column('age_estimate_source', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('gender', sa.String(), nullable=True))
-
-    # Name components
-    op.add_column('contact', sa.Column('prefix', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('first_name', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('middle_name', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('last_name', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('suffix', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('preferred_name', sa.String(), nullable=True))
-
-    # Professional/occupational
-    op.add_column('contact', sa.Column('occupation', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('employer', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('job_title', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('industry', sa.String(), nullable=True))
-
-    # Voter/political info
-    op.add_column('contact', sa.Column('voter_status', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('party_affiliation', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('voter_registration_date', sa.Date(), nullable=True))
-
-    # Socioeconomic indicators
-    op.add_column('contact', sa.Column('income_bracket', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('education_level', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('homeowner_status', sa.String(), nullable=True))
-
-    # Household info
-    op.add_column('contact', sa.Column('household_size', sa.Integer(), nullable=True))
-    op.add_column('contact', sa.Column('has_children', sa.Boolean(), nullable=True))
-    op.add_column('contact', sa.Column('marital_status', sa.String(), nullable=True))
-
-    # Language/communication preferences
-    op.add_column('contact', sa.Column('preferred_language', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('communication_preference', sa.String(), nullable=True))
-
-    # Additional contact methods
-    op.add_column('contact', sa.Column('secondary_email', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('mobile_phone', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('work_phone', sa.String(), nullable=True))
-
-    # Geographic targeting (denormalized for efficient queries)
-    op.add_column('contact', sa.Column('state', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('zip_code', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('county', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('congressional_district', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('state_legislative_district', sa.String(), nullable=True))
-
-    # Geolocation
-    op.add_column('contact', sa.Column('latitude', sa.Float(), nullable=True))
-    op.add_column('contact', sa.Column('longitude', sa.Float(), nullable=True))
-
-    # Create indexes for common filter/search fields
-    op.create_index('idx_contact_state', 'contact', ['state'])
-    op.create_index('idx_contact_zip_code', 'contact', ['zip_code'])
-    op.create_index('idx_contact_county', 'contact', ['county'])
-    op.create_index('idx_contact_congressional_district', 'contact', ['congressional_district'])
-    op.create_index('idx_contact_state_legislative_district', 'contact', ['state_legislative_district'])
-    op.create_index('idx_contact_party_affiliation', 'contact', ['party_affiliation'])
-    op.create_index('idx_contact_voter_status', 'contact', ['voter_status'])
-    op.create_index('idx_contact_last_name', 'contact', ['last_name'])
+    # Add all columns in a single ALTER TABLE so contact is locked (and its
+    # catalog entry rewritten) once rather than once per column. Codes and
+    # enum-like values get sized VARCHARs.
+    execute_script("""
+        ALTER TABLE contact
+            -- Demographics
+            ADD COLUMN date_of_birth DATE,
+            ADD COLUMN age_estimate INTEGER,
+            ADD COLUMN age_estimate_source VARCHAR,
+            ADD COLUMN gender VARCHAR(32),
+
+            -- Name components
+            ADD COLUMN prefix VARCHAR,
+            ADD COLUMN first_name VARCHAR,
+            ADD COLUMN middle_name VARCHAR,
+            ADD COLUMN last_name VARCHAR,
+            ADD COLUMN suffix VARCHAR,
+            ADD COLUMN preferred_name VARCHAR,
+
+            -- Professional/occupational
+            ADD COLUMN occupation VARCHAR,
+            ADD COLUMN employer VARCHAR,
+            ADD COLUMN job_title VARCHAR,
+            ADD COLUMN industry VARCHAR,
+
+            -- Voter/political info
+            ADD COLUMN voter_status VARCHAR(32),
+            ADD COLUMN party_affiliation VARCHAR(32),
+            ADD COLUMN voter_registration_date DATE,
+
+            -- Socioeconomic indicators
+            ADD COLUMN income_bracket VARCHAR(32),
+            ADD COLUMN education_level VARCHAR(32),
+            ADD COLUMN homeowner_status VARCHAR(32),
+
+            -- Household info
+            ADD COLUMN household_size INTEGER,
+            ADD COLUMN has_children BOOLEAN,
+            ADD COLUMN marital_status VARCHAR(32),
+
+            -- Language/communication preferences
+            ADD COLUMN preferred_language VARCHAR,
+            ADD COLUMN communication_preference VARCHAR(32),
+
+            -- Additional contact methods
+            ADD COLUMN secondary_email VARCHAR,
+            ADD COLUMN mobile_phone VARCHAR,
+            ADD COLUMN work_phone VARCHAR,
+
+            -- Geographic targeting (denormalized for efficient queries)
+            ADD COLUMN state VARCHAR(2),
+            ADD COLUMN zip_code VARCHAR(10),
+            ADD COLUMN county VARCHAR(64),
+            ADD COLUMN congressional_district VARCHAR(64),
+            ADD COLUMN state_legislative_district VARCHAR(64),
+
+            -- Geolocation
+            ADD COLUMN latitude FLOAT,
+            ADD COLUMN longitude FLOAT
+    """)
+
+    # Create indexes for common filter/search fields. Every contact query is
+    # scoped to a tenant, so tenant_id leads each index. contact is already
+    # populated, so build them CONCURRENTLY to keep writes flowing; that
+    # cannot run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.create_index('idx_contact_tenant_state', 'contact', ['tenant_id', 'state'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_contact_tenant_zip_code', 'contact', ['tenant_id', 'zip_code'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_contact_tenant_county', 'contact', ['tenant_id', 'county'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_contact_tenant_congressional_district', 'contact', ['tenant_id', 'congressional_district'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_contact_tenant_state_legislative_district', 'contact', ['tenant_id', 'state_legislative_district'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_contact_tenant_party_affiliation', 'contact', ['tenant_id', 'party_affiliation'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_contact_tenant_voter_status', 'contact', ['tenant_id', 'voter_status'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_contact_tenant_last_name', 'contact', ['tenant_id', 'last_name'], postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
     # Drop indexes
-    op.drop_index('idx_contact_last_name', table_name='contact')
-    op.drop_index('idx_contact_voter_status', table_name='contact')
-    op.drop_index('idx_contact_party_affiliation', table_name='contact')
-    op.drop_index('idx_contact_state_legislative_district', table_name='contact')
-    op.drop_index('idx_contact_congressional_district', table_name='contact')
-    op.drop_index('idx_contact_county', table_name='contact')
-    op.drop_index('idx_contact_zip_code', table_name='contact')
-    op.drop_index('idx_contact_state', table_name='contact')
-
-    # Drop columns (in reverse order)
-    op.drop_column('contact', 'longitude')
-    op.drop_column('contact', 'latitude')
-    op.drop_column('contact', 'state_legislative_district')
-    op.drop_column('contact', 'congressional_district')
-    op.drop_column('contact', 'county')
-    op.drop_column('contact', 'zip_code')
-    op.drop_column('contact', 'state')
-    op.drop_column('contact', 'work_phone')
-    op.drop_column('contact', 'mobile_phone')
-    op.drop_column('contact', 'secondary_email')
-    op.drop_column('contact', 'communication_preference')
-    op.drop_column('contact', 'preferred_language')
-    op.drop_column('contact', 'marital_status')
-    op.drop_column('contact', 'has_children')
-    op.drop_column('contact', 'household_size')
-    op.drop_column('contact', 'homeowner_status')
-    op.drop_column('contact', 'education_level')
-    op.drop_column('contact', 'income_bracket')
-    op.drop_column('contact', 'voter_registration_date')
-    op.drop_column('contact', 'party_affiliation')
-    op.drop_column('contact', 'voter_status')
-    op.drop_column('contact', 'industry')
-    op.drop_column('contact', 'job_title')
-    op.drop_column('contact', 'employer')
-    op.drop_column('contact', 'occupation')
-    op.drop_column('contact', 'preferred_name')
-    op.drop_column('contact', 'suffix')
-    op.drop_column('contact', 'last_name')
-    op.drop_column('contact', 'middle_name')
-    op.drop_column('contact', 'first_name')
-    op.drop_column('contact', 'prefix')
-    op.drop_column('contact', 'gender')
-    op.drop_column('contact', 'age_estimate_source')
-    op.drop_column('contact', 'age_estimate')
-    op.drop_column('contact', 'date_of_birth')
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_contact_tenant_last_name', table_name='contact', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_contact_tenant_voter_status', table_name='contact', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_contact_tenant_party_affiliation', table_name='contact', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_contact_tenant_state_legislative_district', table_name='contact', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_contact_tenant_congressional_district', table_name='contact', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_contact_tenant_county', table_name='contact', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_contact_tenant_zip_code', table_name='contact', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_contact_tenant_state', table_name='contact', postgresql_concurrently=True, if_exists=True)
+
+    # Drop columns (in reverse order) in a single ALTER TABLE
+    execute_script("""
+        ALTER TABLE contact
+            DROP COLUMN longitude,
+            DROP COLUMN latitude,
+            DROP COLUMN state_legislative_district,
+            DROP COLUMN congressional_district,
+            DROP COLUMN county,
+            DROP COLUMN zip_code,
+            DROP COLUMN state,
+            DROP COLUMN work_phone,
+            DROP COLUMN mobile_phone,
+            DROP COLUMN secondary_email,
+            DROP COLUMN communication_preference,
+            DROP COLUMN preferred_language,
+            DROP COLUMN marital_status,
+            DROP COLUMN has_children,
+            DROP COLUMN household_size,
+            DROP COLUMN homeowner_status,
+            DROP COLUMN education_level,
+            DROP COLUMN income_bracket,
+            DROP COLUMN voter_registration_date,
+            DROP COLUMN party_affiliation,
+            DROP COLUMN voter_status,
+            DROP COLUMN industry,
+            DROP COLUMN job_title,
+            DROP COLUMN employer,
+            DROP COLUMN occupation,
+            DROP COLUMN preferred_name,
+            DROP COLUMN suffix,
+            DROP COLUMN last_name,
+            DROP COLUMN middle_name,
+            DROP COLUMN first_name,
+            DROP COLUMN prefix,
+            DROP COLUMN gender,
+            DROP COLUMN age_estimate_source,
+            DROP COLUMN age_estimate,
+            DROP COLUMN date_of_birth
+    """)
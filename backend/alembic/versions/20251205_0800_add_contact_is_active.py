@@ -19,15 +19,32 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add is_active field (defaults to True for existing contacts)
+    # Add is_active field (defaults to True for existing contacts). A constant
+    # default is stored in the catalog (PostgreSQL 11+), so this neither
+    # rewrites contact nor touches its rows.
     op.add_column('contact', sa.Column('is_active', sa.Boolean(), server_default='true', nullable=False))
     op.add_column('contact', sa.Column('inactive_reason', sa.String(), nullable=True))
 
-    # Create index for filtering active/inactive contacts
-    op.create_index('idx_contact_is_active', 'contact', ['is_active'])
+    # Create index for finding inactive contacts (concurrently, so writes to
+    # the populated contact table are not blocked). Nearly every contact is
+    # active, so only the rare is_active = false rows are worth indexing;
+    # active-contact queries are served by a sequential scan either way.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_contact_inactive',
+            'contact',
+            ['id'],
+            postgresql_where=sa.text('is_active = false'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
-    op.drop_index('idx_contact_is_active', table_name='contact')
-    op.drop_column('contact', 'inactive_reason')
-    op.drop_column('contact', 'is_active')
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_contact_inactive', table_name='contact', postgresql_concurrently=True, if_exists=True)
+    op.execute("""
+        ALTER TABLE contact
+            DROP COLUMN inactive_reason,
+            DROP COLUMN is_active
+    """)
@@ -24,8 +24,8 @@ def upgrade() -> None:
     op.create_table(
         'list_of_values',
         sa.Column('id', UUID(as_uuid=True), primary_key=True),
-        sa.Column('tenant_id', UUID(as_uuid=True), sa.ForeignKey('tenant.id'), nullable=False, index=True),
-        sa.Column('list_type', sa.String(), nullable=False, index=True),
+        sa.Column('tenant_id', UUID(as_uuid=True), sa.ForeignKey('tenant.id'), nullable=False),
+        sa.Column('list_type', sa.String(), nullable=False),
         sa.Column('value', sa.String(), nullable=False, index=True),
         sa.Column('label', sa.String(), nullable=False),
         sa.Column('sort_order', sa.Integer(), nullable=False, server_default='0'),
@@ -35,11 +35,13 @@ def upgrade() -> None:
         sa.UniqueConstraint('tenant_id', 'list_type', 'value', name='uq_lov_tenant_type_value'),
     )
 
-    # Create index for common queries
+    # Create index for common queries. Every lookup is tenant-scoped, so this
+    # also serves tenant_id-only and tenant_id + list_type filters; no
+    # single-column indexes on those.
     op.create_index('idx_lov_tenant_list_type', 'list_of_values', ['tenant_id', 'list_type'])
 
     # Add pronouns field to contact table
-    op.add_column('contact', sa.Column('pronouns', sa.String(), nullable=True))
+    op.add_column('contact', sa.Column('pronouns', sa.String(32), nullable=True))
 
 
 def downgrade() -> None:
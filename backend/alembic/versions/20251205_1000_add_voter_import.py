@@ -8,8 +8,8 @@ Create Date: 2025-12-05 10:00:00.000000
 from typing import Sequence, Union
 
 from alembic import op
-import sqlalchemy as sa
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+from app.core.migrations import execute_script
 
 
 # revision identifiers, used by Alembic.
@@ -20,113 +20,141 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Create job table first (vote_history references it)
-    op.create_table(
-        'job',
-        sa.Column('id', UUID(as_uuid=True), primary_key=True),
-        sa.Column('tenant_id', UUID(as_uuid=True), sa.ForeignKey('tenant.id'), nullable=False, index=True),
-        sa.Column('job_type', sa.String(), nullable=False, index=True),
-        sa.Column('status', sa.String(), nullable=False, server_default='pending', index=True),
-
-        # File info
-        sa.Column('original_filename', sa.String(), nullable=True),
-        sa.Column('file_path', sa.String(), nullable=True),
-        sa.Column('file_size_bytes', sa.Integer(), nullable=True),
-        sa.Column('total_rows', sa.Integer(), nullable=True),
-
-        # AI mappings
-        sa.Column('detected_headers', JSONB(), nullable=True),
-        sa.Column('suggested_mappings', JSONB(), nullable=True),
-        sa.Column('confirmed_mappings', JSONB(), nullable=True),
-
-        # Matching strategy
-        sa.Column('matching_strategy', sa.String(), nullable=True),
-        sa.Column('suggested_matching_strategy', sa.String(), nullable=True),
-        sa.Column('matching_strategy_reason', sa.Text(), nullable=True),
-
-        # Progress
-        sa.Column('rows_processed', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('rows_created', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('rows_updated', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('rows_skipped', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('rows_errored', sa.Integer(), nullable=False, server_default='0'),
-
-        # Errors
-        sa.Column('error_message', sa.Text(), nullable=True),
-        sa.Column('error_details', JSONB(), nullable=True),
-
-        # Timing
-        sa.Column('started_at', sa.DateTime(), nullable=True),
-        sa.Column('completed_at', sa.DateTime(), nullable=True),
-
-        # Owner
-        sa.Column('created_by_id', UUID(as_uuid=True), sa.ForeignKey('user.id'), nullable=False, index=True),
-
-        # Timestamps
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now(), onupdate=sa.func.now()),
-    )
-
-    # Create vote_history table
-    op.create_table(
-        'vote_history',
-        sa.Column('id', UUID(as_uuid=True), primary_key=True),
-        sa.Column('tenant_id', UUID(as_uuid=True), sa.ForeignKey('tenant.id'), nullable=False, index=True),
-        sa.Column('contact_id', UUID(as_uuid=True), sa.ForeignKey('contact.id'), nullable=False, index=True),
-        sa.Column('election_name', sa.String(), nullable=False, index=True),
-        sa.Column('election_date', sa.Date(), nullable=False, index=True),
-        sa.Column('election_type', sa.String(), nullable=False, index=True),
-        sa.Column('voted', sa.Boolean(), nullable=True),
-        sa.Column('voting_method', sa.String(), nullable=True),
-        sa.Column('primary_party_voted', sa.String(), nullable=True),
-
-        # Import tracking
-        sa.Column('job_id', UUID(as_uuid=True), sa.ForeignKey('job.id'), nullable=True, index=True),
-        sa.Column('source_file_name', sa.String(), nullable=True),
-        sa.Column('imported_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-
-        # Timestamps
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now(), onupdate=sa.func.now()),
-
-        # Unique constraint
-        sa.UniqueConstraint('contact_id', 'election_date', 'election_type', name='uq_vote_history_contact_election'),
-    )
+    # Create job and vote_history tables (job first, vote_history references it)
+    # with their indexes in one script, so this costs a single round trip.
+    execute_script("""
+        CREATE TABLE job (
+            id UUID NOT NULL PRIMARY KEY,
+            tenant_id UUID NOT NULL REFERENCES tenant (id),
+            job_type VARCHAR NOT NULL,
+            status VARCHAR NOT NULL DEFAULT 'pending',
+
+            -- File info
+            original_filename VARCHAR,
+            file_path VARCHAR,
+            file_size_bytes INTEGER,
+            total_rows INTEGER,
+
+            -- AI mappings
+            detected_headers JSONB,
+            suggested_mappings JSONB,
+            confirmed_mappings JSONB,
+
+            -- Matching strategy
+            matching_strategy VARCHAR,
+            suggested_matching_strategy VARCHAR,
+            matching_strategy_reason TEXT,
+
+            -- Progress
+            rows_processed INTEGER NOT NULL DEFAULT 0,
+            rows_created INTEGER NOT NULL DEFAULT 0,
+            rows_updated INTEGER NOT NULL DEFAULT 0,
+            rows_skipped INTEGER NOT NULL DEFAULT 0,
+            rows_errored INTEGER NOT NULL DEFAULT 0,
+
+            -- Errors
+            error_message TEXT,
+            error_details JSONB,
+
+            -- Timing
+            started_at TIMESTAMP WITHOUT TIME ZONE,
+            completed_at TIMESTAMP WITHOUT TIME ZONE,
+
+            -- Owner
+            created_by_id UUID NOT NULL REFERENCES "user" (id),
+
+            -- Timestamps
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now()
+        ) WITH (fillfactor = 85);  -- leave room for HOT updates of the progress counters
+        CREATE INDEX ix_job_tenant_id ON job (tenant_id);
+        CREATE INDEX ix_job_job_type ON job (job_type);
+        CREATE INDEX ix_job_status ON job (status);
+        CREATE INDEX ix_job_created_by_id ON job (created_by_id);
+
+        CREATE TABLE vote_history (
+            id UUID NOT NULL PRIMARY KEY,
+            tenant_id UUID NOT NULL REFERENCES tenant (id),
+            contact_id UUID NOT NULL REFERENCES contact (id),
+            election_name VARCHAR NOT NULL,
+            election_date DATE NOT NULL,
+            election_type VARCHAR NOT NULL,
+            voted BOOLEAN,
+            voting_method VARCHAR,
+            primary_party_voted VARCHAR,
+
+            -- Import tracking
+            job_id UUID REFERENCES job (id),
+            source_file_name VARCHAR,
+            imported_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+
+            -- Timestamps
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+
+            CONSTRAINT uq_vote_history_contact_election UNIQUE (contact_id, election_date, election_type)
+        );
+        CREATE INDEX ix_vote_history_tenant_id ON vote_history (tenant_id);
+        CREATE INDEX ix_vote_history_contact_id ON vote_history (contact_id);
+        CREATE INDEX ix_vote_history_election_name ON vote_history (election_name);
+        -- election_date follows import order, so a BRIN index serves range
+        -- scans at a fraction of a B-tree's size and insert cost. Per-contact
+        -- ordering is covered by idx_vote_history_contact_date below.
+        CREATE INDEX idx_vote_history_election_date_brin ON vote_history
+            USING BRIN (election_date) WITH (pages_per_range = 32);
+        CREATE INDEX ix_vote_history_election_type ON vote_history (election_type);
+        CREATE INDEX ix_vote_history_job_id ON vote_history (job_id);
+
+        -- Composite indexes for common queries
+        CREATE INDEX idx_vote_history_contact_date ON vote_history (contact_id, election_date);
+        -- Imports arrive in voter-file order, scattering each contact's votes
+        -- across the heap. Mark the per-contact index as the clustering index
+        -- so maintenance runs (CLUSTER vote_history / pg_repack) regroup them.
+        ALTER TABLE vote_history CLUSTER ON idx_vote_history_contact_date;
+        CREATE INDEX idx_job_tenant_type_status ON job (tenant_id, job_type, status);
+    """)
 
     # Add new voter-related columns to contact table
-    op.add_column('contact', sa.Column('state_voter_id', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('precinct', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('school_district', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('municipal_district', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('modeled_party', sa.String(), nullable=True))
-
-    # Create indexes for voter fields
-    op.create_index('idx_contact_state_voter_id', 'contact', ['state_voter_id'])
-    op.create_index('idx_contact_precinct', 'contact', ['precinct'])
-    op.create_index('idx_contact_school_district', 'contact', ['school_district'])
-    op.create_index('idx_contact_municipal_district', 'contact', ['municipal_district'])
-
-    # Create composite indexes for common queries
-    op.create_index('idx_vote_history_contact_date', 'vote_history', ['contact_id', 'election_date'])
-    op.create_index('idx_job_tenant_type_status', 'job', ['tenant_id', 'job_type', 'status'])
+    # (one ALTER TABLE, so contact is locked once)
+    execute_script("""
+        ALTER TABLE contact
+            ADD COLUMN state_voter_id VARCHAR,
+            ADD COLUMN precinct VARCHAR,
+            ADD COLUMN school_district VARCHAR,
+            ADD COLUMN municipal_district VARCHAR,
+            ADD COLUMN modeled_party VARCHAR
+    """)
+
+    # Create tenant-scoped indexes for voter fields. contact is already populated,
+    # so build them CONCURRENTLY (outside the migration transaction) to avoid
+    # blocking writes.
+    with op.get_context().autocommit_block():
+        op.create_index('idx_contact_tenant_state_voter_id', 'contact', ['tenant_id', 'state_voter_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_contact_tenant_precinct', 'contact', ['tenant_id', 'precinct'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_contact_tenant_school_district', 'contact', ['tenant_id', 'school_district'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_contact_tenant_municipal_district', 'contact', ['tenant_id', 'municipal_district'], postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
     # Drop indexes
-    op.drop_index('idx_job_tenant_type_status', table_name='job')
-    op.drop_index('idx_vote_history_contact_date', table_name='vote_history')
-    op.drop_index('idx_contact_municipal_district', table_name='contact')
-    op.drop_index('idx_contact_school_district', table_name='contact')
-    op.drop_index('idx_contact_precinct', table_name='contact')
-    op.drop_index('idx_contact_state_voter_id', table_name='contact')
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_contact_tenant_municipal_district', table_name='contact', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_contact_tenant_school_district', table_name='contact', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_contact_tenant_precinct', table_name='contact', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_contact_tenant_state_voter_id', table_name='contact', postgresql_concurrently=True, if_exists=True)
 
     # Drop new contact columns
-    op.drop_column('contact', 'modeled_party')
-    op.drop_column('contact', 'municipal_district')
-    op.drop_column('contact', 'school_district')
-    op.drop_column('contact', 'precinct')
-    op.drop_column('contact', 'state_voter_id')
-
-    # Drop tables
-    op.drop_table('vote_history')
-    op.drop_table('job')
+    execute_script("""
+        ALTER TABLE contact
+            DROP COLUMN modeled_party,
+            DROP COLUMN municipal_district,
+            DROP COLUMN school_district,
+            DROP COLUMN precinct,
+            DROP COLUMN state_voter_id
+    """)
+
+    # Drop tables (their indexes go with them)
+    execute_script("""
+        DROP TABLE vote_history;
+        DROP TABLE job;
+    """)
@@ -8,7 +8,8 @@ Create Date: 2025-12-05 11:00:00.000000
 from typing import Sequence, Union
 
 from alembic import op
-import sqlalchemy as sa
+
+from app.core.migrations import execute_script
 
 
 # revision identifiers, used by Alembic.
@@ -21,16 +22,25 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     # Add source tracking fields to contact table
     # index=True in Field() creates ix_contact_source automatically
-    op.add_column('contact', sa.Column('source', sa.String(), nullable=True))
-    op.add_column('contact', sa.Column('source_detail', sa.String(), nullable=True))
-
-    # Create index for source column (if not exists)
-    op.execute("""
-        CREATE INDEX IF NOT EXISTS ix_contact_source ON contact (source)
+    execute_script("""
+        ALTER TABLE contact
+            ADD COLUMN source VARCHAR,
+            ADD COLUMN source_detail VARCHAR
     """)
 
+    # Create index for source column (if not exists). CONCURRENTLY cannot
+    # run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        execute_script("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_contact_source ON contact (source)
+        """)
+
 
 def downgrade() -> None:
-    op.drop_index('ix_contact_source', table_name='contact', if_exists=True)
-    op.drop_column('contact', 'source_detail')
-    op.drop_column('contact', 'source')
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_contact_source', table_name='contact', postgresql_concurrently=True, if_exists=True)
+    execute_script("""
+        ALTER TABLE contact
+            DROP COLUMN source_detail,
+            DROP COLUMN source
+    """)
@@ -1,5 +1,9 @@
 """Add create_unmatched column to job table.
 
+The server default only exists to fill existing rows while the column is
+added; it is dropped afterwards so the application (Job.create_unmatched
+defaults to True) stays the single source of the value for new jobs.
+
 Revision ID: add_job_create_unmatched
 Revises: add_audit_log
 Create Date: 2025-12-05 13:00:00.000000
@@ -8,7 +12,6 @@ Create Date: 2025-12-05 13:00:00.000000
 from typing import Sequence, Union
 
 from alembic import op
-import sqlalchemy as sa
 
 
 # revision identifiers, used by Alembic.
@@ -19,10 +22,12 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.add_column(
-        'job',
-        sa.Column('create_unmatched', sa.Boolean(), nullable=False, server_default='true')
-    )
+    # Emitted as a single ADD COLUMN ... NOT NULL DEFAULT so PostgreSQL 11+
+    # takes the fast-default path: the constant default is stored in the
+    # catalog and existing rows are not rewritten, so the lock on job is
+    # metadata-only regardless of table size.
+    op.execute("ALTER TABLE job ADD COLUMN create_unmatched BOOLEAN NOT NULL DEFAULT true")
+    op.execute("ALTER TABLE job ALTER COLUMN create_unmatched DROP DEFAULT")
 
 
 def downgrade() -> None:
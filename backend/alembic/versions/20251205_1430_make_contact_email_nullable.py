@@ -1,5 +1,12 @@
 """Make contact email nullable for voter imports.
 
+Voter imports create many contacts without an email, so the rule is
+"any number of NULL emails, unique when present". That is why this uses a
+partial unique index rather than a NULLS NOT DISTINCT index (PostgreSQL 15+),
+which would allow only one NULL email per tenant. An upsert against this
+index must repeat its predicate to be matched as the arbiter:
+ON CONFLICT (tenant_id, email) WHERE email IS NOT NULL.
+
 Revision ID: make_contact_email_nullable
 Revises: add_job_arq_fields
 Create Date: 2025-12-05 14:30:00.000000
@@ -11,6 +18,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.core.migrations import set_not_null_online
+
 
 # revision identifiers, used by Alembic.
 revision: str = "make_contact_email_nullable"
@@ -20,6 +29,21 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
+    # Create a partial unique index that only applies to non-NULL emails
+    # This allows multiple contacts with NULL email while keeping email unique when present.
+    # Built CONCURRENTLY (outside the transaction) so contact stays writable,
+    # and before the old constraint is dropped so uniqueness is never lost.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_contact_tenant_email_partial",
+            "contact",
+            ["tenant_id", "email"],
+            unique=True,
+            postgresql_where=sa.text("email IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
     # Drop the existing unique constraint on (tenant_id, email)
     op.drop_constraint("uq_contact_tenant_email", "contact", type_="unique")
 
@@ -31,30 +55,35 @@ def upgrade() -> None:
         nullable=True,
     )
 
-    # Create a partial unique index that only applies to non-NULL emails
-    # This allows multiple contacts with NULL email while keeping email unique when present
-    op.execute(
-        """
-        CREATE UNIQUE INDEX uq_contact_tenant_email_partial
-        ON contact (tenant_id, email)
-        WHERE email IS NOT NULL
-        """
-    )
-
 
 def downgrade() -> None:
-    # Drop the partial unique index
-    op.drop_index("uq_contact_tenant_email_partial", table_name="contact")
+    # Build the full unique index concurrently, then attach it as the
+    # original constraint so the constraint itself needs no table scan
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_contact_tenant_email",
+            "contact",
+            ["tenant_id", "email"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
     # Make email NOT NULL again (this will fail if there are NULL emails)
-    op.alter_column(
-        "contact",
-        "email",
-        existing_type=sa.VARCHAR(),
-        nullable=False,
-    )
+    with op.get_context().autocommit_block():
+        set_not_null_online("contact", "email")
 
     # Recreate the original unique constraint
-    op.create_unique_constraint(
-        "uq_contact_tenant_email", "contact", ["tenant_id", "email"]
+    op.execute(
+        "ALTER TABLE contact ADD CONSTRAINT uq_contact_tenant_email "
+        "UNIQUE USING INDEX uq_contact_tenant_email"
     )
+
+    # Drop the partial unique index
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_contact_tenant_email_partial",
+            table_name="contact",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
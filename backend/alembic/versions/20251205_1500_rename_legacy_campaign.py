@@ -0,0 +1,51 @@
+"""Rename the inbound-detection campaign table to legacy_campaign_detection.
+
+Part 1 of the campaign outbound system series (inbound campaign detection
+to outbound email marketing), split into one revision per step so each
+commits on its own and a failure only repeats the step that failed.
+
+The existing campaign rows are kept for history; the outbound campaign
+table that replaces it is created in create_outbound_campaign.
+
+Revision ID: rename_legacy_campaign
+Revises: make_contact_email_nullable
+Create Date: 2025-12-05 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from app.core.migrations import execute_script
+
+# revision identifiers, used by Alembic.
+revision: str = "rename_legacy_campaign"
+down_revision: Union[str, None] = "make_contact_email_nullable"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Renames are catalog-only: no data is copied and the FKs pointing at the
+    # table follow it, since they reference it by OID rather than by name.
+    # The legacy indexes and primary key are renamed rather than dropped so
+    # their names do not clash with the new campaign table's, and the
+    # downgrade can restore them without rebuilding anything.
+    execute_script("""
+        ALTER TABLE campaign RENAME TO legacy_campaign_detection;
+        ALTER TABLE legacy_campaign_detection
+            RENAME CONSTRAINT campaign_pkey TO legacy_campaign_detection_pkey;
+        ALTER INDEX IF EXISTS ix_campaign_tenant_id RENAME TO ix_legacy_campaign_detection_tenant_id;
+        ALTER INDEX IF EXISTS ix_campaign_name RENAME TO ix_legacy_campaign_detection_name;
+        ALTER INDEX IF EXISTS ix_campaign_template_hash RENAME TO ix_legacy_campaign_detection_template_hash;
+    """)
+
+
+def downgrade() -> None:
+    execute_script("""
+        ALTER INDEX IF EXISTS ix_legacy_campaign_detection_template_hash RENAME TO ix_campaign_template_hash;
+        ALTER INDEX IF EXISTS ix_legacy_campaign_detection_name RENAME TO ix_campaign_name;
+        ALTER INDEX IF EXISTS ix_legacy_campaign_detection_tenant_id RENAME TO ix_campaign_tenant_id;
+        ALTER TABLE legacy_campaign_detection
+            RENAME CONSTRAINT legacy_campaign_detection_pkey TO campaign_pkey;
+        ALTER TABLE legacy_campaign_detection RENAME TO campaign;
+    """)
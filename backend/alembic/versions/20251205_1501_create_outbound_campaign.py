@@ -0,0 +1,105 @@
+"""Create the outbound marketing campaign table.
+
+Part 2 of the campaign outbound system series (inbound campaign detection
+to outbound email marketing), split into one revision per step so each
+commits on its own and a failure only repeats the step that failed.
+
+Revision ID: create_outbound_campaign
+Revises: rename_legacy_campaign
+Create Date: 2025-12-05 15:01:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "create_outbound_campaign"
+down_revision: Union[str, None] = "rename_legacy_campaign"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "campaign",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("tenant_id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        # Core fields
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("campaign_type", sa.String(), nullable=False, server_default="standard"),
+        # Template configuration
+        sa.Column("template_id", sa.UUID(), nullable=False),
+        sa.Column("variant_b_template_id", sa.UUID(), nullable=True),
+        sa.Column("ab_test_split", sa.Integer(), nullable=False, server_default="50"),
+        sa.Column("ab_test_winner_metric", sa.String(), nullable=True),
+        sa.Column("ab_test_winner_selected_at", sa.DateTime(), nullable=True),
+        sa.Column("ab_test_winning_variant", sa.String(), nullable=True),
+        # Status and scheduling
+        sa.Column("status", sa.String(), nullable=False, server_default="draft"),
+        sa.Column("scheduled_at", sa.DateTime(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.Column("paused_at", sa.DateTime(), nullable=True),
+        # Recipient selection
+        sa.Column("recipient_filter", postgresql.JSONB(), nullable=False, server_default="{}"),
+        # Sending configuration
+        sa.Column("send_rate_per_hour", sa.Integer(), nullable=True),
+        sa.Column("from_email_override", sa.String(), nullable=True),
+        sa.Column("from_name_override", sa.String(), nullable=True),
+        sa.Column("reply_to_override", sa.String(), nullable=True),
+        # Aggregated statistics
+        sa.Column("total_recipients", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_sent", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_delivered", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_opened", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_clicked", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_bounced", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_unsubscribed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_failed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("unique_opens", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("unique_clicks", sa.Integer(), nullable=False, server_default="0"),
+        # Created by and job tracking
+        sa.Column("created_by_id", sa.UUID(), nullable=True),
+        sa.Column("job_id", sa.UUID(), nullable=True),
+        # Primary key (foreign keys are added below)
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Foreign keys are added NOT VALID and validated after the transaction
+    # commits: VALIDATE only takes SHARE UPDATE EXCLUSIVE, so checking any
+    # existing rows never happens under the locks ADD CONSTRAINT takes on
+    # this table and the referenced ones.
+    op.execute("""
+        ALTER TABLE campaign
+            ADD CONSTRAINT campaign_tenant_id_fkey FOREIGN KEY (tenant_id) REFERENCES tenant (id) ON DELETE CASCADE NOT VALID,
+            ADD CONSTRAINT campaign_template_id_fkey FOREIGN KEY (template_id) REFERENCES email_template (id) NOT VALID,
+            ADD CONSTRAINT campaign_variant_b_template_id_fkey FOREIGN KEY (variant_b_template_id) REFERENCES email_template (id) NOT VALID,
+            ADD CONSTRAINT campaign_created_by_id_fkey FOREIGN KEY (created_by_id) REFERENCES "user" (id) NOT VALID,
+            ADD CONSTRAINT campaign_job_id_fkey FOREIGN KEY (job_id) REFERENCES job (id) NOT VALID
+    """)
+
+    # Validation and CONCURRENTLY index builds run outside the transaction
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE campaign VALIDATE CONSTRAINT campaign_tenant_id_fkey")
+        op.execute("ALTER TABLE campaign VALIDATE CONSTRAINT campaign_template_id_fkey")
+        op.execute("ALTER TABLE campaign VALIDATE CONSTRAINT campaign_variant_b_template_id_fkey")
+        op.execute("ALTER TABLE campaign VALIDATE CONSTRAINT campaign_created_by_id_fkey")
+        op.execute("ALTER TABLE campaign VALIDATE CONSTRAINT campaign_job_id_fkey")
+        op.create_index("ix_campaign_name", "campaign", ["name"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("idx_campaign_tenant_status_scheduled", "campaign", ["tenant_id", "status", "scheduled_at"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_campaign_scheduled_at", "campaign", ["scheduled_at"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_campaign_template_id", "campaign", ["template_id"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_campaign_created_by_id", "campaign", ["created_by_id"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_campaign_job_id", "campaign", ["job_id"], postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_table("campaign")
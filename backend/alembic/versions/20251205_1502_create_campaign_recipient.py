@@ -0,0 +1,106 @@
+"""Create campaign_recipient for per-contact delivery tracking.
+
+Part 3 of the campaign outbound system series (inbound campaign detection
+to outbound email marketing), split into one revision per step so each
+commits on its own and a failure only repeats the step that failed.
+
+Recipients are bulk-inserted when a campaign launches. If that insert
+becomes a bottleneck, the launch path can load into the table with the
+secondary indexes dropped and rebuild them afterwards (or use an UNLOGGED
+staging table); the schema here does not depend on either.
+
+Revision ID: create_campaign_recipient
+Revises: create_outbound_campaign
+Create Date: 2025-12-05 15:02:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "create_campaign_recipient"
+down_revision: Union[str, None] = "create_outbound_campaign"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "campaign_recipient",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        # Foreign keys
+        sa.Column("campaign_id", sa.UUID(), nullable=False),
+        sa.Column("contact_id", sa.UUID(), nullable=False),
+        # Email cached at send time
+        sa.Column("email", sa.String(), nullable=False),
+        # A/B test assignment
+        sa.Column("variant", sa.String(), nullable=True),
+        # Delivery status
+        sa.Column("status", sa.String(), nullable=False, server_default="pending"),
+        sa.Column("sent_email_id", sa.UUID(), nullable=True),
+        # Timing
+        sa.Column("queued_at", sa.DateTime(), nullable=True),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.Column("delivered_at", sa.DateTime(), nullable=True),
+        sa.Column("opened_at", sa.DateTime(), nullable=True),
+        sa.Column("clicked_at", sa.DateTime(), nullable=True),
+        sa.Column("bounced_at", sa.DateTime(), nullable=True),
+        sa.Column("failed_at", sa.DateTime(), nullable=True),
+        sa.Column("unsubscribed_at", sa.DateTime(), nullable=True),
+        # Error tracking
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("bounce_type", sa.String(), nullable=True),
+        # Counts
+        sa.Column("open_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("click_count", sa.Integer(), nullable=False, server_default="0"),
+        # Primary key and constraints (foreign keys are added below)
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("campaign_id", "contact_id", name="uq_campaign_recipient"),
+    )
+
+    # Each recipient row is updated several times after insert (opened_at,
+    # open_count, click_count, ...). Leaving 20% of each page free lets those
+    # updates of unindexed columns stay HOT, on the same page with no index
+    # writes. Status changes still touch idx_campaign_recipient_campaign_status.
+    op.execute("ALTER TABLE campaign_recipient SET (fillfactor = 80)")
+
+    # Foreign keys are added NOT VALID and validated after the transaction
+    # commits: VALIDATE only takes SHARE UPDATE EXCLUSIVE, so checking any
+    # existing rows never happens under the locks ADD CONSTRAINT takes on
+    # this table and the referenced ones.
+    op.execute("""
+        ALTER TABLE campaign_recipient
+            ADD CONSTRAINT campaign_recipient_campaign_id_fkey FOREIGN KEY (campaign_id) REFERENCES campaign (id) ON DELETE CASCADE NOT VALID,
+            ADD CONSTRAINT campaign_recipient_contact_id_fkey FOREIGN KEY (contact_id) REFERENCES contact (id) ON DELETE CASCADE NOT VALID,
+            ADD CONSTRAINT campaign_recipient_sent_email_id_fkey FOREIGN KEY (sent_email_id) REFERENCES sent_email (id) NOT VALID
+    """)
+
+    # Validation and CONCURRENTLY index builds run outside the transaction
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE campaign_recipient VALIDATE CONSTRAINT campaign_recipient_campaign_id_fkey")
+        op.execute("ALTER TABLE campaign_recipient VALIDATE CONSTRAINT campaign_recipient_contact_id_fkey")
+        op.execute("ALTER TABLE campaign_recipient VALIDATE CONSTRAINT campaign_recipient_sent_email_id_fkey")
+        # (campaign_id, status) serves the sender's "pending recipients of
+        # campaign X" batches and replaces the single-column campaign_id and
+        # status indexes; the INCLUDE columns let per-status recipient counts
+        # run as index-only scans.
+        op.create_index(
+            "idx_campaign_recipient_campaign_status",
+            "campaign_recipient",
+            ["campaign_id", "status"],
+            postgresql_include=["email", "contact_id", "sent_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index("ix_campaign_recipient_contact_id", "campaign_recipient", ["contact_id"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_campaign_recipient_email", "campaign_recipient", ["email"], postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_table("campaign_recipient")
@@ -0,0 +1,89 @@
+"""Create email_suppression for bounces and unsubscribes.
+
+Part 4 of the campaign outbound system series (inbound campaign detection
+to outbound email marketing), split into one revision per step so each
+commits on its own and a failure only repeats the step that failed.
+
+Revision ID: create_email_suppression
+Revises: create_campaign_recipient
+Create Date: 2025-12-05 15:03:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "create_email_suppression"
+down_revision: Union[str, None] = "create_campaign_recipient"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "email_suppression",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("tenant_id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        # Suppressed email
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("contact_id", sa.UUID(), nullable=True),
+        # Suppression type
+        sa.Column("suppression_type", sa.String(), nullable=False),
+        # Scope
+        sa.Column("is_global", sa.Boolean(), nullable=False, server_default="true"),
+        sa.Column("campaign_id", sa.UUID(), nullable=True),
+        # Source tracking
+        sa.Column("source_campaign_id", sa.UUID(), nullable=True),
+        sa.Column("source_sent_email_id", sa.UUID(), nullable=True),
+        # When suppressed
+        sa.Column("suppressed_at", sa.DateTime(), nullable=False),
+        # Provider info
+        sa.Column("provider_info", postgresql.JSONB(), nullable=True),
+        # Removal tracking
+        sa.Column("is_active", sa.Boolean(), nullable=False, server_default="true"),
+        sa.Column("removed_at", sa.DateTime(), nullable=True),
+        sa.Column("removed_by_id", sa.UUID(), nullable=True),
+        sa.Column("removal_reason", sa.Text(), nullable=True),
+        # Primary key (foreign keys are added below)
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Foreign keys are added NOT VALID and validated after the transaction
+    # commits: VALIDATE only takes SHARE UPDATE EXCLUSIVE, so checking any
+    # existing rows never happens under the locks ADD CONSTRAINT takes on
+    # this table and the referenced ones.
+    op.execute("""
+        ALTER TABLE email_suppression
+            ADD CONSTRAINT email_suppression_tenant_id_fkey FOREIGN KEY (tenant_id) REFERENCES tenant (id) ON DELETE CASCADE NOT VALID,
+            ADD CONSTRAINT email_suppression_contact_id_fkey FOREIGN KEY (contact_id) REFERENCES contact (id) ON DELETE SET NULL NOT VALID,
+            ADD CONSTRAINT email_suppression_campaign_id_fkey FOREIGN KEY (campaign_id) REFERENCES campaign (id) ON DELETE SET NULL NOT VALID,
+            ADD CONSTRAINT email_suppression_source_campaign_id_fkey FOREIGN KEY (source_campaign_id) REFERENCES campaign (id) ON DELETE SET NULL NOT VALID,
+            ADD CONSTRAINT email_suppression_source_sent_email_id_fkey FOREIGN KEY (source_sent_email_id) REFERENCES sent_email (id) ON DELETE SET NULL NOT VALID,
+            ADD CONSTRAINT email_suppression_removed_by_id_fkey FOREIGN KEY (removed_by_id) REFERENCES "user" (id) ON DELETE SET NULL NOT VALID
+    """)
+
+    # Validation and CONCURRENTLY index builds run outside the transaction
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE email_suppression VALIDATE CONSTRAINT email_suppression_tenant_id_fkey")
+        op.execute("ALTER TABLE email_suppression VALIDATE CONSTRAINT email_suppression_contact_id_fkey")
+        op.execute("ALTER TABLE email_suppression VALIDATE CONSTRAINT email_suppression_campaign_id_fkey")
+        op.execute("ALTER TABLE email_suppression VALIDATE CONSTRAINT email_suppression_source_campaign_id_fkey")
+        op.execute("ALTER TABLE email_suppression VALIDATE CONSTRAINT email_suppression_source_sent_email_id_fkey")
+        op.execute("ALTER TABLE email_suppression VALIDATE CONSTRAINT email_suppression_removed_by_id_fkey")
+        op.create_index("idx_email_suppression_tenant_email", "email_suppression", ["tenant_id", "email"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_email_suppression_email", "email_suppression", ["email"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_email_suppression_contact_id", "email_suppression", ["contact_id"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_email_suppression_suppression_type", "email_suppression", ["suppression_type"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_email_suppression_campaign_id", "email_suppression", ["campaign_id"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_email_suppression_is_active", "email_suppression", ["is_active"], postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_table("email_suppression")
@@ -0,0 +1,94 @@
+"""Create campaign_recommendation for AI campaign suggestions.
+
+Part 5 of the campaign outbound system series (inbound campaign detection
+to outbound email marketing), split into one revision per step so each
+commits on its own and a failure only repeats the step that failed.
+
+Revision ID: create_campaign_recommendation
+Revises: create_email_suppression
+Create Date: 2025-12-05 15:04:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "create_campaign_recommendation"
+down_revision: Union[str, None] = "create_email_suppression"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "campaign_recommendation",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("tenant_id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        # Trigger
+        sa.Column("trigger_type", sa.String(), nullable=False),
+        sa.Column("category_id", sa.UUID(), nullable=True),
+        sa.Column("topic_keywords", postgresql.JSONB(), nullable=False, server_default="[]"),
+        # Trend data
+        sa.Column("trend_data", postgresql.JSONB(), nullable=False, server_default="{}"),
+        # Recommendation details
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("suggested_audience_size", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("suggested_filter", postgresql.JSONB(), nullable=False, server_default="{}"),
+        sa.Column("suggested_subject_lines", postgresql.JSONB(), nullable=False, server_default="[]"),
+        sa.Column("suggested_talking_points", postgresql.JSONB(), nullable=False, server_default="[]"),
+        sa.Column("confidence_score", sa.Float(), nullable=False, server_default="0.5"),
+        # Status
+        sa.Column("status", sa.String(), nullable=False, server_default="active"),
+        # Dismissal tracking
+        sa.Column("dismissed_at", sa.DateTime(), nullable=True),
+        sa.Column("dismissed_by_id", sa.UUID(), nullable=True),
+        sa.Column("dismissal_reason", sa.String(), nullable=True),
+        # Conversion tracking
+        sa.Column("converted_campaign_id", sa.UUID(), nullable=True),
+        sa.Column("converted_at", sa.DateTime(), nullable=True),
+        sa.Column("converted_by_id", sa.UUID(), nullable=True),
+        # Expiration
+        sa.Column("expires_at", sa.DateTime(), nullable=True),
+        # Primary key (foreign keys are added below)
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Foreign keys are added NOT VALID and validated after the transaction
+    # commits: VALIDATE only takes SHARE UPDATE EXCLUSIVE, so checking any
+    # existing rows never happens under the locks ADD CONSTRAINT takes on
+    # this table and the referenced ones.
+    op.execute("""
+        ALTER TABLE campaign_recommendation
+            ADD CONSTRAINT campaign_recommendation_tenant_id_fkey FOREIGN KEY (tenant_id) REFERENCES tenant (id) ON DELETE CASCADE NOT VALID,
+            ADD CONSTRAINT campaign_recommendation_category_id_fkey FOREIGN KEY (category_id) REFERENCES category (id) ON DELETE SET NULL NOT VALID,
+            ADD CONSTRAINT campaign_recommendation_dismissed_by_id_fkey FOREIGN KEY (dismissed_by_id) REFERENCES "user" (id) ON DELETE SET NULL NOT VALID,
+            ADD CONSTRAINT campaign_recommendation_converted_campaign_id_fkey FOREIGN KEY (converted_campaign_id) REFERENCES campaign (id) ON DELETE SET NULL NOT VALID,
+            ADD CONSTRAINT campaign_recommendation_converted_by_id_fkey FOREIGN KEY (converted_by_id) REFERENCES "user" (id) ON DELETE SET NULL NOT VALID
+    """)
+
+    # Validation and CONCURRENTLY index builds run outside the transaction
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE campaign_recommendation VALIDATE CONSTRAINT campaign_recommendation_tenant_id_fkey")
+        op.execute("ALTER TABLE campaign_recommendation VALIDATE CONSTRAINT campaign_recommendation_category_id_fkey")
+        op.execute("ALTER TABLE campaign_recommendation VALIDATE CONSTRAINT campaign_recommendation_dismissed_by_id_fkey")
+        op.execute("ALTER TABLE campaign_recommendation VALIDATE CONSTRAINT campaign_recommendation_converted_campaign_id_fkey")
+        op.execute("ALTER TABLE campaign_recommendation VALIDATE CONSTRAINT campaign_recommendation_converted_by_id_fkey")
+        op.create_index("idx_campaign_recommendation_tenant_status_expires", "campaign_recommendation", ["tenant_id", "status", "expires_at"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_campaign_recommendation_trigger_type", "campaign_recommendation", ["trigger_type"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_campaign_recommendation_category_id", "campaign_recommendation", ["category_id"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_campaign_recommendation_status", "campaign_recommendation", ["status"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_campaign_recommendation_title", "campaign_recommendation", ["title"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_campaign_recommendation_expires_at", "campaign_recommendation", ["expires_at"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_campaign_recommendation_converted_campaign_id", "campaign_recommendation", ["converted_campaign_id"], postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_table("campaign_recommendation")
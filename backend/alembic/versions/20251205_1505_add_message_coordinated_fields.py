@@ -0,0 +1,60 @@
+"""Add coordinated detection fields to message.
+
+Part 6 of the campaign outbound system series (inbound campaign detection
+to outbound email marketing), split into one revision per step so each
+commits on its own and a failure only repeats the step that failed.
+
+From this revision until drop_message_legacy_fields, message carries both
+the new coordinated fields and the legacy campaign_id / is_template_match /
+template_similarity_score columns. Application code deployed inside that
+window must read both and write both, so rows written mid-deploy are not
+lost when the legacy columns are dropped.
+
+Revision ID: add_message_coordinated_fields
+Revises: create_campaign_recommendation
+Create Date: 2025-12-05 15:05:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_message_coordinated_fields"
+down_revision: Union[str, None] = "create_campaign_recommendation"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Add new coordinated detection fields in a single ALTER TABLE. The
+    # constant default on is_coordinated is stored in the catalog, so
+    # existing rows are not rewritten.
+    op.execute("""
+        ALTER TABLE message
+            ADD COLUMN is_coordinated BOOLEAN NOT NULL DEFAULT false,
+            ADD COLUMN coordinated_group_id VARCHAR,
+            ADD COLUMN coordinated_confidence DOUBLE PRECISION,
+            ADD COLUMN coordinated_source_org VARCHAR
+    """)
+
+    # CONCURRENTLY keeps message writable while the indexes build. It cannot
+    # run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.create_index("ix_message_is_coordinated", "message", ["is_coordinated"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_message_coordinated_group_id", "message", ["coordinated_group_id"], postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_message_coordinated_group_id", table_name="message", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_message_is_coordinated", table_name="message", postgresql_concurrently=True, if_exists=True)
+
+    op.execute("""
+        ALTER TABLE message
+            DROP COLUMN coordinated_source_org,
+            DROP COLUMN coordinated_confidence,
+            DROP COLUMN coordinated_group_id,
+            DROP COLUMN is_coordinated
+    """)
@@ -0,0 +1,66 @@
+"""Copy template-match results into the message coordinated fields.
+
+Part 7 of the campaign outbound system series (inbound campaign detection
+to outbound email marketing), split into one revision per step so each
+commits on its own and a failure only repeats the step that failed.
+
+The backfill runs outside the migration transaction and commits every
+BACKFILL_BATCH_SIZE rows, so an interrupted run resumes where it stopped.
+The dual-read window described in add_message_coordinated_fields is still
+open here.
+
+Revision ID: backfill_message_coordinated
+Revises: add_message_coordinated_fields
+Create Date: 2025-12-05 15:06:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from app.core.migrations import execute_in_batches
+
+# revision identifiers, used by Alembic.
+revision: str = "backfill_message_coordinated"
+down_revision: Union[str, None] = "add_message_coordinated_fields"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        _backfill_message_in_batches(
+            "is_coordinated = true, coordinated_confidence = template_similarity_score",
+            "is_template_match = true AND is_coordinated = false",
+        )
+
+
+def _backfill_message_in_batches(assignments: str, condition: str) -> None:
+    """Apply ``SET assignments`` to message rows matching ``condition``.
+
+    Commits every BACKFILL_BATCH_SIZE rows; ``condition`` must stop matching
+    a row once it has been updated so the loop terminates.
+    """
+    if op.get_context().as_sql:
+        op.execute(f"UPDATE message SET {assignments} WHERE {condition}")
+        return
+
+    execute_in_batches(
+        f"""
+        UPDATE message SET {assignments}
+        WHERE id IN (
+            SELECT id FROM message WHERE {condition} LIMIT $1
+        )
+        """,
+        BACKFILL_BATCH_SIZE,
+    )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        _backfill_message_in_batches(
+            "is_template_match = true, template_similarity_score = coordinated_confidence",
+            "is_coordinated = true AND is_template_match = false",
+        )
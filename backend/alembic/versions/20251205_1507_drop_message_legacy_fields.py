@@ -0,0 +1,55 @@
+"""Drop the legacy campaign detection columns from message.
+
+Part 8 of the campaign outbound system series (inbound campaign detection
+to outbound email marketing), split into one revision per step so each
+commits on its own and a failure only repeats the step that failed.
+
+This closes the dual-read window opened by add_message_coordinated_fields:
+only application code that reads the coordinated fields may be running.
+
+Revision ID: drop_message_legacy_fields
+Revises: backfill_message_coordinated
+Create Date: 2025-12-05 15:07:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "drop_message_legacy_fields"
+down_revision: Union[str, None] = "backfill_message_coordinated"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Drop old fields and campaign_id FK; both indexes go in one statement
+    op.execute("DROP INDEX IF EXISTS ix_message_campaign_id, ix_message_is_template_match")
+    op.execute("""
+        ALTER TABLE message
+            DROP CONSTRAINT message_campaign_id_fkey,
+            DROP COLUMN campaign_id,
+            DROP COLUMN is_template_match,
+            DROP COLUMN template_similarity_score
+    """)
+
+
+def downgrade() -> None:
+    # Add back old fields; the data is copied back by the downgrade of
+    # backfill_message_coordinated
+    op.execute("""
+        ALTER TABLE message
+            ADD COLUMN campaign_id UUID,
+            ADD COLUMN is_template_match BOOLEAN NOT NULL DEFAULT false,
+            ADD COLUMN template_similarity_score DOUBLE PRECISION,
+            ADD CONSTRAINT message_campaign_id_fkey
+                FOREIGN KEY (campaign_id) REFERENCES legacy_campaign_detection (id) ON DELETE SET NULL NOT VALID
+    """)
+
+    # Validate the FK and rebuild the old message indexes without blocking writes
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE message VALIDATE CONSTRAINT message_campaign_id_fkey")
+        op.create_index("ix_message_is_template_match", "message", ["is_template_match"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_message_campaign_id", "message", ["campaign_id"], postgresql_concurrently=True, if_not_exists=True)
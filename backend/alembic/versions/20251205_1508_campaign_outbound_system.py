@@ -0,0 +1,62 @@
+"""Add campaign_id to sent_email for tracking.
+
+Part 9 and last of the campaign outbound system series (inbound campaign
+detection to outbound email marketing), split into one revision per step so
+each commits on its own and a failure only repeats the step that failed:
+
+1. rename_legacy_campaign - keep inbound campaigns as legacy_campaign_detection
+2. create_outbound_campaign - new campaign table with outbound marketing fields
+3. create_campaign_recipient - per-contact delivery tracking
+4. create_email_suppression - bounces and unsubscribes
+5. create_campaign_recommendation - AI suggestions
+6. add_message_coordinated_fields - coordinated detection fields on message
+7. backfill_message_coordinated - batched copy from the legacy fields
+8. drop_message_legacy_fields - remove campaign_id and template match columns
+9. campaign_outbound_system - this revision
+
+The series was originally a single revision with this ID; the last step
+keeps it so databases that already applied it remain at the right head.
+
+Revision ID: campaign_outbound_system
+Revises: drop_message_legacy_fields
+Create Date: 2025-12-05 15:08:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "campaign_outbound_system"
+down_revision: Union[str, None] = "drop_message_legacy_fields"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Column and FK in one ALTER TABLE: one statement, one lock acquisition.
+    # The FK is added NOT VALID so sent_email is not scanned under that lock.
+    op.execute("""
+        ALTER TABLE sent_email
+            ADD COLUMN campaign_id UUID,
+            ADD CONSTRAINT sent_email_campaign_id_fkey
+                FOREIGN KEY (campaign_id) REFERENCES campaign (id) ON DELETE SET NULL NOT VALID
+    """)
+
+    # VALIDATE (SHARE UPDATE EXCLUSIVE) and CONCURRENTLY keep sent_email
+    # writable; neither may run inside the transaction that added the FK.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE sent_email VALIDATE CONSTRAINT sent_email_campaign_id_fkey")
+        op.create_index("ix_sent_email_campaign_id", "sent_email", ["campaign_id"], postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_sent_email_campaign_id", table_name="sent_email", postgresql_concurrently=True, if_exists=True)
+
+    op.execute("""
+        ALTER TABLE sent_email
+            DROP CONSTRAINT sent_email_campaign_id_fkey,
+            DROP COLUMN campaign_id
+    """)
@@ -8,10 +8,8 @@ Create Date: 2025-12-06 15:41:11.255463+00:00
 
 from collections.abc import Sequence
 
-import sqlalchemy as sa
-import sqlmodel
-
 from alembic import op
+from app.core.migrations import execute_script
 
 # revision identifiers, used by Alembic.
 revision: str = "4582818bcf73"
@@ -21,100 +19,61 @@ depends_on: str | Sequence[str] | None = None
 
 
 def upgrade() -> None:
-    # Create prompt_template table
-    op.create_table(
-        "prompt_template",
-        sa.Column("created_at", sa.DateTime(), nullable=False),
-        sa.Column("updated_at", sa.DateTime(), nullable=False),
-        sa.Column("id", sa.Uuid(), nullable=False),
-        sa.Column("tenant_id", sa.Uuid(), nullable=False),
-        sa.Column("name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
-        sa.Column("description", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
-        sa.Column("is_active", sa.Boolean(), nullable=False),
-        sa.Column("system_prompt", sa.Text(), nullable=False),
-        sa.Column("user_prompt_template", sa.Text(), nullable=False),
-        sa.Column("version", sa.Integer(), nullable=False),
-        sa.Column("previous_version_id", sa.Uuid(), nullable=True),
-        sa.Column("temperature", sa.Float(), nullable=False),
-        sa.Column("max_tokens", sa.Integer(), nullable=False),
-        sa.ForeignKeyConstraint(
-            ["previous_version_id"],
-            ["prompt_template.id"],
-        ),
-        sa.ForeignKeyConstraint(
-            ["tenant_id"],
-            ["tenant.id"],
-        ),
-        sa.PrimaryKeyConstraint("id"),
-    )
-    op.create_index(
-        op.f("ix_prompt_template_name"), "prompt_template", ["name"], unique=False
-    )
-    op.create_index(
-        op.f("ix_prompt_template_tenant_id"),
-        "prompt_template",
-        ["tenant_id"],
-        unique=False,
-    )
+    # Both tables and their indexes go to the server as one script, a single
+    # round trip instead of one per statement
+    execute_script("""
+        CREATE TABLE prompt_template (
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            id UUID NOT NULL,
+            tenant_id UUID NOT NULL,
+            name VARCHAR(255) NOT NULL,
+            description TEXT,
+            is_active BOOLEAN NOT NULL,
+            system_prompt TEXT NOT NULL,
+            user_prompt_template TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            previous_version_id UUID,
+            temperature FLOAT NOT NULL,
+            max_tokens INTEGER NOT NULL,
+            PRIMARY KEY (id),
+            FOREIGN KEY (previous_version_id) REFERENCES prompt_template (id),
+            FOREIGN KEY (tenant_id) REFERENCES tenant (id)
+        );
+
+        CREATE INDEX ix_prompt_template_name ON prompt_template (name);
+        CREATE INDEX ix_prompt_template_tenant_id ON prompt_template (tenant_id);
+
+        CREATE TABLE ai_usage_log (
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            id UUID NOT NULL,
+            tenant_id UUID NOT NULL,
+            operation_type VARCHAR(64) NOT NULL,
+            operation_id VARCHAR,
+            ai_provider VARCHAR(64) NOT NULL,
+            ai_model VARCHAR(64) NOT NULL,
+            prompt_template_id UUID,
+            input_tokens INTEGER NOT NULL,
+            output_tokens INTEGER NOT NULL,
+            total_tokens INTEGER NOT NULL,
+            estimated_cost_usd FLOAT,
+            processing_time_ms INTEGER NOT NULL,
+            status VARCHAR(64) NOT NULL,
+            error_message TEXT,
+            user_id UUID,
+            PRIMARY KEY (id),
+            FOREIGN KEY (prompt_template_id) REFERENCES prompt_template (id),
+            FOREIGN KEY (tenant_id) REFERENCES tenant (id),
+            FOREIGN KEY (user_id) REFERENCES "user" (id)
+        );
 
-    # Create ai_usage_log table
-    op.create_table(
-        "ai_usage_log",
-        sa.Column("created_at", sa.DateTime(), nullable=False),
-        sa.Column("updated_at", sa.DateTime(), nullable=False),
-        sa.Column("id", sa.Uuid(), nullable=False),
-        sa.Column("tenant_id", sa.Uuid(), nullable=False),
-        sa.Column(
-            "operation_type", sqlmodel.sql.sqltypes.AutoString(), nullable=False
-        ),
-        sa.Column("operation_id", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
-        sa.Column("ai_provider", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
-        sa.Column("ai_model", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
-        sa.Column("prompt_template_id", sa.Uuid(), nullable=True),
-        sa.Column("input_tokens", sa.Integer(), nullable=False),
-        sa.Column("output_tokens", sa.Integer(), nullable=False),
-        sa.Column("total_tokens", sa.Integer(), nullable=False),
-        sa.Column("estimated_cost_usd", sa.Float(), nullable=True),
-        sa.Column("processing_time_ms", sa.Integer(), nullable=False),
-        sa.Column("status", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
-        sa.Column("error_message", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
-        sa.Column("user_id", sa.Uuid(), nullable=True),
-        sa.ForeignKeyConstraint(
-            ["prompt_template_id"],
-            ["prompt_template.id"],
-        ),
-        sa.ForeignKeyConstraint(
-            ["tenant_id"],
-            ["tenant.id"],
-        ),
-        sa.ForeignKeyConstraint(
-            ["user_id"],
-            ["user.id"],
-        ),
-        sa.PrimaryKeyConstraint("id"),
-    )
-    op.create_index(
-        op.f("ix_ai_usage_log_ai_provider"),
-        "ai_usage_log",
-        ["ai_provider"],
-        unique=False,
-    )
-    op.create_index(
-        op.f("ix_ai_usage_log_operation_type"),
-        "ai_usage_log",
-        ["operation_type"],
-        unique=False,
-    )
-    op.create_index(
-        op.f("ix_ai_usage_log_tenant_id"), "ai_usage_log", ["tenant_id"], unique=False
-    )
+        CREATE INDEX ix_ai_usage_log_ai_provider ON ai_usage_log (ai_provider);
+        CREATE INDEX ix_ai_usage_log_operation_type ON ai_usage_log (operation_type);
+        CREATE INDEX ix_ai_usage_log_tenant_id ON ai_usage_log (tenant_id);
+    """)
 
 
 def downgrade() -> None:
-    op.drop_index(op.f("ix_ai_usage_log_tenant_id"), table_name="ai_usage_log")
-    op.drop_index(op.f("ix_ai_usage_log_operation_type"), table_name="ai_usage_log")
-    op.drop_index(op.f("ix_ai_usage_log_ai_provider"), table_name="ai_usage_log")
-    op.drop_table("ai_usage_log")
-    op.drop_index(op.f("ix_prompt_template_tenant_id"), table_name="prompt_template")
-    op.drop_index(op.f("ix_prompt_template_name"), table_name="prompt_template")
-    op.drop_table("prompt_template")
+    # Dropping the tables drops their indexes with them
+    op.execute("DROP TABLE ai_usage_log, prompt_template")
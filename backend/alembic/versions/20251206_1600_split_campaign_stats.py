@@ -0,0 +1,103 @@
+"""Move campaign counters into campaign_stats.
+
+The delivery counters are bumped on every send and webhook event. On
+campaign, each of those UPDATEs rewrote a row that carries several
+indexes; campaign_stats has only its primary key, so the UPDATEs stay HOT.
+
+A trigger on campaign inserts the matching campaign_stats row, so every
+campaign has exactly one and writers can always UPDATE it in place.
+
+Revision ID: split_campaign_stats
+Revises: 4582818bcf73
+Create Date: 2025-12-06 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "split_campaign_stats"
+down_revision: Union[str, None] = "4582818bcf73"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+STAT_COLUMNS = (
+    "total_recipients",
+    "total_sent",
+    "total_delivered",
+    "total_opened",
+    "total_clicked",
+    "total_bounced",
+    "total_unsubscribed",
+    "total_failed",
+    "unique_opens",
+    "unique_clicks",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "campaign_stats",
+        sa.Column("campaign_id", sa.UUID(), nullable=False),
+        *(
+            sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+            for name in STAT_COLUMNS
+        ),
+        # Primary key only: no secondary indexes, so counter UPDATEs stay HOT
+        sa.PrimaryKeyConstraint("campaign_id"),
+    )
+
+    # Create the stats row for every new campaign. The trigger is in place
+    # before the backfill, and CREATE TRIGGER blocks inserts on campaign
+    # until this transaction commits, so no campaign is missed.
+    op.execute("""
+        CREATE FUNCTION campaign_stats_insert() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO campaign_stats (campaign_id) VALUES (NEW.id);
+            RETURN NULL;
+        END;
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER campaign_stats_insert
+            AFTER INSERT ON campaign
+            FOR EACH ROW EXECUTE FUNCTION campaign_stats_insert()
+    """)
+
+    columns = ", ".join(STAT_COLUMNS)
+    op.execute(f"INSERT INTO campaign_stats (campaign_id, {columns}) SELECT id, {columns} FROM campaign")
+
+    # Foreign key is added NOT VALID and validated after the transaction
+    # commits, as in the campaign outbound series
+    op.execute("""
+        ALTER TABLE campaign_stats
+            ADD CONSTRAINT campaign_stats_campaign_id_fkey
+                FOREIGN KEY (campaign_id) REFERENCES campaign (id) ON DELETE CASCADE NOT VALID
+    """)
+    op.execute(
+        "ALTER TABLE campaign "
+        + ", ".join(f"DROP COLUMN {name}" for name in STAT_COLUMNS)
+    )
+
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE campaign_stats VALIDATE CONSTRAINT campaign_stats_campaign_id_fkey")
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE campaign "
+        + ", ".join(f"ADD COLUMN {name} INTEGER NOT NULL DEFAULT 0" for name in STAT_COLUMNS)
+    )
+
+    assignments = ", ".join(f"{name} = s.{name}" for name in STAT_COLUMNS)
+    op.execute(f"UPDATE campaign c SET {assignments} FROM campaign_stats s WHERE s.campaign_id = c.id")
+
+    op.execute("DROP TRIGGER campaign_stats_insert ON campaign")
+    op.execute("DROP FUNCTION campaign_stats_insert()")
+    op.drop_table("campaign_stats")
@@ -0,0 +1,39 @@
+"""Index message by tenant and received_at.
+
+The analytics trend, volume and dashboard queries filter on tenant_id and
+a received_at range. With separate single-column indexes PostgreSQL has
+to pick one or bitmap-AND them; the composite serves the range scan for a
+single tenant directly. It also covers tenant_id-only lookups, so
+ix_message_tenant_id is dropped.
+
+Revision ID: add_message_tenant_received_idx
+Revises: split_campaign_stats
+Create Date: 2025-12-06 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_message_tenant_received_idx"
+down_revision: Union[str, None] = "split_campaign_stats"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps message writable while the index builds. It cannot
+    # run inside a transaction, hence the autocommit block. The composite is
+    # built before the single-column index goes, so tenant lookups are
+    # never left without one.
+    with op.get_context().autocommit_block():
+        op.create_index("idx_message_tenant_received_at", "message", ["tenant_id", "received_at"], postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index("ix_message_tenant_id", table_name="message", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index("ix_message_tenant_id", "message", ["tenant_id"], postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index("idx_message_tenant_received_at", table_name="message", postgresql_concurrently=True, if_exists=True)
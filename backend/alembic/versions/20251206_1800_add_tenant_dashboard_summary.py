@@ -0,0 +1,91 @@
+"""Add tenant_dashboard_summary materialized view.
+
+The dashboard endpoint ran six aggregate queries over a tenant's messages,
+analyses and categories on every load. This view precomputes them as one
+row per tenant; the refresh_dashboard_summary worker cron refreshes it
+every five minutes with REFRESH MATERIALIZED VIEW CONCURRENTLY, which
+needs the unique index on tenant_id.
+
+"Today" and "this week" are evaluated at refresh time in UTC, matching
+the datetime.utcnow() boundaries the endpoint used before.
+
+Revision ID: add_tenant_dashboard_summary
+Revises: add_message_tenant_received_idx
+Create Date: 2025-12-06 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_tenant_dashboard_summary"
+down_revision: Union[str, None] = "add_message_tenant_received_idx"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW tenant_dashboard_summary AS
+        WITH message_totals AS (
+            SELECT
+                m.tenant_id,
+                count(*) AS total_messages,
+                count(*) FILTER (
+                    WHERE m.received_at >= date_trunc('day', now() AT TIME ZONE 'UTC')
+                ) AS messages_today,
+                count(*) FILTER (
+                    WHERE m.received_at >= date_trunc('week', now() AT TIME ZONE 'UTC')
+                ) AS messages_this_week,
+                count(*) FILTER (WHERE m.processing_status = 'pending') AS pending_messages,
+                avg(a.sentiment_score) AS avg_sentiment
+            FROM message m
+            LEFT JOIN analysis a ON a.message_id = m.id
+            GROUP BY m.tenant_id
+        ),
+        sentiment_counts AS (
+            SELECT m.tenant_id, a.sentiment_label, count(*) AS message_count
+            FROM analysis a
+            JOIN message m ON m.id = a.message_id
+            WHERE a.sentiment_label IS NOT NULL
+            GROUP BY m.tenant_id, a.sentiment_label
+        ),
+        category_counts AS (
+            SELECT
+                m.tenant_id, c.id, c.name, c.color,
+                count(*) AS message_count,
+                row_number() OVER (PARTITION BY m.tenant_id ORDER BY count(*) DESC) AS rank
+            FROM category c
+            JOIN message_category mc ON mc.category_id = c.id
+            JOIN message m ON m.id = mc.message_id
+            GROUP BY m.tenant_id, c.id, c.name, c.color
+        )
+        SELECT
+            t.tenant_id,
+            t.total_messages,
+            t.messages_today,
+            t.messages_this_week,
+            t.pending_messages,
+            t.avg_sentiment,
+            coalesce(
+                (SELECT jsonb_object_agg(s.sentiment_label, s.message_count)
+                 FROM sentiment_counts s WHERE s.tenant_id = t.tenant_id),
+                '{}'
+            ) AS sentiment_distribution,
+            coalesce(
+                (SELECT jsonb_agg(
+                            jsonb_build_object('id', c.id::text, 'name', c.name, 'color', c.color, 'count', c.message_count)
+                            ORDER BY c.rank
+                        )
+                 FROM category_counts c WHERE c.tenant_id = t.tenant_id AND c.rank <= 5),
+                '[]'
+            ) AS top_categories
+        FROM message_totals t
+    """)
+    op.execute("CREATE UNIQUE INDEX ix_tenant_dashboard_summary_tenant_id ON tenant_dashboard_summary (tenant_id)")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW tenant_dashboard_summary")
@@ -0,0 +1,61 @@
+"""Replace ai_usage_log single-column indexes with covering composites.
+
+Usage reporting filters on tenant_id and a created_at window, then groups
+by provider, operation or model. The single-column indexes on tenant_id,
+ai_provider and operation_type could only be combined with a bitmap AND
+and a heap visit per row. The composites below lead with tenant_id and
+created_at and INCLUDE the grouped and summed columns, so those reports
+are index-only scans. tenant_id-only lookups use the composites too;
+nothing queries ai_provider or operation_type without a tenant.
+
+Revision ID: add_ai_usage_log_covering_idx
+Revises: add_tenant_dashboard_summary
+Create Date: 2025-12-06 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_ai_usage_log_covering_idx"
+down_revision: Union[str, None] = "add_tenant_dashboard_summary"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps ai_usage_log writable while the indexes build, so
+    # AI calls can keep logging. It cannot run inside a transaction, hence
+    # the autocommit block. The composites are built before the
+    # single-column indexes go.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_ai_usage_log_tenant_created_at",
+            "ai_usage_log",
+            ["tenant_id", "created_at"],
+            postgresql_include=["ai_provider", "operation_type", "input_tokens", "output_tokens", "estimated_cost_usd"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_ai_usage_log_tenant_model_created_at",
+            "ai_usage_log",
+            ["tenant_id", "ai_model", "created_at"],
+            postgresql_include=["input_tokens", "output_tokens", "estimated_cost_usd"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index("ix_ai_usage_log_tenant_id", table_name="ai_usage_log", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_ai_usage_log_ai_provider", table_name="ai_usage_log", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_ai_usage_log_operation_type", table_name="ai_usage_log", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index("ix_ai_usage_log_operation_type", "ai_usage_log", ["operation_type"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_ai_usage_log_ai_provider", "ai_usage_log", ["ai_provider"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_ai_usage_log_tenant_id", "ai_usage_log", ["tenant_id"], postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index("idx_ai_usage_log_tenant_model_created_at", table_name="ai_usage_log", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("idx_ai_usage_log_tenant_created_at", table_name="ai_usage_log", postgresql_concurrently=True, if_exists=True)
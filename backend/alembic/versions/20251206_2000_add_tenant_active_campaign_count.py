@@ -0,0 +1,80 @@
+"""Keep a per-tenant count of active campaigns.
+
+The dashboard showed the number of active campaigns by counting campaign
+rows on every load. tenant.active_campaign_count holds that number,
+maintained by a trigger on campaign as status moves into and out of
+"active", so the dashboard reads one column.
+
+Revision ID: add_tenant_active_campaign_count
+Revises: add_ai_usage_log_covering_idx
+Create Date: 2025-12-06 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_tenant_active_campaign_count"
+down_revision: Union[str, None] = "add_ai_usage_log_covering_idx"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A constant default makes this a catalog-only change, no table rewrite
+    op.add_column(
+        "tenant",
+        sa.Column("active_campaign_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # UPDATE OF status, tenant_id skips the trigger for all other campaign
+    # edits. As with campaign_stats_insert, the trigger exists before the
+    # backfill, and CREATE TRIGGER blocks writes to campaign until this
+    # transaction commits, so the backfilled counts cannot go stale.
+    op.execute("""
+        CREATE FUNCTION tenant_active_campaign_count() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE'
+                AND OLD.status IS NOT DISTINCT FROM NEW.status
+                AND OLD.tenant_id = NEW.tenant_id THEN
+                RETURN NULL;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.status = 'active' THEN
+                UPDATE tenant SET active_campaign_count = active_campaign_count - 1
+                WHERE id = OLD.tenant_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.status = 'active' THEN
+                UPDATE tenant SET active_campaign_count = active_campaign_count + 1
+                WHERE id = NEW.tenant_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER tenant_active_campaign_count
+            AFTER INSERT OR DELETE OR UPDATE OF status, tenant_id ON campaign
+            FOR EACH ROW EXECUTE FUNCTION tenant_active_campaign_count()
+    """)
+
+    op.execute("""
+        UPDATE tenant t SET active_campaign_count = c.active
+        FROM (
+            SELECT tenant_id, count(*) AS active
+            FROM campaign
+            WHERE status = 'active'
+            GROUP BY tenant_id
+        ) c
+        WHERE c.tenant_id = t.id
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER tenant_active_campaign_count ON campaign")
+    op.execute("DROP FUNCTION tenant_active_campaign_count()")
+    op.drop_column("tenant", "active_campaign_count")
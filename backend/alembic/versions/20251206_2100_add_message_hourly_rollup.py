@@ -0,0 +1,69 @@
+"""Add message_hourly_rollup.
+
+The sentiment trend and message volume endpoints grouped every message in
+the requested range on each call. message_hourly_rollup holds per-hour
+totals for each tenant and source, so whole hours are read from it and
+only the partial hours at the edges of a range, and the current hour,
+come from message.
+
+The refresh_message_rollup worker cron recomputes the trailing hours every
+five minutes and rebuild_message_rollup recomputes everything nightly.
+This migration fills it for all complete hours.
+
+Revision ID: add_message_hourly_rollup
+Revises: add_tenant_active_campaign_count
+Create Date: 2025-12-06 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_message_hourly_rollup"
+down_revision: Union[str, None] = "add_tenant_active_campaign_count"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The primary key serves tenant range scans over hour and the
+    # latest-hour lookup the endpoints use to find where the rollup ends
+    op.create_table(
+        "message_hourly_rollup",
+        sa.Column("tenant_id", sa.UUID(), nullable=False),
+        sa.Column("hour", sa.DateTime(), nullable=False),
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("message_count", sa.Integer(), nullable=False),
+        sa.Column("analyzed_count", sa.Integer(), nullable=False),
+        sa.Column("sentiment_sum", sa.Float(), nullable=False),
+        sa.Column("sentiment_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenant.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tenant_id", "hour", "source"),
+    )
+
+    op.execute("""
+        INSERT INTO message_hourly_rollup (
+            tenant_id, hour, source,
+            message_count, analyzed_count, sentiment_sum, sentiment_count
+        )
+        SELECT
+            m.tenant_id,
+            date_trunc('hour', m.received_at),
+            m.source,
+            count(*),
+            count(a.id),
+            coalesce(sum(a.sentiment_score), 0),
+            count(a.sentiment_score)
+        FROM message m
+        LEFT JOIN analysis a ON a.message_id = m.id
+        WHERE m.received_at < date_trunc('hour', now() AT TIME ZONE 'UTC')
+        GROUP BY 1, 2, 3
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("message_hourly_rollup")
@@ -0,0 +1,81 @@
+"""Cover the analytics message and analysis lookups.
+
+The analytics endpoints filter message on tenant_id and a received_at
+range and read a few more columns: source for volume, is_coordinated for
+the campaign comparison, processed_at for response times, and id to join
+analysis for sentiment. idx_message_tenant_received_at now INCLUDEs those
+columns, and ix_analysis_message_id INCLUDEs sentiment_score and
+sentiment_label, so both sides of the join can be index-only scans.
+
+The pending count for response times gets a partial index; it only holds
+the processing backlog rather than every message of the tenant.
+
+Both covering indexes keep their names: each is built under a temporary
+name, the old one is dropped and the new one renamed, so the table is
+never without it and analysis.message_id stays unique throughout.
+
+Revision ID: add_analytics_covering_indexes
+Revises: add_message_hourly_rollup
+Create Date: 2025-12-06 22:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_analytics_covering_indexes"
+down_revision: Union[str, None] = "add_message_hourly_rollup"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps message and analysis writable while the indexes
+    # build. It cannot run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_message_tenant_received_at_new",
+            "message",
+            ["tenant_id", "received_at"],
+            postgresql_include=["id", "source", "is_coordinated", "processed_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index("idx_message_tenant_received_at", table_name="message", postgresql_concurrently=True, if_exists=True)
+        op.execute("ALTER INDEX idx_message_tenant_received_at_new RENAME TO idx_message_tenant_received_at")
+
+        op.create_index(
+            "ix_analysis_message_id_new",
+            "analysis",
+            ["message_id"],
+            unique=True,
+            postgresql_include=["sentiment_score", "sentiment_label"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index("ix_analysis_message_id", table_name="analysis", postgresql_concurrently=True, if_exists=True)
+        op.execute("ALTER INDEX ix_analysis_message_id_new RENAME TO ix_analysis_message_id")
+
+        op.create_index(
+            "idx_message_tenant_pending",
+            "message",
+            ["tenant_id", "received_at"],
+            postgresql_where="processing_status = 'pending'",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("idx_message_tenant_pending", table_name="message", postgresql_concurrently=True, if_exists=True)
+
+        op.create_index("ix_analysis_message_id_old", "analysis", ["message_id"], unique=True, postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index("ix_analysis_message_id", table_name="analysis", postgresql_concurrently=True, if_exists=True)
+        op.execute("ALTER INDEX ix_analysis_message_id_old RENAME TO ix_analysis_message_id")
+
+        op.create_index("idx_message_tenant_received_at_old", "message", ["tenant_id", "received_at"], postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index("idx_message_tenant_received_at", table_name="message", postgresql_concurrently=True, if_exists=True)
+        op.execute("ALTER INDEX idx_message_tenant_received_at_old RENAME TO idx_message_tenant_received_at")
@@ -0,0 +1,49 @@
+"""Index contact by tenant and its list sort columns.
+
+The contact list defaults to ORDER BY last_contact_at DESC within a
+tenant, and the contact_analytics dataset pages by keyset on
+(message_count, id) DESC. Both sorted the tenant's whole contact table
+for every page. With these composites each page is a backward index scan
+that stops after page_size rows.
+
+Revision ID: add_contact_sort_indexes
+Revises: add_analytics_covering_indexes
+Create Date: 2025-12-06 23:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_contact_sort_indexes"
+down_revision: Union[str, None] = "add_analytics_covering_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps contact writable while the indexes build. It
+    # cannot run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_contact_tenant_last_contact_at",
+            "contact",
+            ["tenant_id", "last_contact_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_contact_tenant_message_count",
+            "contact",
+            ["tenant_id", "message_count", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("idx_contact_tenant_message_count", table_name="contact", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("idx_contact_tenant_last_contact_at", table_name="contact", postgresql_concurrently=True, if_exists=True)
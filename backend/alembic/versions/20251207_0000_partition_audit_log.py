@@ -0,0 +1,239 @@
+"""Partition audit_log by month on created_at.
+
+audit_log is append-only time-series data. Partitioned by month, old months
+can be detached and archived without a rewrite or VACUUM FULL, and queries
+on recent activity only touch the newest partitions. Because the partition
+key must be part of every unique constraint, the primary key becomes
+(id, created_at).
+
+The table is rebuilt: the existing one is renamed, the partitioned table is
+created with a partition for every month that already has rows, the rows
+are copied over and the old table is dropped. audit_log is locked for the
+duration of the copy.
+
+The indexes are created as the audit endpoints use them:
+ix_audit_log_tenant_created_at serves the tenant activity feed (and
+tenant_id-only lookups, so there is no separate ix_audit_log_tenant_id),
+ix_audit_log_created_at is a BRIN over created_at for time windows, and
+the JSONB details get jsonb_path_ops GIN indexes for containment lookups.
+
+Partitions ahead of time are created by the
+create_audit_log_partitions(months_ahead) function, which adds any missing
+month from the current one through months_ahead months ahead. The worker's
+maintain_audit_log_partitions cron task calls it daily. audit_log_default
+catches rows for any month that has no partition yet, so writes do not fail
+if the task stops running; when the function later creates that month, it
+moves those rows out of audit_log_default into the new partition.
+
+Revision ID: partition_audit_log
+Revises: add_contact_sort_indexes
+Create Date: 2025-12-07 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from app.core.migrations import execute_script
+
+# revision identifiers, used by Alembic.
+revision: str = "partition_audit_log"
+down_revision: Union[str, None] = "add_contact_sort_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+AUDIT_LOG_COLUMNS = """
+    id, tenant_id, entity_type, entity_id, entity_name, action, description,
+    user_id, user_email, user_name, ip_address, user_agent, changes,
+    extra_data, created_at, updated_at
+"""
+
+
+def upgrade() -> None:
+    execute_script(f"""
+        -- Free the table, primary key and index names for the new table
+        ALTER TABLE audit_log RENAME TO audit_log_unpartitioned;
+        ALTER TABLE audit_log_unpartitioned RENAME CONSTRAINT audit_log_pkey TO audit_log_unpartitioned_pkey;
+        DROP INDEX ix_audit_log_tenant_id;
+        DROP INDEX ix_audit_log_entity_type;
+        DROP INDEX ix_audit_log_entity_id;
+        DROP INDEX ix_audit_log_action;
+        DROP INDEX ix_audit_log_user_id;
+        DROP INDEX ix_audit_log_entity;
+        DROP INDEX ix_audit_log_created_at;
+
+        CREATE TABLE audit_log (
+            id UUID NOT NULL,
+            tenant_id UUID NOT NULL REFERENCES tenant (id),
+
+            -- What changed
+            entity_type VARCHAR NOT NULL,
+            entity_id UUID,
+            entity_name VARCHAR,
+
+            -- What happened
+            action VARCHAR NOT NULL,
+            description TEXT NOT NULL,
+
+            -- Who did it
+            user_id UUID REFERENCES "user" (id),
+            user_email VARCHAR,
+            user_name VARCHAR,
+
+            -- Context
+            ip_address VARCHAR,
+            user_agent VARCHAR,
+
+            -- Change details
+            changes JSONB,
+            extra_data JSONB,
+
+            -- Timestamps
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at);
+
+        CREATE INDEX ix_audit_log_entity_type ON audit_log (entity_type);
+        CREATE INDEX ix_audit_log_entity_id ON audit_log (entity_id);
+        CREATE INDEX ix_audit_log_action ON audit_log (action);
+        CREATE INDEX ix_audit_log_user_id ON audit_log (user_id);
+
+        -- Composite index for efficient entity-specific queries
+        CREATE INDEX ix_audit_log_entity ON audit_log (tenant_id, entity_type, entity_id);
+
+        -- Tenant activity feed (newest first); also serves tenant_id-only lookups
+        CREATE INDEX ix_audit_log_tenant_created_at ON audit_log (tenant_id, created_at);
+
+        -- created_at follows insertion order, so a BRIN index answers time-window
+        -- queries at a tiny fraction of a B-tree's size and insert cost; a small
+        -- pages_per_range keeps short windows selective
+        CREATE INDEX ix_audit_log_created_at ON audit_log USING BRIN (created_at)
+            WITH (pages_per_range = 32);
+
+        -- Containment (@>) lookups into the JSONB details, e.g. entries whose
+        -- changes touched a given field. jsonb_path_ops indexes are smaller and
+        -- faster than the default opclass but only support @> (not ?, ?|, ?&);
+        -- switch to the default opclass if key-existence queries are needed.
+        CREATE INDEX ix_audit_log_changes_gin ON audit_log USING GIN (changes jsonb_path_ops);
+        CREATE INDEX ix_audit_log_extra_data_gin ON audit_log USING GIN (extra_data jsonb_path_ops);
+
+        CREATE TABLE audit_log_default PARTITION OF audit_log DEFAULT;
+
+        CREATE FUNCTION create_audit_log_partitions(months_ahead integer DEFAULT 3)
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            -- created_at holds naive UTC timestamps
+            first_month timestamp := date_trunc('month', timezone('UTC', now()));
+            month_start timestamp;
+            month_end timestamp;
+            partition_name text;
+        BEGIN
+            FOR i IN 0..months_ahead LOOP
+                month_start := first_month + make_interval(months => i);
+                month_end := month_start + interval '1 month';
+                partition_name := 'audit_log_' || to_char(month_start, 'YYYY_MM');
+
+                IF to_regclass(partition_name) IS NOT NULL THEN
+                    CONTINUE;
+                END IF;
+
+                -- Rows for this month may already sit in audit_log_default,
+                -- which would make CREATE ... PARTITION OF fail. Build the
+                -- partition as a plain table, move those rows into it and
+                -- then attach it.
+                EXECUTE format(
+                    'CREATE TABLE %I (LIKE audit_log INCLUDING DEFAULTS)',
+                    partition_name
+                );
+                EXECUTE format(
+                    'WITH moved AS (
+                        DELETE FROM audit_log_default
+                        WHERE created_at >= %L AND created_at < %L
+                        RETURNING *
+                    )
+                    INSERT INTO %I SELECT * FROM moved',
+                    month_start,
+                    month_end,
+                    partition_name
+                );
+                EXECUTE format(
+                    'ALTER TABLE audit_log ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                    partition_name,
+                    month_start,
+                    month_end
+                );
+            END LOOP;
+        END;
+        $$;
+
+        -- One partition for every month that already has rows
+        DO $$
+        DECLARE
+            month_start timestamp;
+        BEGIN
+            FOR month_start IN
+                SELECT DISTINCT date_trunc('month', created_at) FROM audit_log_unpartitioned
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF audit_log FOR VALUES FROM (%L) TO (%L)',
+                    'audit_log_' || to_char(month_start, 'YYYY_MM'),
+                    month_start,
+                    month_start + interval '1 month'
+                );
+            END LOOP;
+        END;
+        $$;
+
+        SELECT create_audit_log_partitions(3);
+
+        INSERT INTO audit_log ({AUDIT_LOG_COLUMNS})
+        SELECT {AUDIT_LOG_COLUMNS} FROM audit_log_unpartitioned;
+
+        DROP TABLE audit_log_unpartitioned;
+    """)
+
+
+def downgrade() -> None:
+    execute_script(f"""
+        CREATE TABLE audit_log_unpartitioned (
+            id UUID NOT NULL,
+            tenant_id UUID NOT NULL,
+            entity_type VARCHAR NOT NULL,
+            entity_id UUID,
+            entity_name VARCHAR,
+            action VARCHAR NOT NULL,
+            description TEXT NOT NULL,
+            user_id UUID,
+            user_email VARCHAR,
+            user_name VARCHAR,
+            ip_address VARCHAR,
+            user_agent VARCHAR,
+            changes JSONB,
+            extra_data JSONB,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now()
+        );
+
+        INSERT INTO audit_log_unpartitioned ({AUDIT_LOG_COLUMNS})
+        SELECT {AUDIT_LOG_COLUMNS} FROM audit_log;
+
+        DROP TABLE audit_log;
+        DROP FUNCTION create_audit_log_partitions(integer);
+
+        ALTER TABLE audit_log_unpartitioned RENAME TO audit_log;
+        ALTER TABLE audit_log
+            ADD CONSTRAINT audit_log_pkey PRIMARY KEY (id),
+            ADD CONSTRAINT audit_log_tenant_id_fkey FOREIGN KEY (tenant_id) REFERENCES tenant (id),
+            ADD CONSTRAINT audit_log_user_id_fkey FOREIGN KEY (user_id) REFERENCES "user" (id);
+
+        CREATE INDEX ix_audit_log_tenant_id ON audit_log (tenant_id);
+        CREATE INDEX ix_audit_log_entity_type ON audit_log (entity_type);
+        CREATE INDEX ix_audit_log_entity_id ON audit_log (entity_id);
+        CREATE INDEX ix_audit_log_action ON audit_log (action);
+        CREATE INDEX ix_audit_log_user_id ON audit_log (user_id);
+        CREATE INDEX ix_audit_log_entity ON audit_log (tenant_id, entity_type, entity_id);
+        CREATE INDEX ix_audit_log_created_at ON audit_log (tenant_id, created_at);
+    """)
@@ -0,0 +1,61 @@
+"""Store contact.dominant_tones as JSONB.
+
+dominant_tones becomes JSONB like analysis.tones, so both columns use the
+same jsonb_path_ops GIN index and @> containment queries. The contacts
+list tone filter keeps using .contains([tone]), which renders as
+@> '["tone"]' on JSONB.
+
+Changing the column type rewrites contact under an ACCESS EXCLUSIVE lock.
+The GIN index is built CONCURRENTLY afterwards, outside the transaction.
+
+Revision ID: contact_dominant_tones_jsonb
+Revises: partition_audit_log
+Create Date: 2025-12-07 01:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from app.core.migrations import execute_script
+
+# revision identifiers, used by Alembic.
+revision: str = "contact_dominant_tones_jsonb"
+down_revision: Union[str, None] = "partition_audit_log"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    execute_script("""
+        ALTER TABLE contact
+            ALTER COLUMN dominant_tones DROP DEFAULT,
+            ALTER COLUMN dominant_tones TYPE jsonb USING to_jsonb(dominant_tones),
+            ALTER COLUMN dominant_tones SET DEFAULT '[]'::jsonb
+    """)
+
+    with op.get_context().autocommit_block():
+        execute_script(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contact_dominant_tones ON contact USING GIN (dominant_tones jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        execute_script("DROP INDEX CONCURRENTLY IF EXISTS idx_contact_dominant_tones")
+
+    # USING cannot contain a subquery, so the array is unpacked by a
+    # session-local helper function
+    execute_script("""
+        CREATE FUNCTION pg_temp.jsonb_to_varchar_array(value jsonb)
+        RETURNS varchar[]
+        LANGUAGE sql IMMUTABLE STRICT
+        AS $$ SELECT array(SELECT jsonb_array_elements_text(value)) $$;
+
+        ALTER TABLE contact
+            ALTER COLUMN dominant_tones DROP DEFAULT,
+            ALTER COLUMN dominant_tones TYPE varchar[] USING pg_temp.jsonb_to_varchar_array(dominant_tones),
+            ALTER COLUMN dominant_tones SET DEFAULT '{}';
+
+        DROP FUNCTION pg_temp.jsonb_to_varchar_array(jsonb);
+    """)
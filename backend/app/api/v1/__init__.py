@@ -1,56 +1,56 @@
-"""API v1 router aggregation."""
+"""API v1 router aggregation.
+
+Submodules are imported by build_router(), not at package import, so
+importing a single module such as app.api.v1.deps does not load and
+construct every endpoint.
+"""
+
+from functools import lru_cache
+from importlib import import_module
 
 from fastapi import APIRouter
 
-from app.api.v1 import (
-    analytics,
-    api_keys,
-    audit,
-    auth,
-    campaign_recommendations,
-    campaigns,
-    categories,
-    contacts,
-    custom_fields,
-    email_templates,
-    email_webhooks,
-    forms,
-    health,
-    lov,
-    messages,
-    roles,
-    suppressions,
-    tenants,
-    users,
-    voter_import,
-    workflows,
+# (module, prefix, tags) for each v1 router, in inclusion order. A None
+# prefix or tags means the module's router sets its own.
+ROUTERS: tuple[tuple[str, str | None, list[str] | None], ...] = (
+    ("health", "/health", ["Health"]),
+    ("auth", "/auth", ["Authentication"]),
+    ("tenants", "/tenants", ["Tenants"]),
+    ("messages", "/messages", ["Messages"]),
+    ("categories", "/categories", ["Categories"]),
+    ("contacts", "/contacts", ["Contacts"]),
+    ("custom_fields", "/custom-fields", ["Custom Fields"]),
+    ("campaigns", "/campaigns", ["Campaigns"]),
+    ("workflows", "/workflows", ["Workflows"]),
+    ("forms", "/forms", ["Forms"]),
+    ("analytics", "/analytics", ["Analytics"]),
+    ("roles", "/roles", ["Roles"]),
+    ("users", "/users", ["Users"]),
+    ("api_keys", "/api-keys", ["API Keys"]),
+    ("email_templates", "/email", ["Email Templates"]),
+    ("lov", "/lov", ["List of Values"]),
+    ("voter_import", "/voter-import", ["Voter Import"]),
+    ("audit", None, None),
+    ("suppressions", "/suppressions", ["Email Suppressions"]),
+    ("campaign_recommendations", "/campaign-recommendations", ["Campaign Recommendations"]),
+    ("email_webhooks", None, ["Email Webhooks"]),
 )
 
-router = APIRouter()
 
-# Include all v1 routers
-router.include_router(health.router, prefix="/health", tags=["Health"])
-router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
-router.include_router(tenants.router, prefix="/tenants", tags=["Tenants"])
-router.include_router(messages.router, prefix="/messages", tags=["Messages"])
-router.include_router(categories.router, prefix="/categories", tags=["Categories"])
-router.include_router(contacts.router, prefix="/contacts", tags=["Contacts"])
-router.include_router(custom_fields.router, prefix="/custom-fields", tags=["Custom Fields"])
-router.include_router(campaigns.router, prefix="/campaigns", tags=["Campaigns"])
-router.include_router(workflows.router, prefix="/workflows", tags=["Workflows"])
-router.include_router(forms.router, prefix="/forms", tags=["Forms"])
-router.include_router(analytics.router, prefix="/analytics", tags=["Analytics"])
-router.include_router(roles.router, prefix="/roles", tags=["Roles"])
-router.include_router(users.router, prefix="/users", tags=["Users"])
-router.include_router(api_keys.router, prefix="/api-keys", tags=["API Keys"])
-router.include_router(email_templates.router, prefix="/email", tags=["Email Templates"])
-router.include_router(lov.router, prefix="/lov", tags=["List of Values"])
-router.include_router(voter_import.router, prefix="/voter-import", tags=["Voter Import"])
-router.include_router(audit.router)
-router.include_router(suppressions.router, prefix="/suppressions", tags=["Email Suppressions"])
-router.include_router(
-    campaign_recommendations.router,
-    prefix="/campaign-recommendations",
-    tags=["Campaign Recommendations"],
-)
-router.include_router(email_webhooks.router, tags=["Email Webhooks"])
+@lru_cache(maxsize=1)
+def build_router() -> APIRouter:
+    """Import every v1 module and combine their routers.
+
+    Cached, so callers that build several apps (e.g. test fixtures) share
+    one router instead of re-importing and re-including each time.
+    """
+    router = APIRouter()
+    for module_name, prefix, tags in ROUTERS:
+        module = import_module(f"app.api.v1.{module_name}")
+        options = {}
+        if prefix is not None:
+            options["prefix"] = prefix
+        if tags is not None:
+            options["tags"] = tags
+        router.include_router(module.router, **options)
+    return router
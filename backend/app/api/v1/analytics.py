@@ -1,51 +1,89 @@
 """Analytics and reporting endpoints."""
 
+import base64
+import calendar
+import csv
+import io
+import json
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy import DateTime, Float, Integer, String, bindparam, column, or_, table, tuple_, union_all
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select, func
 
-from app.core.database import get_session
-from app.api.v1.deps import AuthContext, PermissionChecker, ScopeChecker
+from app.core.cache import ResultCache
+from app.core.database import read_session_maker
+from app.api.v1.deps import AuthContext, PermissionChecker, ScopeChecker, get_read_session
+from app.schemas.base import APIModel
 from app.models.user import User, Permissions
-from app.models.message import Message
+from app.models.message import Message, MessageHourlyRollup
 from app.models.analysis import Analysis
 from app.models.contact import Contact
 from app.models.category import Category, MessageCategory
-from app.models.campaign import Campaign
+from app.models.tenant import Tenant
 
 router = APIRouter()
 
-
-class DateRangeParams(BaseModel):
+# Per-tenant dashboard figures, maintained as a materialized view by
+# migration add_tenant_dashboard_summary and refreshed by the worker
+tenant_dashboard_summary = table(
+    "tenant_dashboard_summary",
+    column("tenant_id", PG_UUID(as_uuid=True)),
+    column("total_messages", Integer),
+    column("messages_today", Integer),
+    column("messages_this_week", Integer),
+    column("pending_messages", Integer),
+    column("avg_sentiment", Float),
+    column("sentiment_distribution", JSONB),
+    column("top_categories", JSONB),
+)
+
+# The trend and breakdown aggregations below scan a tenant's messages, which change on human
+# timescales, and dashboards poll them. Serve repeats from memory for a
+# minute, then refresh in the background for up to five more.
+analytics_cache = ResultCache(ttl=60, stale_ttl=360, max_entries=1024)
+
+# The endpoint queries below are built once, with bindparam() placeholders,
+# and executed with per-request values. Building a select() and computing
+# its cache key took longer than the round trip for small tenants; a
+# prebuilt statement memoizes its cache key, so SQLAlchemy goes straight
+# to the compiled SQL. Queries whose shape depends on the request are
+# built once per shape through lru_cache.
+
+
+class DateRangeParams(APIModel):
     """Common date range parameters."""
 
     start_date: datetime
     end_date: datetime
 
 
-class SentimentTrendPoint(BaseModel):
-    """Single point in sentiment trend."""
+class SentimentTrendSeries(APIModel):
+    """Sentiment trend as parallel arrays, one entry per period."""
 
-    date: str
-    avg_sentiment: float
-    message_count: int
+    dates: list[int]  # Period start, unix seconds (UTC)
+    avg_sentiment: list[float]
+    message_count: list[int]
 
 
-class SentimentTrendResponse(BaseModel):
+class SentimentTrendResponse(APIModel):
     """Sentiment trend over time."""
 
-    data: list[SentimentTrendPoint]
+    data: SentimentTrendSeries
     period: str
     total_messages: int
     avg_sentiment: float
 
 
-class VolumePoint(BaseModel):
+class VolumePoint(APIModel):
     """Single point in volume trend."""
 
     date: str
@@ -53,7 +91,7 @@ class VolumePoint(BaseModel):
     by_source: dict[str, int] | None = None
 
 
-class VolumeResponse(BaseModel):
+class VolumeResponse(APIModel):
     """Message volume over time."""
 
     data: list[VolumePoint]
@@ -61,7 +99,7 @@ class VolumeResponse(BaseModel):
     total: int
 
 
-class CategoryBreakdown(BaseModel):
+class CategoryBreakdown(APIModel):
     """Category statistics."""
 
     category_id: UUID
@@ -71,7 +109,7 @@ class CategoryBreakdown(BaseModel):
     avg_sentiment: float | None
 
 
-class CategoryBreakdownResponse(BaseModel):
+class CategoryBreakdownResponse(APIModel):
     """Category distribution."""
 
     data: list[CategoryBreakdown]
@@ -79,25 +117,26 @@ class CategoryBreakdownResponse(BaseModel):
     total_uncategorized: int
 
 
-class TopContact(BaseModel):
+class TopContact(APIModel):
     """Top contact entry."""
 
     contact_id: UUID
-    email: str
+    email: str | None
     name: str | None
     message_count: int
     avg_sentiment: float | None
     last_contact_at: datetime | None
 
 
-class TopContactsResponse(BaseModel):
+class TopContactsResponse(APIModel):
     """Top contacts by volume or sentiment."""
 
     data: list[TopContact]
     sort_by: str
+    next_cursor: str | None = None  # Pass as cursor to fetch the next page
 
 
-class DashboardSummary(BaseModel):
+class DashboardSummary(APIModel):
     """Dashboard summary statistics."""
 
     total_messages: int
@@ -110,7 +149,7 @@ class DashboardSummary(BaseModel):
     pending_messages: int
 
 
-class ExportRequest(BaseModel):
+class ExportRequest(APIModel):
     """Request for data export."""
 
     dataset: str  # messages, contacts, analytics
@@ -119,105 +158,212 @@ class ExportRequest(BaseModel):
     columns: list[str] | None = None
 
 
+async def _cached(
+    key: tuple,
+    session: AsyncSession,
+    compute: Callable[[AsyncSession], Awaitable[BaseModel]],
+) -> BaseModel:
+    """Serve compute(session) from analytics_cache.
+
+    The request session is closed once the response is sent, so background
+    refreshes run compute on a session of their own.
+    """
+
+    async def refresh() -> BaseModel:
+        async with read_session_maker() as refresh_session:
+            return await compute(refresh_session)
+
+    return await analytics_cache.get_or_load(key, lambda: compute(session), refresh)
+
+
 # =============================================================================
 # Analytics Endpoints
 # =============================================================================
 
 
+# Maintained by a trigger on campaign
+ACTIVE_CAMPAIGNS_STMT = select(Tenant.active_campaign_count).where(
+    Tenant.id == bindparam("tenant_id")
+)
+
+# The campaign count rides along as a scalar subquery, so the dashboard is
+# a single round trip for any tenant that has a summary row
+DASHBOARD_SUMMARY_STMT = select(
+    tenant_dashboard_summary,
+    ACTIVE_CAMPAIGNS_STMT.scalar_subquery().label("active_campaigns"),
+).where(tenant_dashboard_summary.c.tenant_id == bindparam("tenant_id"))
+
+
 @router.get("/dashboard", response_model=DashboardSummary)
 async def get_dashboard_summary(
     current_user: User = Depends(PermissionChecker(Permissions.ANALYTICS_READ)),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> DashboardSummary:
-    """Get dashboard summary statistics."""
-    tenant_id = current_user.tenant_id
-    now = datetime.utcnow()
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    week_start = today_start - timedelta(days=today_start.weekday())
+    """
+    Get dashboard summary statistics.
 
-    # Total messages
-    total_result = await session.execute(
-        select(func.count()).where(Message.tenant_id == tenant_id)
-    )
-    total_messages = total_result.scalar() or 0
+    Message, sentiment and category figures come from the
+    tenant_dashboard_summary materialized view, refreshed every five
+    minutes by the worker, so they can lag new messages by a few minutes.
+    """
+    tenant_id = current_user.tenant_id
 
-    # Messages today
-    today_result = await session.execute(
-        select(func.count()).where(
-            Message.tenant_id == tenant_id,
-            Message.received_at >= today_start,
+    summary_result = await session.execute(DASHBOARD_SUMMARY_STMT, {"tenant_id": tenant_id})
+    summary = summary_result.first()
+
+    # Tenants with no messages yet have no row in the view
+    if summary is None:
+        campaigns_result = await session.execute(ACTIVE_CAMPAIGNS_STMT, {"tenant_id": tenant_id})
+        active_campaigns = campaigns_result.scalar() or 0
+        return DashboardSummary(
+            total_messages=0,
+            messages_today=0,
+            messages_this_week=0,
+            avg_sentiment=None,
+            sentiment_distribution={},
+            top_categories=[],
+            active_campaigns=active_campaigns,
+            pending_messages=0,
         )
-    )
-    messages_today = today_result.scalar() or 0
 
-    # Messages this week
-    week_result = await session.execute(
-        select(func.count()).where(
-            Message.tenant_id == tenant_id,
-            Message.received_at >= week_start,
-        )
+    return DashboardSummary(
+        total_messages=summary.total_messages,
+        messages_today=summary.messages_today,
+        messages_this_week=summary.messages_this_week,
+        avg_sentiment=float(summary.avg_sentiment) if summary.avg_sentiment else None,
+        sentiment_distribution=summary.sentiment_distribution,
+        top_categories=summary.top_categories,
+        active_campaigns=summary.active_campaigns,
+        pending_messages=summary.pending_messages,
     )
-    messages_this_week = week_result.scalar() or 0
 
-    # Average sentiment
-    avg_sentiment_result = await session.execute(
-        select(func.avg(Analysis.sentiment_score))
-        .join(Message, Message.id == Analysis.message_id)
-        .where(Message.tenant_id == tenant_id)
+
+def _period_bucket(timestamp=Message.received_at):
+    """date_trunc(:granularity, timestamp), labelled "date".
+
+    Buckets in SQL so the result has one row per period. Each query uses a
+    single bucket expression, so granularity is bound once and PostgreSQL
+    sees the same date_trunc() in SELECT and GROUP BY.
+    """
+    return func.date_trunc(bindparam("granularity", type_=String), timestamp).label("date")
+
+
+def _rollup_bounds(start_date: datetime, end_date: datetime) -> dict[str, datetime]:
+    """The whole hours within [start_date, end_date], as _hourly_totals() params."""
+    rollup_start = start_date.replace(minute=0, second=0, microsecond=0)
+    if rollup_start < start_date:
+        rollup_start += timedelta(hours=1)
+    return {
+        "rollup_start": rollup_start,
+        "rollup_end": end_date.replace(minute=0, second=0, microsecond=0),
+    }
+
+
+def _hourly_totals():
+    """Per-hour, per-source message totals for :tenant_id from :start_date to :end_date.
+
+    Whole hours between :rollup_start and :rollup_end that the tenant's
+    message_hourly_rollup rows reach are read from the rollup. The partial
+    hours at either end, and hours the rollup has not reached yet, are
+    aggregated from message. Each part is a separate index range scan.
+    """
+    rollup = MessageHourlyRollup
+    rolled_through = (
+        select(func.max(rollup.hour) + timedelta(hours=1))
+        .where(rollup.tenant_id == bindparam("tenant_id"))
+        .scalar_subquery()
     )
-    avg_sentiment = avg_sentiment_result.scalar()
-
-    # Sentiment distribution
-    sentiment_dist_result = await session.execute(
-        select(Analysis.sentiment_label, func.count())
-        .join(Message, Message.id == Analysis.message_id)
-        .where(Message.tenant_id == tenant_id)
-        .group_by(Analysis.sentiment_label)
+    rollup_start = bindparam("rollup_start", type_=DateTime)
+    rollup_end = func.greatest(
+        rollup_start,
+        func.least(bindparam("rollup_end", type_=DateTime), func.coalesce(rolled_through, rollup_start)),
     )
-    sentiment_distribution = {row[0]: row[1] for row in sentiment_dist_result.all()}
-
-    # Top categories (top 5)
-    top_categories_result = await session.execute(
-        select(Category.id, Category.name, Category.color, func.count(MessageCategory.message_id))
-        .join(MessageCategory, MessageCategory.category_id == Category.id)
-        .join(Message, Message.id == MessageCategory.message_id)
-        .where(Message.tenant_id == tenant_id)
-        .group_by(Category.id, Category.name, Category.color)
-        .order_by(func.count(MessageCategory.message_id).desc())
-        .limit(5)
+
+    from_rollup = select(
+        rollup.hour,
+        rollup.source,
+        rollup.message_count,
+        rollup.analyzed_count,
+        rollup.sentiment_sum,
+        rollup.sentiment_count,
+    ).where(
+        rollup.tenant_id == bindparam("tenant_id"),
+        rollup.hour >= rollup_start,
+        rollup.hour < rollup_end,
     )
-    top_categories = [
-        {"id": str(row[0]), "name": row[1], "color": row[2], "count": row[3]}
-        for row in top_categories_result.all()
-    ]
 
-    # Active campaigns
-    campaigns_result = await session.execute(
-        select(func.count()).where(
-            Campaign.tenant_id == tenant_id,
-            Campaign.status == "detected",
+    def from_messages(*received_at_range):
+        hour = func.date_trunc("hour", Message.received_at)
+        return (
+            select(
+                hour.label("hour"),
+                Message.source,
+                func.count(Message.id).cast(Integer).label("message_count"),
+                func.count(Analysis.message_id).cast(Integer).label("analyzed_count"),
+                func.coalesce(func.sum(Analysis.sentiment_score), 0.0).label("sentiment_sum"),
+                func.count(Analysis.sentiment_score).cast(Integer).label("sentiment_count"),
+            )
+            .outerjoin(Analysis, Analysis.message_id == Message.id)
+            .where(
+                Message.tenant_id == bindparam("tenant_id"),
+                Message.received_at >= bindparam("start_date"),
+                Message.received_at <= bindparam("end_date"),
+                *received_at_range,
+            )
+            .group_by(hour, Message.source)
         )
-    )
-    active_campaigns = campaigns_result.scalar() or 0
 
-    # Pending messages
-    pending_result = await session.execute(
-        select(func.count()).where(
-            Message.tenant_id == tenant_id,
-            Message.processing_status == "pending",
+    return union_all(
+        from_messages(Message.received_at < rollup_start),
+        from_rollup,
+        from_messages(Message.received_at >= rollup_end),
+    ).subquery("hourly")
+
+
+@lru_cache
+def _sentiment_trend_stmt(by_category: bool):
+    """Sentiment trend query, optionally restricted to :category_id.
+
+    Category assignments carry no timestamps for the rollup refresh to
+    follow, so the per-category trend is aggregated from message.
+    """
+    if not by_category:
+        hourly = _hourly_totals()
+        bucket = _period_bucket(hourly.c.hour)
+        analyzed = func.sum(hourly.c.analyzed_count)
+        return (
+            select(
+                bucket,
+                (func.sum(hourly.c.sentiment_sum) / func.nullif(func.sum(hourly.c.sentiment_count), 0)).label(
+                    "avg_sentiment"
+                ),
+                analyzed.label("message_count"),
+            )
+            .group_by(bucket)
+            # Periods without analyzed messages are left out, as before
+            .having(analyzed > 0)
+            .order_by(bucket)
         )
+
+    bucket = _period_bucket()
+    query = (
+        select(
+            bucket,
+            func.avg(Analysis.sentiment_score).label("avg_sentiment"),
+            func.count(Message.id).label("message_count"),
+        )
+        .join(Analysis, Analysis.message_id == Message.id)
+        .where(
+            Message.tenant_id == bindparam("tenant_id"),
+            Message.received_at >= bindparam("start_date"),
+            Message.received_at <= bindparam("end_date"),
+        )
+        .group_by(bucket)
+        .order_by(bucket)
     )
-    pending_messages = pending_result.scalar() or 0
 
-    return DashboardSummary(
-        total_messages=total_messages,
-        messages_today=messages_today,
-        messages_this_week=messages_this_week,
-        avg_sentiment=float(avg_sentiment) if avg_sentiment else None,
-        sentiment_distribution=sentiment_distribution,
-        top_categories=top_categories,
-        active_campaigns=active_campaigns,
-        pending_messages=pending_messages,
+    return query.join(MessageCategory, MessageCategory.message_id == Message.id).where(
+        MessageCategory.category_id == bindparam("category_id")
     )
 
 
@@ -228,66 +374,112 @@ async def get_sentiment_trend(
     granularity: str = Query("day", pattern="^(hour|day|week|month)$"),
     category_id: UUID | None = None,
     current_user: User = Depends(PermissionChecker(Permissions.ANALYTICS_READ)),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> SentimentTrendResponse:
     """
     Get sentiment trend over time.
 
-    Returns average sentiment score and message count per time period.
+    Returns average sentiment score and message count per time period, as
+    parallel arrays indexed by period.
     """
     tenant_id = current_user.tenant_id
-
-    # Build query
-    query = (
-        select(
-            func.date_trunc(granularity, Message.received_at).label("date"),
-            func.avg(Analysis.sentiment_score).label("avg_sentiment"),
-            func.count(Message.id).label("message_count"),
-        )
-        .join(Analysis, Analysis.message_id == Message.id)
-        .where(
-            Message.tenant_id == tenant_id,
-            Message.received_at >= start_date,
-            Message.received_at <= end_date,
-        )
-        .group_by(func.date_trunc(granularity, Message.received_at))
-        .order_by(func.date_trunc(granularity, Message.received_at))
+    return await _cached(
+        ("sentiment", tenant_id, start_date, end_date, granularity, category_id),
+        session,
+        lambda s: _sentiment_trend(s, tenant_id, start_date, end_date, granularity, category_id),
     )
 
-    # Filter by category if specified
+
+async def _sentiment_trend(
+    session: AsyncSession,
+    tenant_id: UUID,
+    start_date: datetime,
+    end_date: datetime,
+    granularity: str,
+    category_id: UUID | None,
+) -> SentimentTrendResponse:
+    params = {
+        "tenant_id": tenant_id,
+        "start_date": start_date,
+        "end_date": end_date,
+        "granularity": granularity,
+    }
     if category_id:
-        query = query.join(MessageCategory, MessageCategory.message_id == Message.id).where(
-            MessageCategory.category_id == category_id
-        )
+        params["category_id"] = category_id
+    else:
+        params.update(_rollup_bounds(start_date, end_date))
 
-    result = await session.execute(query)
+    result = await session.execute(_sentiment_trend_stmt(by_category=bool(category_id)), params)
     rows = result.all()
 
-    data = []
+    dates: list[int] = []
+    avg_sentiment: list[float] = []
+    message_count: list[int] = []
     total_messages = 0
     sentiment_sum = 0
 
-    for row in rows:
-        point = SentimentTrendPoint(
-            date=row.date.strftime("%Y-%m-%d") if row.date else "",
-            avg_sentiment=float(row.avg_sentiment) if row.avg_sentiment else 0,
-            message_count=row.message_count or 0,
-        )
-        data.append(point)
-        total_messages += row.message_count or 0
-        if row.avg_sentiment:
-            sentiment_sum += row.avg_sentiment * row.message_count
+    # Columns rather than one object per period: the keys are not repeated
+    # on the wire and validation checks three flat lists. received_at is
+    # stored as naive UTC, so buckets convert with timegm, not timestamp().
+    for bucket, avg, count in rows:
+        dates.append(calendar.timegm(bucket.timetuple()))
+        avg_sentiment.append(float(avg) if avg else 0)
+        message_count.append(count or 0)
+        total_messages += count or 0
+        if avg:
+            sentiment_sum += avg * count
 
     overall_avg = sentiment_sum / total_messages if total_messages > 0 else 0
 
     return SentimentTrendResponse(
-        data=data,
+        data=SentimentTrendSeries(
+            dates=dates,
+            avg_sentiment=avg_sentiment,
+            message_count=message_count,
+        ),
         period=granularity,
         total_messages=total_messages,
         avg_sentiment=overall_avg,
     )
 
 
+@lru_cache
+def _message_volume_stmt(by_source: bool):
+    """Message volume query, optionally broken down by source.
+
+    With by_source, each row is one date with its total and a
+    {source: count} object, both aggregated in the query.
+    """
+    hourly = _hourly_totals()
+    bucket = _period_bucket(hourly.c.hour)
+    # The response carries the bucket as YYYY-MM-DD; to_char formats it in
+    # the query rather than strftime per row
+    date = func.to_char(bucket.element, "YYYY-MM-DD").label("date")
+    if not by_source:
+        return (
+            select(date, func.sum(hourly.c.message_count).label("count"))
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+
+    # Grouped on the formatted date, so hourly buckets of one day add up
+    # into that day's by_source the same way they do into its count
+    per_source = (
+        select(date, hourly.c.source, func.sum(hourly.c.message_count).label("count"))
+        .group_by(date, hourly.c.source)
+        .subquery("per_source")
+    )
+    return (
+        select(
+            per_source.c.date,
+            func.sum(per_source.c.count).cast(Integer).label("count"),
+            func.jsonb_object_agg(per_source.c.source, per_source.c.count, type_=JSONB).label("by_source"),
+        )
+        .group_by(per_source.c.date)
+        .order_by(per_source.c.date)
+    )
+
+
 @router.get("/volume", response_model=VolumeResponse)
 async def get_message_volume(
     start_date: datetime = Query(...),
@@ -295,7 +487,7 @@ async def get_message_volume(
     granularity: str = Query("day", pattern="^(hour|day|week|month)$"),
     by_source: bool = Query(False, description="Break down by message source"),
     current_user: User = Depends(PermissionChecker(Permissions.ANALYTICS_READ)),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> VolumeResponse:
     """
     Get message volume over time.
@@ -303,69 +495,46 @@ async def get_message_volume(
     Returns message count per time period, optionally broken down by source.
     """
     tenant_id = current_user.tenant_id
+    return await _cached(
+        ("volume", tenant_id, start_date, end_date, granularity, by_source),
+        session,
+        lambda s: _message_volume(s, tenant_id, start_date, end_date, granularity, by_source),
+    )
 
-    if by_source:
-        # Query with source breakdown
-        query = (
-            select(
-                func.date_trunc(granularity, Message.received_at).label("date"),
-                Message.source,
-                func.count(Message.id).label("count"),
-            )
-            .where(
-                Message.tenant_id == tenant_id,
-                Message.received_at >= start_date,
-                Message.received_at <= end_date,
-            )
-            .group_by(func.date_trunc(granularity, Message.received_at), Message.source)
-            .order_by(func.date_trunc(granularity, Message.received_at))
-        )
 
-        result = await session.execute(query)
-        rows = result.all()
+async def _message_volume(
+    session: AsyncSession,
+    tenant_id: UUID,
+    start_date: datetime,
+    end_date: datetime,
+    granularity: str,
+    by_source: bool,
+) -> VolumeResponse:
+    params = {
+        "tenant_id": tenant_id,
+        "start_date": start_date,
+        "end_date": end_date,
+        "granularity": granularity,
+        **_rollup_bounds(start_date, end_date),
+    }
 
-        # Aggregate by date
-        date_data = {}
-        total = 0
-        for row in rows:
-            date_str = row.date.strftime("%Y-%m-%d") if row.date else ""
-            if date_str not in date_data:
-                date_data[date_str] = {"count": 0, "by_source": {}}
-            date_data[date_str]["count"] += row.count or 0
-            date_data[date_str]["by_source"][row.source] = row.count or 0
-            total += row.count or 0
+    if by_source:
+        result = await session.execute(_message_volume_stmt(by_source=True), params)
+        rows = result.all()
 
-        data = [
-            VolumePoint(date=date, count=info["count"], by_source=info["by_source"])
-            for date, info in sorted(date_data.items())
-        ]
+        data = [{"date": row.date or "", "count": row.count, "by_source": row.by_source} for row in rows]
+        total = sum(row.count for row in rows)
     else:
-        # Simple query without source breakdown
-        query = (
-            select(
-                func.date_trunc(granularity, Message.received_at).label("date"),
-                func.count(Message.id).label("count"),
-            )
-            .where(
-                Message.tenant_id == tenant_id,
-                Message.received_at >= start_date,
-                Message.received_at <= end_date,
-            )
-            .group_by(func.date_trunc(granularity, Message.received_at))
-            .order_by(func.date_trunc(granularity, Message.received_at))
-        )
-
-        result = await session.execute(query)
+        result = await session.execute(_message_volume_stmt(by_source=False), params)
         rows = result.all()
 
         data = []
         total = 0
         for row in rows:
-            point = VolumePoint(
-                date=row.date.strftime("%Y-%m-%d") if row.date else "",
-                count=row.count or 0,
-            )
-            data.append(point)
+            data.append({
+                "date": row.date or "",
+                "count": row.count or 0,
+            })
             total += row.count or 0
 
     return VolumeResponse(
@@ -375,12 +544,46 @@ async def get_message_volume(
     )
 
 
+@lru_cache
+def _category_breakdown_stmt(has_start: bool, has_end: bool):
+    """Per-category counts over an optional date range, plus the uncategorized count.
+
+    One pass over the tenant's messages left-joined to their categories;
+    messages with no category form the row whose category_id is NULL.
+    """
+    date_range = []
+    if has_start:
+        date_range.append(Message.received_at >= bindparam("start_date"))
+    if has_end:
+        date_range.append(Message.received_at <= bindparam("end_date"))
+
+    return (
+        select(
+            MessageCategory.category_id,
+            Category.name,
+            func.count(Message.id).label("count"),
+            func.avg(Analysis.sentiment_score).label("avg_sentiment"),
+        )
+        .select_from(Message)
+        .outerjoin(MessageCategory, MessageCategory.message_id == Message.id)
+        .outerjoin(Category, Category.id == MessageCategory.category_id)
+        .outerjoin(Analysis, Analysis.message_id == Message.id)
+        .where(
+            Message.tenant_id == bindparam("tenant_id"),
+            or_(MessageCategory.category_id == None, Category.tenant_id == bindparam("tenant_id")),
+            *date_range,
+        )
+        .group_by(MessageCategory.category_id, Category.name)
+        .order_by(func.count(Message.id).desc())
+    )
+
+
 @router.get("/categories", response_model=CategoryBreakdownResponse)
 async def get_category_breakdown(
     start_date: datetime | None = None,
     end_date: datetime | None = None,
     current_user: User = Depends(PermissionChecker(Permissions.ANALYTICS_READ)),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> CategoryBreakdownResponse:
     """
     Get message distribution across categories.
@@ -388,69 +591,51 @@ async def get_category_breakdown(
     Returns count and percentage for each category.
     """
     tenant_id = current_user.tenant_id
-
-    # Build base query for category counts
-    query = (
-        select(
-            Category.id,
-            Category.name,
-            func.count(MessageCategory.message_id).label("count"),
-            func.avg(Analysis.sentiment_score).label("avg_sentiment"),
-        )
-        .join(MessageCategory, MessageCategory.category_id == Category.id)
-        .join(Message, Message.id == MessageCategory.message_id)
-        .outerjoin(Analysis, Analysis.message_id == Message.id)
-        .where(
-            Category.tenant_id == tenant_id,
-            Message.tenant_id == tenant_id,
-        )
-        .group_by(Category.id, Category.name)
-        .order_by(func.count(MessageCategory.message_id).desc())
+    return await _cached(
+        ("categories", tenant_id, start_date, end_date),
+        session,
+        lambda s: _category_breakdown(s, tenant_id, start_date, end_date),
     )
 
-    # Apply date filters if provided
+
+async def _category_breakdown(
+    session: AsyncSession,
+    tenant_id: UUID,
+    start_date: datetime | None,
+    end_date: datetime | None,
+) -> CategoryBreakdownResponse:
+    params = {"tenant_id": tenant_id}
     if start_date:
-        query = query.where(Message.received_at >= start_date)
+        params["start_date"] = start_date
     if end_date:
-        query = query.where(Message.received_at <= end_date)
-
-    result = await session.execute(query)
-    rows = result.all()
+        params["end_date"] = end_date
 
-    # Calculate total categorized
-    total_categorized = sum(row.count for row in rows)
-
-    # Get total uncategorized (messages without any category)
-    uncategorized_base = (
-        select(func.count(Message.id))
-        .outerjoin(MessageCategory, MessageCategory.message_id == Message.id)
-        .where(
-            Message.tenant_id == tenant_id,
-            MessageCategory.message_id == None,
-        )
+    result = await session.execute(
+        _category_breakdown_stmt(has_start=start_date is not None, has_end=end_date is not None),
+        params,
     )
-    if start_date:
-        uncategorized_base = uncategorized_base.where(Message.received_at >= start_date)
-    if end_date:
-        uncategorized_base = uncategorized_base.where(Message.received_at <= end_date)
+    rows = []
+    total_uncategorized = 0
+    for row in result:
+        if row.category_id is None:
+            total_uncategorized = row.count
+        else:
+            rows.append(row)
 
-    uncategorized_result = await session.execute(uncategorized_base)
-    total_uncategorized = uncategorized_result.scalar() or 0
+    total_categorized = sum(row.count for row in rows)
 
     grand_total = total_categorized + total_uncategorized
 
     data = []
     for row in rows:
         percentage = (row.count / grand_total * 100) if grand_total > 0 else 0
-        data.append(
-            CategoryBreakdown(
-                category_id=row[0],
-                category_name=row[1],
-                count=row.count,
-                percentage=round(percentage, 1),
-                avg_sentiment=float(row.avg_sentiment) if row.avg_sentiment else None,
-            )
-        )
+        data.append({
+            "category_id": row[0],
+            "category_name": row[1],
+            "count": row.count,
+            "percentage": round(percentage, 1),
+            "avg_sentiment": float(row.avg_sentiment) if row.avg_sentiment else None,
+        })
 
     return CategoryBreakdownResponse(
         data=data,
@@ -459,58 +644,215 @@ async def get_category_breakdown(
     )
 
 
+def _top_contacts_sort_key(sort_by: str):
+    """Aggregate the top contacts list is ranked by."""
+    if sort_by == "avg_sentiment":
+        return func.avg(Analysis.sentiment_score)
+    if sort_by == "last_contact":
+        return func.max(Message.received_at)
+    return func.count(Message.id)
+
+
+@lru_cache
+def _top_contacts_stmt(
+    sort_by: str,
+    sentiment_filter: str | None,
+    has_start: bool,
+    has_end: bool,
+    has_cursor: bool,
+):
+    """Top contacts ranked by an aggregate over their messages.
+
+    One grouped query ordered by (sort key, contact id) with a LIMIT. Pages
+    continue from the previous page's last (sort key, id) rather than an
+    OFFSET, so later pages are as cheap as the first and stay stable while
+    new messages arrive.
+    """
+    avg_sentiment = func.avg(Analysis.sentiment_score)
+    sort_key = _top_contacts_sort_key(sort_by)
+
+    query = (
+        select(
+            Contact.id.label("contact_id"),
+            Contact.email,
+            Contact.name,
+            func.count(Message.id).label("message_count"),
+            avg_sentiment.label("avg_sentiment"),
+            func.max(Message.received_at).label("last_contact_at"),
+        )
+        .join(Message, Message.contact_id == Contact.id)
+        .outerjoin(Analysis, Analysis.message_id == Message.id)
+        .where(
+            Contact.tenant_id == bindparam("tenant_id"),
+            Message.tenant_id == bindparam("tenant_id"),
+        )
+        .group_by(Contact.id)
+    )
+
+    if has_start:
+        query = query.where(Message.received_at >= bindparam("start_date"))
+    if has_end:
+        query = query.where(Message.received_at <= bindparam("end_date"))
+
+    # Apply sentiment filter
+    if sentiment_filter == "positive":
+        query = query.having(avg_sentiment > 0.3)
+    elif sentiment_filter == "negative":
+        query = query.having(avg_sentiment < -0.3)
+    elif sentiment_filter == "neutral":
+        query = query.having(avg_sentiment.between(-0.3, 0.3))
+    elif sort_by == "avg_sentiment":
+        # Contacts with no analyzed messages have no sentiment to rank by
+        query = query.having(avg_sentiment.is_not(None))
+
+    if has_cursor:
+        query = query.having(
+            tuple_(sort_key, Contact.id)
+            < tuple_(
+                bindparam("after_value", type_=sort_key.type),
+                bindparam("after_id", type_=Contact.id.type),
+            )
+        )
+
+    return query.order_by(sort_key.desc(), Contact.id.desc()).limit(bindparam("limit"))
+
+
+def _encode_cursor(value, row_id: UUID) -> str:
+    """Opaque keyset cursor for the page after the row with this sort value and id."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([value, str(row_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str, parse_value: Callable[[Any], Any]) -> tuple:
+    """Inverse of _encode_cursor; raises ValueError if malformed."""
+    try:
+        value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return parse_value(value), UUID(row_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+# How each top contacts sort key is read back from a cursor
+TOP_CONTACTS_CURSOR_VALUES = {
+    "message_count": int,
+    "avg_sentiment": float,
+    "last_contact": datetime.fromisoformat,
+}
+
+
 @router.get("/contacts/top", response_model=TopContactsResponse)
 async def get_top_contacts(
     limit: int = Query(10, ge=1, le=100),
     sort_by: str = Query("message_count", pattern="^(message_count|avg_sentiment|last_contact)$"),
     sentiment_filter: str | None = Query(None, pattern="^(positive|neutral|negative)$"),
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
     current_user: User = Depends(PermissionChecker(Permissions.ANALYTICS_READ)),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> TopContactsResponse:
     """
     Get top contacts by volume or sentiment.
 
-    Useful for identifying most active or most positive/negative constituents.
+    Counts and average sentiment are computed from the contact's messages,
+    optionally within a received_at window. Useful for identifying most
+    active or most positive/negative constituents.
     """
-    tenant_id = current_user.tenant_id
+    after = None
+    if cursor:
+        try:
+            after = _decode_cursor(cursor, TOP_CONTACTS_CURSOR_VALUES[sort_by])
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
 
-    query = select(Contact).where(Contact.tenant_id == tenant_id)
+    tenant_id = current_user.tenant_id
+    return await _cached(
+        ("contacts_top", tenant_id, limit, sort_by, sentiment_filter, start_date, end_date, after),
+        session,
+        lambda s: _top_contacts(s, tenant_id, limit, sort_by, sentiment_filter, start_date, end_date, after),
+    )
 
-    # Apply sentiment filter
-    if sentiment_filter:
-        if sentiment_filter == "positive":
-            query = query.where(Contact.avg_sentiment > 0.3)
-        elif sentiment_filter == "negative":
-            query = query.where(Contact.avg_sentiment < -0.3)
-        elif sentiment_filter == "neutral":
-            query = query.where(Contact.avg_sentiment.between(-0.3, 0.3))
-
-    # Apply sorting
-    if sort_by == "message_count":
-        query = query.order_by(Contact.message_count.desc())
-    elif sort_by == "avg_sentiment":
-        query = query.order_by(Contact.avg_sentiment.desc())
-    elif sort_by == "last_contact":
-        query = query.order_by(Contact.last_contact_at.desc())
 
-    query = query.limit(limit)
+async def _top_contacts(
+    session: AsyncSession,
+    tenant_id: UUID,
+    limit: int,
+    sort_by: str,
+    sentiment_filter: str | None,
+    start_date: datetime | None,
+    end_date: datetime | None,
+    after: tuple | None,
+) -> TopContactsResponse:
+    params = {"tenant_id": tenant_id, "limit": limit}
+    if start_date:
+        params["start_date"] = start_date
+    if end_date:
+        params["end_date"] = end_date
+    if after:
+        params["after_value"], params["after_id"] = after
+
+    query = _top_contacts_stmt(
+        sort_by,
+        sentiment_filter,
+        has_start=start_date is not None,
+        has_end=end_date is not None,
+        has_cursor=after is not None,
+    )
+    result = await session.execute(query, params)
+    rows = result.all()
 
-    result = await session.execute(query)
-    contacts = result.scalars().all()
+    next_cursor = None
+    if len(rows) == limit:
+        last = rows[-1]
+        sort_value = {
+            "message_count": last.message_count,
+            "avg_sentiment": last.avg_sentiment,
+            "last_contact": last.last_contact_at,
+        }[sort_by]
+        next_cursor = _encode_cursor(sort_value, last.contact_id)
 
     return TopContactsResponse(
         data=[
-            TopContact(
-                contact_id=c.id,
-                email=c.email,
-                name=c.name,
-                message_count=c.message_count,
-                avg_sentiment=c.avg_sentiment,
-                last_contact_at=c.last_contact_at,
-            )
-            for c in contacts
+            {
+                "contact_id": row.contact_id,
+                "email": row.email,
+                "name": row.name,
+                "message_count": row.message_count,
+                "avg_sentiment": float(row.avg_sentiment) if row.avg_sentiment is not None else None,
+                "last_contact_at": row.last_contact_at,
+            }
+            for row in rows
         ],
         sort_by=sort_by,
+        next_cursor=next_cursor,
+    )
+
+
+@lru_cache
+def _campaign_comparison_stmt(has_start: bool, has_end: bool):
+    """Coordinated (campaign) and organic message counts and sentiment, in one pass."""
+    date_range = []
+    if has_start:
+        date_range.append(Message.received_at >= bindparam("start_date"))
+    if has_end:
+        date_range.append(Message.received_at <= bindparam("end_date"))
+
+    coordinated = Message.is_coordinated == True
+    organic = Message.is_coordinated == False
+    return (
+        select(
+            func.count(Message.id).filter(coordinated),
+            func.avg(Analysis.sentiment_score).filter(coordinated),
+            func.count(Message.id).filter(organic),
+            func.avg(Analysis.sentiment_score).filter(organic),
+        )
+        .outerjoin(Analysis, Analysis.message_id == Message.id)
+        .where(Message.tenant_id == bindparam("tenant_id"), *date_range)
     )
 
 
@@ -519,49 +861,26 @@ async def get_campaign_comparison(
     start_date: datetime | None = None,
     end_date: datetime | None = None,
     current_user: User = Depends(PermissionChecker(Permissions.ANALYTICS_READ)),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> dict:
     """
     Compare campaign messages vs organic messages.
 
     Returns counts and sentiment comparison between coordinated and organic messages.
     """
-    tenant_id = current_user.tenant_id
-
-    # Base query conditions
-    base_conditions = [Message.tenant_id == tenant_id]
+    params = {"tenant_id": current_user.tenant_id}
     if start_date:
-        base_conditions.append(Message.received_at >= start_date)
+        params["start_date"] = start_date
     if end_date:
-        base_conditions.append(Message.received_at <= end_date)
-
-    # Count campaign messages with sentiment
-    campaign_query = (
-        select(
-            func.count(Message.id),
-            func.avg(Analysis.sentiment_score),
-        )
-        .outerjoin(Analysis, Analysis.message_id == Message.id)
-        .where(*base_conditions, Message.is_template_match == True)
-    )
-    campaign_result = await session.execute(campaign_query)
-    campaign_row = campaign_result.first()
-    campaign_count = campaign_row[0] or 0
-    campaign_sentiment = float(campaign_row[1]) if campaign_row[1] else None
+        params["end_date"] = end_date
 
-    # Count organic messages with sentiment
-    organic_query = (
-        select(
-            func.count(Message.id),
-            func.avg(Analysis.sentiment_score),
-        )
-        .outerjoin(Analysis, Analysis.message_id == Message.id)
-        .where(*base_conditions, Message.is_template_match == False)
+    comparison_result = await session.execute(
+        _campaign_comparison_stmt(has_start=start_date is not None, has_end=end_date is not None),
+        params,
     )
-    organic_result = await session.execute(organic_query)
-    organic_row = organic_result.first()
-    organic_count = organic_row[0] or 0
-    organic_sentiment = float(organic_row[1]) if organic_row[1] else None
+    campaign_count, campaign_sentiment, organic_count, organic_sentiment = comparison_result.one()
+    campaign_sentiment = float(campaign_sentiment) if campaign_sentiment is not None else None
+    organic_sentiment = float(organic_sentiment) if organic_sentiment is not None else None
 
     total = campaign_count + organic_count
 
@@ -588,7 +907,7 @@ async def get_custom_field_analytics(
     start_date: datetime | None = None,
     end_date: datetime | None = None,
     current_user: User = Depends(PermissionChecker(Permissions.ANALYTICS_READ)),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> dict:
     """
     Get analytics breakdown by custom field values.
@@ -650,59 +969,65 @@ async def get_custom_field_analytics(
     }
 
 
+@lru_cache
+def _response_time_stmt(has_start: bool, has_end: bool):
+    """Processing time stats in seconds, plus the pending count, over an optional date range."""
+    date_range = []
+    if has_start:
+        date_range.append(Message.received_at >= bindparam("start_date"))
+    if has_end:
+        date_range.append(Message.received_at <= bindparam("end_date"))
+
+    # Pending messages, from the partial pending index. It rides along as a
+    # scalar subquery so everything comes back in one round trip.
+    pending = select(func.count()).correlate(None).where(
+        Message.tenant_id == bindparam("tenant_id"),
+        Message.processing_status == "pending",
+        *date_range,
+    )
+
+    processing_time = func.extract("epoch", Message.processed_at - Message.received_at)
+    return select(
+        func.avg(processing_time),
+        func.percentile_cont(0.5).within_group(processing_time),
+        func.percentile_cont(0.95).within_group(processing_time),
+        func.count(),
+        pending.scalar_subquery(),
+    ).where(
+        Message.tenant_id == bindparam("tenant_id"),
+        Message.processed_at != None,
+        *date_range,
+    )
+
+
 @router.get("/response-times")
 async def get_response_time_metrics(
     start_date: datetime | None = None,
     end_date: datetime | None = None,
     current_user: User = Depends(PermissionChecker(Permissions.ANALYTICS_READ)),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> dict:
     """
     Get message processing time metrics.
 
     Shows how quickly messages are being processed and analyzed.
     """
-    tenant_id = current_user.tenant_id
-
-    # Build query for processing time calculation
-    base_conditions = [
-        Message.tenant_id == tenant_id,
-        Message.processed_at != None,
-    ]
-    if start_date:
-        base_conditions.append(Message.received_at >= start_date)
-    if end_date:
-        base_conditions.append(Message.received_at <= end_date)
-
-    # Average processing time in seconds
-    avg_query = (
-        select(
-            func.avg(func.extract("epoch", Message.processed_at - Message.received_at)),
-            func.count(),
-        )
-        .where(*base_conditions)
-    )
-    avg_result = await session.execute(avg_query)
-    avg_row = avg_result.first()
-    avg_time = float(avg_row[0]) if avg_row[0] else None
-    processed_count = avg_row[1] or 0
-
-    # Pending messages
-    pending_conditions = [Message.tenant_id == tenant_id, Message.processing_status == "pending"]
+    params = {"tenant_id": current_user.tenant_id}
     if start_date:
-        pending_conditions.append(Message.received_at >= start_date)
+        params["start_date"] = start_date
     if end_date:
-        pending_conditions.append(Message.received_at <= end_date)
+        params["end_date"] = end_date
 
-    pending_result = await session.execute(
-        select(func.count()).where(*pending_conditions)
+    metrics_result = await session.execute(
+        _response_time_stmt(has_start=start_date is not None, has_end=end_date is not None),
+        params,
     )
-    pending_count = pending_result.scalar() or 0
+    avg_time, median_time, p95_time, processed_count, pending_count = metrics_result.one()
 
     return {
-        "avg_processing_time_seconds": round(avg_time, 2) if avg_time else None,
-        "median_processing_time_seconds": None,  # Would need window functions
-        "p95_processing_time_seconds": None,  # Would need percentile calculations
+        "avg_processing_time_seconds": round(float(avg_time), 2) if avg_time else None,
+        "median_processing_time_seconds": round(median_time, 2) if median_time is not None else None,
+        "p95_processing_time_seconds": round(p95_time, 2) if p95_time is not None else None,
         "messages_processed": processed_count,
         "messages_pending": pending_count,
     }
@@ -713,24 +1038,132 @@ async def get_response_time_metrics(
 # =============================================================================
 
 
+# Columns each export dataset offers, in output order
+EXPORT_COLUMNS = {
+    "messages": {
+        "id": Message.id,
+        "received_at": Message.received_at,
+        "source": Message.source,
+        "sender_email": Message.sender_email,
+        "sender_name": Message.sender_name,
+        "subject": Message.subject,
+        "processing_status": Message.processing_status,
+        "sentiment_score": Analysis.sentiment_score,
+        "sentiment_label": Analysis.sentiment_label,
+        "urgency_score": Analysis.urgency_score,
+    },
+    "contacts": {
+        "id": Contact.id,
+        "email": Contact.email,
+        "name": Contact.name,
+        "phone": Contact.phone,
+        "state": Contact.state,
+        "zip_code": Contact.zip_code,
+        "message_count": Contact.message_count,
+        "avg_sentiment": Contact.avg_sentiment,
+        "first_contact_at": Contact.first_contact_at,
+        "last_contact_at": Contact.last_contact_at,
+    },
+    "analytics": {
+        "message_id": Analysis.message_id,
+        "received_at": Message.received_at,
+        "sentiment_score": Analysis.sentiment_score,
+        "sentiment_label": Analysis.sentiment_label,
+        "sentiment_confidence": Analysis.sentiment_confidence,
+        "urgency_score": Analysis.urgency_score,
+        "ai_provider": Analysis.ai_provider,
+        "ai_model": Analysis.ai_model,
+    },
+}
+
+# Filters accepted per dataset; both apply to Message.received_at
+EXPORT_FILTERS = {
+    "messages": {"start_date", "end_date"},
+    "contacts": set(),
+    "analytics": {"start_date", "end_date"},
+}
+
+# Rows fetched from the server-side cursor and encoded per chunk
+EXPORT_BATCH_SIZE = 1000
+
+
+def _export_query(request: ExportRequest, columns: list[str], tenant_id: UUID):
+    """Build the SELECT for an export, restricted to the tenant."""
+    available = EXPORT_COLUMNS[request.dataset]
+    query = select(*(available[name].label(name) for name in columns))
+
+    if request.dataset == "contacts":
+        return query.where(Contact.tenant_id == tenant_id).order_by(Contact.id)
+
+    if request.dataset == "messages":
+        query = query.select_from(Message).outerjoin(Analysis, Analysis.message_id == Message.id)
+    else:
+        query = query.select_from(Analysis).join(Message, Message.id == Analysis.message_id)
+
+    query = query.where(Message.tenant_id == tenant_id)
+    filters = request.filters or {}
+    if filters.get("start_date"):
+        query = query.where(Message.received_at >= datetime.fromisoformat(filters["start_date"]))
+    if filters.get("end_date"):
+        query = query.where(Message.received_at <= datetime.fromisoformat(filters["end_date"]))
+    return query.order_by(Message.received_at, Message.id)
+
+
+def _export_value(value):
+    """Render a column value as text for CSV and JSON output."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+async def _stream_export(session: AsyncSession, query, columns: list[str], fmt: str):
+    """Yield the export in encoded chunks of EXPORT_BATCH_SIZE rows.
+
+    Rows come from a server-side cursor, so memory stays flat however many
+    rows the tenant has, and the first bytes go out after the first batch.
+    """
+    result = await session.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        async for partition in result.partitions():
+            writer.writerows([_export_value(v) for v in row] for row in partition)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+    else:
+        separator = "[\n"
+        async for partition in result.partitions():
+            yield separator + ",\n".join(
+                json.dumps({name: _export_value(v) for name, v in zip(columns, row, strict=True)})
+                for row in partition
+            )
+            separator = ",\n"
+        yield "[]\n" if separator == "[\n" else "\n]\n"
+
+
 @router.post("/export")
 async def export_data(
     request: ExportRequest,
     current_user: User = Depends(PermissionChecker(Permissions.ANALYTICS_EXPORT)),
-    session: AsyncSession = Depends(get_session),
-) -> dict:
+    session: AsyncSession = Depends(get_read_session),
+) -> StreamingResponse:
     """
-    Request a data export.
+    Export a dataset as CSV or JSON.
 
-    Returns a job ID to track export progress. Large exports are processed async.
+    The file is streamed as rows are read, so exports of any size start
+    downloading immediately and use constant memory.
     """
-    import uuid
-
-    valid_datasets = ["messages", "contacts", "analytics"]
-    if request.dataset not in valid_datasets:
+    if request.dataset not in EXPORT_COLUMNS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid dataset. Valid options: {', '.join(valid_datasets)}",
+            detail=f"Invalid dataset. Valid options: {', '.join(EXPORT_COLUMNS)}",
         )
 
     valid_formats = ["csv", "json"]
@@ -740,47 +1173,35 @@ async def export_data(
             detail=f"Invalid format. Valid options: {', '.join(valid_formats)}",
         )
 
-    # Generate job ID
-    job_id = str(uuid.uuid4())
-
-    # TODO: Queue export job for async processing
-    # For now, return placeholder
-
-    return {
-        "job_id": job_id,
-        "status": "queued",
-        "dataset": request.dataset,
-        "format": request.format,
-    }
-
-
-@router.get("/export/{job_id}/status")
-async def get_export_status(
-    job_id: str,
-    current_user: User = Depends(PermissionChecker(Permissions.ANALYTICS_EXPORT)),
-) -> dict:
-    """Get status of an export job."""
-    # TODO: Look up job status from job queue
-
-    return {
-        "job_id": job_id,
-        "status": "pending",
-        "download_url": None,
-        "expires_at": None,
-    }
+    available = EXPORT_COLUMNS[request.dataset]
+    columns = request.columns or list(available)
+    unknown = [name for name in columns if name not in available]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown columns for {request.dataset}: {', '.join(unknown)}",
+        )
 
+    unknown = set(request.filters or {}) - EXPORT_FILTERS[request.dataset]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported filters for {request.dataset}: {', '.join(sorted(unknown))}",
+        )
 
-@router.get("/export/{job_id}/download")
-async def download_export(
-    job_id: str,
-    current_user: User = Depends(PermissionChecker(Permissions.ANALYTICS_EXPORT)),
-) -> StreamingResponse:
-    """Download a completed export."""
-    # TODO: Look up job, verify completed, stream file
+    try:
+        query = _export_query(request, columns, current_user.tenant_id)
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date and end_date filters must be ISO 8601 datetimes",
+        )
 
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Export download not yet implemented",
+    filename = f"{request.dataset}-{datetime.utcnow():%Y%m%d%H%M%S}.{request.format}"
+    return StreamingResponse(
+        _stream_export(session, query, columns, request.format),
+        media_type="text/csv" if request.format == "csv" else "application/json",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
 
@@ -789,79 +1210,85 @@ async def download_export(
 # =============================================================================
 
 
+# Datasets published to API key clients, with their descriptions
+DATASET_DESCRIPTIONS = {
+    "messages_summary": "Core message data with sentiment analysis",
+    "sentiment_trends": "Daily sentiment aggregates",
+    "category_breakdown": "Messages by category",
+    "contact_analytics": "Contact engagement metrics",
+    "campaign_summary": "Coordinated campaign statistics",
+}
+
+DATASETS = tuple(DATASET_DESCRIPTIONS)
+
+# /datasets response; static, so it is built once
+DATASETS_RESPONSE = {
+    "datasets": [
+        {
+            "name": name,
+            "description": description,
+            "endpoint": f"/api/v1/analytics/datasets/{name}",
+        }
+        for name, description in DATASET_DESCRIPTIONS.items()
+    ]
+}
+
+
 @router.get("/datasets")
 async def list_available_datasets(
     auth: AuthContext = Depends(ScopeChecker("analytics:read")),
-    session: AsyncSession = Depends(get_session),
 ) -> dict:
     """
     List available analytics datasets.
 
     Used by external tools to discover available data.
     """
-    return {
-        "datasets": [
-            {
-                "name": "messages_summary",
-                "description": "Core message data with sentiment analysis",
-                "endpoint": "/api/v1/analytics/datasets/messages_summary",
-            },
-            {
-                "name": "sentiment_trends",
-                "description": "Daily sentiment aggregates",
-                "endpoint": "/api/v1/analytics/datasets/sentiment_trends",
-            },
-            {
-                "name": "category_breakdown",
-                "description": "Messages by category",
-                "endpoint": "/api/v1/analytics/datasets/category_breakdown",
-            },
-            {
-                "name": "contact_analytics",
-                "description": "Contact engagement metrics",
-                "endpoint": "/api/v1/analytics/datasets/contact_analytics",
-            },
-            {
-                "name": "campaign_summary",
-                "description": "Coordinated campaign statistics",
-                "endpoint": "/api/v1/analytics/datasets/campaign_summary",
-            },
-        ]
-    }
+    return DATASETS_RESPONSE
+
+
+def _check_dataset(dataset_name: str) -> None:
+    """Raise 404 for an unknown dataset name."""
+    if dataset_name not in DATASETS:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Dataset not found. Valid datasets: {', '.join(DATASETS)}",
+        )
 
 
 @router.get("/datasets/{dataset_name}")
 async def query_dataset(
     dataset_name: str,
-    page: int = Query(1, ge=1),
     page_size: int = Query(100, ge=1, le=1000),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
     auth: AuthContext = Depends(ScopeChecker("analytics:read")),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> dict:
     """
     Query a specific analytics dataset.
 
-    Supports pagination for large datasets. Used by Power BI and similar tools.
+    Pages through large datasets with a keyset cursor: pass next_cursor
+    back as cursor while has_more is true. Row counts are available from
+    /datasets/{dataset_name}/count. Used by Power BI and similar tools.
     """
-    valid_datasets = [
-        "messages_summary",
-        "sentiment_trends",
-        "category_breakdown",
-        "contact_analytics",
-        "campaign_summary",
-    ]
-
-    if dataset_name not in valid_datasets:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Dataset not found. Valid datasets: {', '.join(valid_datasets)}",
-        )
+    _check_dataset(dataset_name)
 
     tenant_id = auth.tenant_id
-    offset = (page - 1) * page_size
+    after = None
+    if cursor:
+        parse_value = int if dataset_name == "contact_analytics" else datetime.fromisoformat
+        try:
+            after = _decode_cursor(cursor, parse_value)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+
+    # Each page fetches one extra row to tell whether there is a next one
+    next_cursor = None
 
     if dataset_name == "messages_summary":
-        # Messages with sentiment
+        # Messages with sentiment, newest first
         query = (
             select(
                 Message.id,
@@ -870,24 +1297,25 @@ async def query_dataset(
                 Message.source,
                 Message.received_at,
                 Message.processing_status,
-                Message.is_template_match,
+                Message.is_coordinated,
                 Analysis.sentiment_score,
                 Analysis.sentiment_label,
                 Analysis.urgency_score,
             )
             .outerjoin(Analysis, Analysis.message_id == Message.id)
             .where(Message.tenant_id == tenant_id)
-            .order_by(Message.received_at.desc())
-            .offset(offset)
-            .limit(page_size)
-        )
-
-        count_result = await session.execute(
-            select(func.count()).where(Message.tenant_id == tenant_id)
+            .order_by(Message.received_at.desc(), Message.id.desc())
+            .limit(page_size + 1)
         )
-        total = count_result.scalar() or 0
+        if after:
+            query = query.where(tuple_(Message.received_at, Message.id) < tuple_(*after))
 
         result = await session.execute(query)
+        rows = result.all()
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = _encode_cursor(rows[-1].received_at, rows[-1].id)
+
         data = [
             {
                 "id": str(row[0]),
@@ -896,29 +1324,40 @@ async def query_dataset(
                 "source": row[3],
                 "received_at": row[4].isoformat() if row[4] else None,
                 "processing_status": row[5],
-                "is_template_match": row[6],
+                "is_coordinated": row[6],
                 "sentiment_score": float(row[7]) if row[7] else None,
                 "sentiment_label": row[8],
                 "urgency_score": float(row[9]) if row[9] else None,
             }
-            for row in result.all()
+            for row in rows
         ]
 
     elif dataset_name == "contact_analytics":
+        # Only the published columns; contact rows are wide (voter file
+        # fields, JSONB) and ORM instances are not needed here
         query = (
-            select(Contact)
+            select(
+                Contact.id,
+                Contact.email,
+                Contact.name,
+                Contact.message_count,
+                Contact.avg_sentiment,
+                Contact.first_contact_at,
+                Contact.last_contact_at,
+            )
             .where(Contact.tenant_id == tenant_id)
-            .order_by(Contact.message_count.desc())
-            .offset(offset)
-            .limit(page_size)
+            .order_by(Contact.message_count.desc(), Contact.id.desc())
+            .limit(page_size + 1)
         )
-
-        count_result = await session.execute(
-            select(func.count()).where(Contact.tenant_id == tenant_id)
-        )
-        total = count_result.scalar() or 0
+        if after:
+            query = query.where(tuple_(Contact.message_count, Contact.id) < tuple_(*after))
 
         result = await session.execute(query)
+        contacts = result.all()
+        if len(contacts) > page_size:
+            contacts = contacts[:page_size]
+            next_cursor = _encode_cursor(contacts[-1].message_count, contacts[-1].id)
+
         data = [
             {
                 "id": str(c.id),
@@ -929,49 +1368,54 @@ async def query_dataset(
                 "first_contact_at": c.first_contact_at.isoformat() if c.first_contact_at else None,
                 "last_contact_at": c.last_contact_at.isoformat() if c.last_contact_at else None,
             }
-            for c in result.scalars().all()
-        ]
-
-    elif dataset_name == "campaign_summary":
-        query = (
-            select(Campaign)
-            .where(Campaign.tenant_id == tenant_id)
-            .order_by(Campaign.last_seen_at.desc())
-            .offset(offset)
-            .limit(page_size)
-        )
-
-        count_result = await session.execute(
-            select(func.count()).where(Campaign.tenant_id == tenant_id)
-        )
-        total = count_result.scalar() or 0
-
-        result = await session.execute(query)
-        data = [
-            {
-                "id": str(c.id),
-                "name": c.name,
-                "status": c.status,
-                "detection_type": c.detection_type,
-                "message_count": c.message_count,
-                "unique_senders": c.unique_senders,
-                "source_organization": c.source_organization,
-                "first_seen_at": c.first_seen_at.isoformat() if c.first_seen_at else None,
-                "last_seen_at": c.last_seen_at.isoformat() if c.last_seen_at else None,
-            }
-            for c in result.scalars().all()
+            for c in contacts
         ]
 
     else:
         # For sentiment_trends and category_breakdown, return empty for now
-        # These would need different query structures
+        # These would need different query structures. campaign_summary
+        # described detected campaigns; campaign now holds outbound email
+        # campaigns, and coordinated messages are grouped by
+        # Message.coordinated_group_id instead.
         data = []
-        total = 0
 
     return {
         "dataset": dataset_name,
         "data": data,
-        "page": page,
         "page_size": page_size,
-        "total": total,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
     }
+
+
+@router.get("/datasets/{dataset_name}/count")
+async def count_dataset(
+    dataset_name: str,
+    auth: AuthContext = Depends(ScopeChecker("analytics:read")),
+    session: AsyncSession = Depends(get_read_session),
+) -> dict:
+    """
+    Count the rows of a dataset.
+
+    The messages_summary count comes from the dashboard summary view,
+    refreshed every five minutes by the worker, so it can lag new messages
+    by a few minutes.
+    """
+    _check_dataset(dataset_name)
+
+    tenant_id = auth.tenant_id
+
+    if dataset_name == "messages_summary":
+        result = await session.execute(
+            select(tenant_dashboard_summary.c.total_messages).where(
+                tenant_dashboard_summary.c.tenant_id == tenant_id
+            )
+        )
+        total = result.scalar() or 0
+    elif dataset_name == "contact_analytics":
+        result = await session.execute(select(func.count()).where(Contact.tenant_id == tenant_id))
+        total = result.scalar() or 0
+    else:
+        total = 0
+
+    return {"dataset": dataset_name, "total": total}
@@ -4,6 +4,7 @@ from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -73,6 +74,21 @@ SCOPE_METADATA = {
     },
 }
 
+# Scopes a key may be granted; "*" grants all of them
+VALID_SCOPES = frozenset(SCOPE_METADATA) | {"*"}
+
+# /scopes response; the metadata is static, so it is built once
+SCOPES_RESPONSE = {
+    "scopes": [
+        {
+            "key": key,
+            "name": meta["name"],
+            "description": meta["description"],
+        }
+        for key, meta in SCOPE_METADATA.items()
+    ]
+}
+
 
 # =============================================================================
 # API Key Endpoints
@@ -86,22 +102,14 @@ async def list_scopes() -> dict:
 
     Returns metadata about each scope for UI display.
     """
-    scopes = [
-        {
-            "key": key,
-            "name": meta["name"],
-            "description": meta["description"],
-        }
-        for key, meta in SCOPE_METADATA.items()
-    ]
-    return {"scopes": scopes}
+    return SCOPES_RESPONSE
 
 
 @router.get("", response_model=list[APIKeyRead])
 async def list_api_keys(
     current_user: User = Depends(PermissionChecker(Permissions.API_KEYS_MANAGE)),
     session: AsyncSession = Depends(get_session),
-) -> list[APIKeyRead]:
+) -> list[APIKey]:
     """
     List all API keys for the current tenant.
 
@@ -112,9 +120,9 @@ async def list_api_keys(
         .where(APIKey.tenant_id == current_user.tenant_id)
         .order_by(APIKey.created_at.desc())
     )
-    keys = result.scalars().all()
-
-    return [APIKeyRead.model_validate(key) for key in keys]
+    # Returned as ORM rows: the response model validates and serializes the
+    # whole list in one pass, rather than one model_validate per key first
+    return result.scalars().all()
 
 
 @router.get("/{key_id}", response_model=APIKeyRead)
@@ -156,8 +164,7 @@ async def create_api_key(
     Store it securely - it cannot be retrieved again.
     """
     # Validate scopes
-    valid_scopes = set(SCOPE_METADATA.keys())
-    invalid_scopes = set(request.scopes) - valid_scopes - {"*"}
+    invalid_scopes = set(request.scopes) - VALID_SCOPES
     if invalid_scopes:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -201,11 +208,30 @@ async def update_api_key(
 
     Note: The key itself cannot be changed - create a new key if needed.
     """
+    # Validate scopes if provided
+    if request.scopes is not None:
+        invalid_scopes = set(request.scopes) - VALID_SCOPES
+        if invalid_scopes:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid scopes: {', '.join(invalid_scopes)}",
+            )
+
+    # Omitted and null fields are left unchanged; an empty allowed_ips
+    # list clears the restriction.
+    values = request.model_dump(exclude_none=True)
+    if "allowed_ips" in values and not values["allowed_ips"]:
+        values["allowed_ips"] = None
+
+    # One UPDATE ... RETURNING instead of select, flush and refresh
     result = await session.execute(
-        select(APIKey).where(
+        update(APIKey)
+        .where(
             APIKey.id == key_id,
             APIKey.tenant_id == current_user.tenant_id,
         )
+        .values(values)
+        .returning(APIKey)
     )
     api_key = result.scalars().first()
 
@@ -215,29 +241,7 @@ async def update_api_key(
             detail="API key not found",
         )
 
-    # Validate scopes if provided
-    if request.scopes is not None:
-        valid_scopes = set(SCOPE_METADATA.keys())
-        invalid_scopes = set(request.scopes) - valid_scopes - {"*"}
-        if invalid_scopes:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid scopes: {', '.join(invalid_scopes)}",
-            )
-        api_key.scopes = request.scopes
-
-    # Update other fields
-    if request.name is not None:
-        api_key.name = request.name
-    if request.rate_limit is not None:
-        api_key.rate_limit = request.rate_limit
-    if request.expires_at is not None:
-        api_key.expires_at = request.expires_at
-    if request.allowed_ips is not None:
-        api_key.allowed_ips = request.allowed_ips if request.allowed_ips else None
-
     await session.commit()
-    await session.refresh(api_key)
 
     return APIKeyRead.model_validate(api_key)
 
@@ -22,6 +22,7 @@ from app.models.campaign import (
     CampaignStatus,
     CampaignRecipient,
     CampaignRecipientRead,
+    CampaignStats,
     RecipientFilterPreview,
     CampaignAnalytics,
 )
@@ -116,8 +117,12 @@ async def list_campaigns(
     total_result = await session.execute(count_query)
     total = total_result.scalar() or 0
 
-    # Apply sorting
-    sort_column = getattr(Campaign, sort_by, Campaign.created_at)
+    # Apply sorting; counters live on campaign_stats
+    if sort_by in CampaignStats.model_fields and sort_by != "campaign_id":
+        query = query.join(CampaignStats)
+        sort_column = getattr(CampaignStats, sort_by)
+    else:
+        sort_column = getattr(Campaign, sort_by, Campaign.created_at)
     if sort_order == "desc":
         query = query.order_by(sort_column.desc())
     else:
@@ -739,7 +744,7 @@ async def populate_recipients(
         created_count += 1
 
     # Update campaign stats
-    campaign.total_recipients = created_count
+    campaign.stats.total_recipients = created_count
 
     await session.commit()
 
@@ -887,10 +892,12 @@ async def get_campaign_stats(
     # Get aggregated stats
     stats_result = await session.execute(
         select(
-            func.sum(Campaign.total_sent),
-            func.sum(Campaign.total_opened),
-            func.sum(Campaign.total_clicked),
-        ).where(Campaign.tenant_id == tenant_id)
+            func.sum(CampaignStats.total_sent),
+            func.sum(CampaignStats.total_opened),
+            func.sum(CampaignStats.total_clicked),
+        )
+        .join(Campaign)
+        .where(Campaign.tenant_id == tenant_id)
     )
     stats_row = stats_result.first()
 
@@ -1,5 +1,6 @@
 """API dependencies for authentication and authorization."""
 
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Annotated
@@ -10,7 +11,7 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from app.core.database import get_session
+from app.core.database import async_session_maker, get_session, read_session_maker
 from app.core.security import verify_token
 from app.core.redis import check_rate_limit
 from app.models.user import User, Role, UserRole
@@ -315,25 +316,35 @@ class PermissionChecker:
             self.required_permissions = required_permissions
         self.require_all = require_all
 
+    # FastAPI caches a dependency's result per request, keyed by the callable.
+    # Comparing checkers by value means two PermissionChecker("x") instances
+    # on the same route (e.g. router and endpoint dependencies) run once.
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PermissionChecker):
+            return NotImplemented
+        return (self.required_permissions, self.require_all) == (
+            other.required_permissions,
+            other.require_all,
+        )
+
+    def __hash__(self) -> int:
+        return hash((PermissionChecker, tuple(self.required_permissions), self.require_all))
+
     async def __call__(
         self,
         current_user: Annotated[User, Depends(get_current_user)],
         session: AsyncSession = Depends(get_session),
     ) -> User:
         """Check if user has required permissions."""
-        # Load user roles
-        roles_result = await session.execute(
-            select(UserRole).where(UserRole.user_id == current_user.id)
+        # Collect the permissions of all the user's roles in one query
+        permissions_result = await session.execute(
+            select(Role.permissions)
+            .join(UserRole, UserRole.role_id == Role.id)
+            .where(UserRole.user_id == current_user.id)
         )
-        user_roles = roles_result.scalars().all()
-
-        # Collect all permissions
         all_permissions: set[str] = set()
-        for ur in user_roles:
-            role_result = await session.execute(select(Role).where(Role.id == ur.role_id))
-            role = role_result.scalars().first()
-            if role:
-                all_permissions.update(role.permissions)
+        for role_permissions in permissions_result.scalars():
+            all_permissions.update(role_permissions or [])
 
         # Check permissions
         if self.require_all:
@@ -376,6 +387,19 @@ class ScopeChecker:
             self.required_scopes = required_scopes
         self.require_all = require_all
 
+    # Compared by value for FastAPI's per-request dependency cache, as with
+    # PermissionChecker
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ScopeChecker):
+            return NotImplemented
+        return (self.required_scopes, self.require_all) == (
+            other.required_scopes,
+            other.require_all,
+        )
+
+    def __hash__(self) -> int:
+        return hash((ScopeChecker, tuple(self.required_scopes), self.require_all))
+
     async def __call__(
         self,
         request: Request,
@@ -405,6 +429,25 @@ class ScopeChecker:
         return auth
 
 
+async def get_read_session(
+    session: AsyncSession = Depends(get_session),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Session for read-only endpoints.
+
+    With a read replica configured this is a read-only transaction on the
+    replica, so results can lag the primary by the replication delay.
+    Without one it is the request's primary session, which authentication
+    already holds, so the request does not take a second connection.
+    """
+    if read_session_maker is async_session_maker:
+        yield session
+        return
+
+    async with read_session_maker() as read_session:
+        yield read_session
+
+
 # Convenience type aliases
 CurrentUser = Annotated[User, Depends(get_current_user)]
 CurrentTenant = Annotated[Tenant, Depends(get_current_tenant)]
@@ -1,7 +1,5 @@
 """Email tracking and webhook endpoints for engagement tracking."""
 
-import hashlib
-import hmac
 import json
 import logging
 from datetime import datetime
@@ -14,10 +12,11 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from app.core.config import get_settings
 from app.core.database import get_session
 from app.models.email import SentEmail, EmailSuppression
-from app.models.campaign import Campaign, CampaignRecipient
+from app.models.campaign import CampaignRecipient
+from app.services.campaign_stats import increment_campaign_stats
+from app.services.email.tracking import validate_tracking_token, validate_unsubscribe_token
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -31,58 +30,6 @@ TRACKING_PIXEL = (
 )
 
 
-# =============================================================================
-# Tracking Token Generation/Validation
-# =============================================================================
-
-
-def generate_tracking_token(sent_email_id: str, action: str = "open") -> str:
-    """Generate a signed token for tracking URLs."""
-    secret = get_settings().secret_key.encode()
-    message = f"{sent_email_id}:{action}".encode()
-    signature = hmac.new(secret, message, hashlib.sha256).hexdigest()[:16]
-    return f"{sent_email_id}:{signature}"
-
-
-def validate_tracking_token(token: str, action: str = "open") -> UUID | None:
-    """Validate a tracking token and return the sent_email_id if valid."""
-    try:
-        parts = token.split(":")
-        if len(parts) != 2:
-            return None
-
-        sent_email_id, signature = parts
-        expected_token = generate_tracking_token(sent_email_id, action)
-
-        if hmac.compare_digest(token, expected_token):
-            return UUID(sent_email_id)
-        return None
-    except Exception:
-        return None
-
-
-def generate_unsubscribe_token(email: str, tenant_id: str) -> str:
-    """Generate a signed unsubscribe token."""
-    secret = get_settings().secret_key.encode()
-    message = f"unsub:{email}:{tenant_id}".encode()
-    signature = hmac.new(secret, message, hashlib.sha256).hexdigest()[:16]
-    return f"{tenant_id}:{hashlib.md5(email.encode()).hexdigest()[:8]}:{signature}"
-
-
-def validate_unsubscribe_token(token: str) -> tuple[str, UUID] | None:
-    """Validate an unsubscribe token, returns (email, tenant_id) if valid."""
-    # Note: This simplified version just validates format
-    # In production, you'd need to look up the email from a stored mapping
-    try:
-        parts = token.split(":")
-        if len(parts) != 3:
-            return None
-        tenant_id, _, _ = parts
-        return UUID(tenant_id)
-    except Exception:
-        return None
-
-
 # =============================================================================
 # Open Tracking Endpoint
 # =============================================================================
@@ -132,14 +79,12 @@ async def track_open(
                             recipient.status = "opened"
 
                             # Update campaign stats
-                            campaign_result = await session.execute(
-                                select(Campaign).where(Campaign.id == recipient.campaign_id)
+                            await increment_campaign_stats(
+                                session,
+                                recipient.campaign_id,
+                                total_opened=1,
+                                unique_opens=1 if recipient.open_count == 1 else 0,
                             )
-                            campaign = campaign_result.scalars().first()
-                            if campaign:
-                                campaign.total_opened += 1
-                                if recipient.open_count == 1:
-                                    campaign.unique_opens += 1
 
                 await session.commit()
         except Exception as e:
@@ -208,14 +153,12 @@ async def track_click(
                                 recipient.status = "clicked"
 
                             # Update campaign stats
-                            campaign_result = await session.execute(
-                                select(Campaign).where(Campaign.id == recipient.campaign_id)
+                            await increment_campaign_stats(
+                                session,
+                                recipient.campaign_id,
+                                total_clicked=1,
+                                unique_clicks=1 if recipient.click_count == 1 else 0,
                             )
-                            campaign = campaign_result.scalars().first()
-                            if campaign:
-                                campaign.total_clicked += 1
-                                if recipient.click_count == 1:
-                                    campaign.unique_clicks += 1
 
                 await session.commit()
         except Exception as e:
@@ -567,12 +510,7 @@ async def _update_recipient_status(
             recipient.delivered_at = timestamp
 
             # Update campaign stats
-            campaign_result = await session.execute(
-                select(Campaign).where(Campaign.id == recipient.campaign_id)
-            )
-            campaign = campaign_result.scalars().first()
-            if campaign:
-                campaign.total_delivered += 1
+            await increment_campaign_stats(session, recipient.campaign_id, total_delivered=1)
 
 
 async def _update_recipient_open(session: AsyncSession, sent_email_id: UUID, timestamp: datetime):
@@ -589,13 +527,9 @@ async def _update_recipient_open(session: AsyncSession, sent_email_id: UUID, tim
             recipient.status = "opened"
 
             # Update campaign stats
-            campaign_result = await session.execute(
-                select(Campaign).where(Campaign.id == recipient.campaign_id)
+            await increment_campaign_stats(
+                session, recipient.campaign_id, total_opened=1, unique_opens=1
             )
-            campaign = campaign_result.scalars().first()
-            if campaign:
-                campaign.total_opened += 1
-                campaign.unique_opens += 1
 
 
 async def _update_recipient_click(session: AsyncSession, sent_email_id: UUID, timestamp: datetime):
@@ -613,13 +547,9 @@ async def _update_recipient_click(session: AsyncSession, sent_email_id: UUID, ti
                 recipient.status = "clicked"
 
             # Update campaign stats
-            campaign_result = await session.execute(
-                select(Campaign).where(Campaign.id == recipient.campaign_id)
+            await increment_campaign_stats(
+                session, recipient.campaign_id, total_clicked=1, unique_clicks=1
             )
-            campaign = campaign_result.scalars().first()
-            if campaign:
-                campaign.total_clicked += 1
-                campaign.unique_clicks += 1
 
 
 async def _update_recipient_bounce(
@@ -637,12 +567,7 @@ async def _update_recipient_bounce(
         recipient.bounce_type = bounce_type
 
         # Update campaign stats
-        campaign_result = await session.execute(
-            select(Campaign).where(Campaign.id == recipient.campaign_id)
-        )
-        campaign = campaign_result.scalars().first()
-        if campaign:
-            campaign.total_bounced += 1
+        await increment_campaign_stats(session, recipient.campaign_id, total_bounced=1)
 
 
 async def _add_suppression(
@@ -0,0 +1,85 @@
+"""In-process result cache with stale-while-revalidate."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class ResultCache:
+    """
+    Bounded LRU cache for the results of expensive async calls.
+
+    An entry younger than ``ttl`` is served as is. Between ``ttl`` and
+    ``stale_ttl`` it is still served, and a background task reloads it so
+    the next caller gets a fresh value. Older entries are reloaded inline.
+
+    The cache is per process; each worker keeps its own copy.
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float, max_entries: int) -> None:
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        # Keys with a refresh in flight, and the tasks themselves so they are
+        # not garbage collected before they finish
+        self._refreshing: dict[Hashable, asyncio.Task] = {}
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[Any]],
+        refresh: Callable[[], Awaitable[Any]] | None = None,
+    ) -> Any:
+        """
+        Return the cached value for key, loading it on a miss.
+
+        Args:
+            key: Cache key; must include everything the result depends on
+            load: Produces the value when there is no usable entry
+            refresh: Produces the value in a background task when the entry
+                is stale. Defaults to load; pass a separate callable when
+                load depends on request-scoped state such as a DB session.
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < self.stale_ttl:
+                self._entries.move_to_end(key)
+                if age >= self.ttl and key not in self._refreshing:
+                    task = asyncio.create_task(self._refresh(key, refresh or load))
+                    self._refreshing[key] = task
+                return entry[1]
+
+        value = await load()
+        self._store(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    async def _refresh(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            self._store(key, await load())
+        except Exception:
+            # Keep serving the stale value; the next caller past stale_ttl
+            # loads inline and sees the error
+            logger.exception("Background cache refresh failed", key=key)
+        finally:
+            self._refreshing.pop(key, None)
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -34,6 +34,16 @@ class Settings(BaseSettings):
 
     # Database
     database_url: PostgresDsn
+    # Connection pool per process (not used in development, which opens a
+    # connection per session). Besides request sessions, the pool serves
+    # analytics cache refreshes and the AI usage buffer.
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    # Prepared statements kept per connection. The app issues a few hundred
+    # distinct statements; set to 0 behind a transaction-pooling PgBouncer.
+    database_statement_cache_size: int = 500
+    # Optional read replica for analytics reads; unset sends them to the primary
+    database_read_url: PostgresDsn | None = None
 
     @computed_field  # type: ignore[misc]
     @property
@@ -41,6 +51,14 @@ class Settings(BaseSettings):
         """Convert database URL to async driver."""
         return str(self.database_url).replace("postgresql://", "postgresql+asyncpg://")
 
+    @computed_field  # type: ignore[misc]
+    @property
+    def async_database_read_url(self) -> str | None:
+        """Convert the read replica URL, if any, to async driver."""
+        if self.database_read_url is None:
+            return None
+        return str(self.database_read_url).replace("postgresql://", "postgresql+asyncpg://")
+
     # Redis
     redis_url: RedisDsn
 
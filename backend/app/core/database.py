@@ -11,11 +11,20 @@ from app.core.config import get_settings
 settings = get_settings()
 
 # Create async engine
+if settings.environment == "development":
+    pool_options = {"poolclass": NullPool}
+else:
+    pool_options = {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+    }
+
 engine = create_async_engine(
     settings.async_database_url,
     echo=settings.debug,
-    poolclass=NullPool if settings.environment == "development" else None,
     pool_pre_ping=True,
+    connect_args={"prepared_statement_cache_size": settings.database_statement_cache_size},
+    **pool_options,
 )
 
 # Session factory
@@ -27,6 +36,27 @@ async_session_maker = async_sessionmaker(
     autoflush=False,
 )
 
+# Read-only sessions on the replica, when one is configured. Without one,
+# reads share the primary engine and its sessions.
+if settings.async_database_read_url:
+    read_engine = create_async_engine(
+        settings.async_database_read_url,
+        echo=settings.debug,
+        pool_pre_ping=True,
+        connect_args={"prepared_statement_cache_size": settings.database_statement_cache_size},
+        **pool_options,
+    ).execution_options(postgresql_readonly=True)
+    read_session_maker = async_sessionmaker(
+        read_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+else:
+    read_engine = engine
+    read_session_maker = async_session_maker
+
 
 async def init_db() -> None:
     """Initialize database tables (development only)."""
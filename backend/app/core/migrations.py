@@ -0,0 +1,83 @@
+"""Helpers shared by Alembic migration scripts."""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import asyncpg
+from sqlalchemy.exc import DBAPIError
+
+from alembic import op
+
+
+def _run_on_driver(statement: str, fn: Callable[[asyncpg.Connection], Awaitable[Any]]) -> Any:
+    """Await ``fn`` with the raw asyncpg connection of the migration.
+
+    Database errors are wrapped in ``DBAPIError``, as they are for
+    statements run through SQLAlchemy.
+    """
+    dbapi_connection = op.get_bind().connection.dbapi_connection
+    try:
+        return dbapi_connection.run_async(fn)
+    except asyncpg.PostgresError as error:
+        raise DBAPIError(statement, None, error) from error
+
+
+def execute_script(sql: str) -> None:
+    """Run a semicolon-separated SQL script in a single round trip.
+
+    SQLAlchemy's asyncpg adapter prepares every statement, which rejects
+    multi-statement strings. The raw asyncpg connection's ``execute()``
+    without arguments uses the simple query protocol, so the whole script
+    is sent to the server at once without a parse/bind round trip. Use it
+    for one-shot DDL. In offline (``--sql``) mode the script is emitted
+    unchanged.
+    """
+    if op.get_context().as_sql:
+        op.execute(sql)
+        return
+
+    bind = op.get_bind()
+    if not bind.connection.dbapi_connection.driver_connection.is_in_transaction():
+        # The adapter begins its transaction lazily, on the first statement
+        # it runs. Run a trivial one so that, outside an autocommit block,
+        # the script joins the migration transaction.
+        bind.exec_driver_sql("SELECT 1")
+    _run_on_driver(sql, lambda connection: connection.execute(sql))
+
+
+def execute_in_batches(sql: str, batch_size: int) -> int:
+    """Re-run a batched UPDATE or DELETE until it stops matching rows.
+
+    ``sql`` must use ``$1`` as its row limit (typically in a
+    ``WHERE id IN (SELECT id ... LIMIT $1)`` subquery) and must stop
+    matching a row once it has been processed, or the loop never ends. The
+    statement is prepared once on the asyncpg connection and re-executed,
+    so the server parses and plans it a single time however many batches
+    there are. Call it inside an autocommit block so each batch commits on
+    its own. Returns the total number of rows affected.
+    """
+    sql = f"WITH batch AS ({sql} RETURNING 1) SELECT count(*) FROM batch"
+    statement = _run_on_driver(sql, lambda connection: connection.prepare(sql))
+
+    total = 0
+    while count := _run_on_driver(sql, lambda _: statement.fetchval(batch_size)):
+        total += count
+    return total
+
+
+def set_not_null_online(table: str, column: str) -> None:
+    """Make an existing column NOT NULL without a full scan under lock.
+
+    A plain SET NOT NULL scans the whole table while holding ACCESS
+    EXCLUSIVE. Instead, a NOT VALID CHECK constraint is added (metadata
+    only) and validated, which scans under SHARE UPDATE EXCLUSIVE and so
+    lets reads and writes continue. SET NOT NULL then sees the validated
+    constraint and skips its own scan (PostgreSQL 12+). Call it inside an
+    autocommit block so the validation does not run in the transaction
+    that still holds the lock taken by ADD CONSTRAINT.
+    """
+    constraint = f"chk_{table}_{column}_nn"
+    op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {constraint} CHECK ({column} IS NOT NULL) NOT VALID")
+    op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {constraint}")
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET NOT NULL")
+    op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {constraint}")
@@ -8,7 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 import structlog
 
 from app.core.config import get_settings
-from app.api.v1 import router as api_v1_router
+from app.api.v1 import build_router as build_api_v1_router
 
 settings = get_settings()
 
@@ -64,7 +64,7 @@ app.add_middleware(
 )
 
 # Include API routers
-app.include_router(api_v1_router, prefix=settings.api_v1_prefix)
+app.include_router(build_api_v1_router(), prefix=settings.api_v1_prefix)
 
 
 @app.get("/health")
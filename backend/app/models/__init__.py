@@ -2,11 +2,11 @@
 
 from app.models.tenant import Tenant
 from app.models.user import User, UserRole, Role
-from app.models.message import Message
+from app.models.message import Message, MessageHourlyRollup
 from app.models.analysis import Analysis
 from app.models.category import Category, MessageCategory
 from app.models.contact import Contact, CustomFieldDefinition, ContactFieldValue
-from app.models.campaign import Campaign, CampaignRecipient
+from app.models.campaign import Campaign, CampaignRecipient, CampaignStats
 from app.models.campaign_recommendation import CampaignRecommendation
 from app.models.workflow import Workflow, WorkflowExecution
 from app.models.form import Form, FormField, FormSubmission
@@ -25,6 +25,7 @@ __all__ = [
     "UserRole",
     "Role",
     "Message",
+    "MessageHourlyRollup",
     "Analysis",
     "Category",
     "MessageCategory",
@@ -33,6 +34,7 @@ __all__ = [
     "ContactFieldValue",
     "Campaign",
     "CampaignRecipient",
+    "CampaignStats",
     "CampaignRecommendation",
     "Workflow",
     "WorkflowExecution",
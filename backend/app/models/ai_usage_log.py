@@ -3,6 +3,7 @@
 from typing import TYPE_CHECKING, Literal
 from uuid import UUID
 
+from sqlalchemy import Column, Index, Text
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.models.base import TenantBaseModel
@@ -37,10 +38,33 @@ class AIUsageLog(AIUsageLogBase, TenantBaseModel, table=True):
     """Log every AI API call for analytics and billing."""
 
     __tablename__ = "ai_usage_log"
+    __table_args__ = (
+        # Tenant usage over a time window, grouped by provider or operation;
+        # the INCLUDE columns make those reports index-only scans
+        Index(
+            "idx_ai_usage_log_tenant_created_at",
+            "tenant_id",
+            "created_at",
+            postgresql_include=["ai_provider", "operation_type", "input_tokens", "output_tokens", "estimated_cost_usd"],
+        ),
+        # Tenant usage per model over a time window
+        Index(
+            "idx_ai_usage_log_tenant_model_created_at",
+            "tenant_id",
+            "ai_model",
+            "created_at",
+            postgresql_include=["input_tokens", "output_tokens", "estimated_cost_usd"],
+        ),
+    )
+
+    # Covered by idx_ai_usage_log_tenant_created_at, so no single-column
+    # indexes on these
+    tenant_id: UUID = Field(foreign_key="tenant.id")
+    operation_type: str = Field(max_length=64)  # "message_analysis", "voter_import", etc.
 
     # Provider details
-    ai_provider: str = Field(index=True)  # claude, openai, azure_openai, ollama
-    ai_model: str
+    ai_provider: str = Field(max_length=64)  # claude, openai, azure_openai, ollama
+    ai_model: str = Field(max_length=64)
     prompt_template_id: UUID | None = Field(default=None, foreign_key="prompt_template.id")
 
     # Token metrics
@@ -55,8 +79,8 @@ class AIUsageLog(AIUsageLogBase, TenantBaseModel, table=True):
     processing_time_ms: int = Field(default=0)
 
     # Status
-    status: str = Field(default="success")  # success, error, timeout
-    error_message: str | None = Field(default=None)
+    status: str = Field(default="success", max_length=64)  # success, error, timeout
+    error_message: str | None = Field(default=None, sa_column=Column(Text))
 
     # User who initiated (if applicable)
     user_id: UUID | None = Field(default=None, foreign_key="user.id")
@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Literal
 from uuid import UUID
 
-from sqlalchemy import Column, Text
+from sqlalchemy import Column, Index, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -58,9 +58,19 @@ class Analysis(AnalysisBase, BaseModel, table=True):
     """Analysis database model."""
 
     __tablename__ = "analysis"
-
-    # Foreign key to message (1:1 relationship)
-    message_id: UUID = Field(foreign_key="message.id", unique=True, index=True)
+    __table_args__ = (
+        # Enforces the 1:1 with message; the INCLUDE columns let sentiment
+        # aggregates joined from message read analysis index-only
+        Index(
+            "ix_analysis_message_id",
+            "message_id",
+            unique=True,
+            postgresql_include=["sentiment_score", "sentiment_label"],
+        ),
+    )
+
+    # Foreign key to message (1:1 relationship), unique via ix_analysis_message_id
+    message_id: UUID = Field(foreign_key="message.id")
 
     # Extracted entities
     entities: list[dict] = Field(default_factory=list, sa_column=Column(JSONB))
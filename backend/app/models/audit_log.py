@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import Column, Text
+from sqlalchemy import Column, Index, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -63,6 +63,18 @@ class AuditLog(TenantBaseModel, table=True):
     """Audit log for tracking all system activity."""
 
     __tablename__ = "audit_log"
+    # Partitioned by month; partitions are managed by the
+    # create_audit_log_partitions() SQL function (see the partition_audit_log migration)
+    __table_args__ = (
+        Index("ix_audit_log_tenant_created_at", "tenant_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    # Indexed via ix_audit_log_tenant_created_at above
+    tenant_id: UUID = Field(foreign_key="tenant.id")
+
+    # The partition key must be part of the primary key
+    created_at: datetime = Field(default_factory=datetime.utcnow, primary_key=True)
 
     # What changed
     entity_type: str = Field(index=True)  # "contact", "message", "campaign", etc.
@@ -1,11 +1,27 @@
 """Base model classes with common fields and functionality."""
 
+import os
+import time
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlmodel import Field, SQLModel
 
 
+def uuid7() -> UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562).
+
+    The millisecond timestamp prefix makes new primary keys roughly
+    increasing, so inserts append to the right edge of the primary key
+    index instead of landing on random leaf pages like UUIDv4 does.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return UUID(int=value)
+
+
 class TimestampMixin(SQLModel):
     """Mixin for created_at and updated_at timestamps."""
 
@@ -30,7 +46,7 @@ class SoftDeleteMixin(SQLModel):
 class BaseModel(TimestampMixin):
     """Base model with UUID primary key and timestamps."""
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
 
 
 class TenantBaseModel(BaseModel):
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Literal
 from uuid import UUID
 
-from sqlalchemy import Column, Text, UniqueConstraint
+from sqlalchemy import Column, Index, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -55,6 +55,13 @@ class Campaign(CampaignBase, TenantBaseModel, table=True):
     """Outbound email marketing campaign."""
 
     __tablename__ = "campaign"
+    __table_args__ = (
+        # Serves tenant-scoped listing filtered by status
+        Index("idx_campaign_tenant_status_scheduled", "tenant_id", "status", "scheduled_at"),
+    )
+
+    # Covered by idx_campaign_tenant_status_scheduled, so no single-column index
+    tenant_id: UUID = Field(foreign_key="tenant.id")
 
     # Template configuration
     template_id: UUID = Field(foreign_key="email_template.id", index=True)
@@ -69,7 +76,7 @@ class Campaign(CampaignBase, TenantBaseModel, table=True):
     ab_test_winning_variant: str | None = Field(default=None)  # "a" or "b"
 
     # Status and scheduling
-    status: str = Field(default="draft", index=True)
+    status: str = Field(default="draft")
     scheduled_at: datetime | None = Field(default=None, index=True)
     started_at: datetime | None = Field(default=None)
     completed_at: datetime | None = Field(default=None)
@@ -98,6 +105,85 @@ class Campaign(CampaignBase, TenantBaseModel, table=True):
     from_name_override: str | None = Field(default=None)
     reply_to_override: str | None = Field(default=None)
 
+    # Created by
+    created_by_id: UUID | None = Field(default=None, foreign_key="user.id", index=True)
+
+    # Job tracking (for ARQ)
+    job_id: UUID | None = Field(default=None, foreign_key="job.id", index=True)
+
+    # Relationships
+    tenant: "Tenant" = Relationship(back_populates="campaigns")
+    recipients: list["CampaignRecipient"] = Relationship(
+        back_populates="campaign",
+        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
+    )
+    # Joined so the counters below are available wherever a campaign is loaded
+    stats: "CampaignStats" = Relationship(
+        back_populates="campaign",
+        sa_relationship_kwargs={
+            "lazy": "joined",
+            "uselist": False,
+            "cascade": "all, delete-orphan",
+            "passive_deletes": True,
+        },
+    )
+
+    # Read-only views of the counters, so API schemas keep a flat shape.
+    # Writes go to CampaignStats (see app.services.campaign_stats).
+    @property
+    def total_recipients(self) -> int:
+        return self.stats.total_recipients if self.stats else 0
+
+    @property
+    def total_sent(self) -> int:
+        return self.stats.total_sent if self.stats else 0
+
+    @property
+    def total_delivered(self) -> int:
+        return self.stats.total_delivered if self.stats else 0
+
+    @property
+    def total_opened(self) -> int:
+        return self.stats.total_opened if self.stats else 0
+
+    @property
+    def total_clicked(self) -> int:
+        return self.stats.total_clicked if self.stats else 0
+
+    @property
+    def total_bounced(self) -> int:
+        return self.stats.total_bounced if self.stats else 0
+
+    @property
+    def total_unsubscribed(self) -> int:
+        return self.stats.total_unsubscribed if self.stats else 0
+
+    @property
+    def total_failed(self) -> int:
+        return self.stats.total_failed if self.stats else 0
+
+    @property
+    def unique_opens(self) -> int:
+        return self.stats.unique_opens if self.stats else 0
+
+    @property
+    def unique_clicks(self) -> int:
+        return self.stats.unique_clicks if self.stats else 0
+
+
+class CampaignStats(SQLModel, table=True):
+    """Aggregated delivery counters for a campaign.
+
+    Split out of campaign because the counters are bumped on every send and
+    webhook event. This table has no secondary indexes, so those UPDATEs
+    stay HOT and never touch the campaign row or its indexes. The row is
+    created by the campaign_stats_insert trigger when a campaign is inserted.
+    """
+
+    __tablename__ = "campaign_stats"
+
+    campaign_id: UUID = Field(foreign_key="campaign.id", primary_key=True, ondelete="CASCADE")
+
     # Aggregated statistics (denormalized for performance)
     total_recipients: int = Field(default=0)
     total_sent: int = Field(default=0)
@@ -112,29 +198,28 @@ class Campaign(CampaignBase, TenantBaseModel, table=True):
     unique_opens: int = Field(default=0)
     unique_clicks: int = Field(default=0)
 
-    # Created by
-    created_by_id: UUID | None = Field(default=None, foreign_key="user.id", index=True)
-
-    # Job tracking (for ARQ)
-    job_id: UUID | None = Field(default=None, foreign_key="job.id", index=True)
-
     # Relationships
-    tenant: "Tenant" = Relationship(back_populates="campaigns")
-    recipients: list["CampaignRecipient"] = Relationship(
-        back_populates="campaign",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
-    )
+    campaign: Campaign = Relationship(back_populates="stats")
 
 
 class CampaignRecipient(BaseModel, table=True):
     """Individual recipient tracking for a campaign."""
 
+    # Created with fillfactor = 80 (see the create_campaign_recipient
+    # migration) so post-send updates can stay HOT
     __tablename__ = "campaign_recipient"
     __table_args__ = (
         UniqueConstraint("campaign_id", "contact_id", name="uq_campaign_recipient"),
+        # Covers "pending recipients of campaign X" and per-status counts
+        Index(
+            "idx_campaign_recipient_campaign_status",
+            "campaign_id",
+            "status",
+            postgresql_include=["email", "contact_id", "sent_at"],
+        ),
     )
 
-    campaign_id: UUID = Field(foreign_key="campaign.id", index=True)
+    campaign_id: UUID = Field(foreign_key="campaign.id")
     contact_id: UUID = Field(foreign_key="contact.id", index=True)
 
     # Email address at time of send (cached in case contact email changes)
@@ -144,7 +229,7 @@ class CampaignRecipient(BaseModel, table=True):
     variant: str | None = Field(default=None)  # "a" or "b" for A/B tests
 
     # Delivery status
-    status: str = Field(default="pending", index=True)
+    status: str = Field(default="pending")
     # pending, queued, sent, delivered, opened, clicked, bounced, failed, unsubscribed
 
     # Sent email reference
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Literal
 from uuid import UUID
 
-from sqlalchemy import Column, Text
+from sqlalchemy import Column, Index, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -37,6 +37,19 @@ class CampaignRecommendation(TenantBaseModel, table=True):
     """
 
     __tablename__ = "campaign_recommendation"
+    __table_args__ = (
+        # Serves the tenant's active (non-expired) recommendation listing
+        Index(
+            "idx_campaign_recommendation_tenant_status_expires",
+            "tenant_id",
+            "status",
+            "expires_at",
+        ),
+    )
+
+    # Covered by idx_campaign_recommendation_tenant_status_expires, so no
+    # single-column index
+    tenant_id: UUID = Field(foreign_key="tenant.id")
 
     # What triggered this recommendation
     trigger_type: str = Field(index=True)  # trending_topic, sentiment_shift, engagement_spike, seasonal
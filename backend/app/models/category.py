@@ -69,7 +69,7 @@ class MessageCategory(SQLModel, table=True):
 
     # Stance: the message's position on this category/issue
     # e.g., "strongly_supports", "supports", "neutral", "opposes", "strongly_opposes"
-    stance: str | None = Field(default=None)
+    stance: str | None = Field(default=None, max_length=32)
     stance_confidence: float | None = Field(default=None, ge=0, le=1)
 
     # Relationships
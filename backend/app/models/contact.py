@@ -107,8 +107,8 @@ class ContactBase(SQLModel):
     date_of_birth: date | None = Field(default=None)
     age_estimate: int | None = Field(default=None)  # Estimated age if DOB unknown
     age_estimate_source: str | None = Field(default=None)  # "manual", "inferred", "public_records"
-    gender: str | None = Field(default=None)  # "male", "female", "non_binary", "other", "unknown"
-    pronouns: str | None = Field(default=None)  # "he_him", "she_her", "they_them", etc.
+    gender: str | None = Field(default=None, max_length=32)  # "male", "female", "non_binary", "other", "unknown"
+    pronouns: str | None = Field(default=None, max_length=32)  # "he_him", "she_her", "they_them", etc.
 
     # Extended demographics for targeting
     prefix: str | None = Field(default=None)  # Mr., Mrs., Dr., etc.
@@ -125,24 +125,24 @@ class ContactBase(SQLModel):
     industry: str | None = Field(default=None)
 
     # Voter/political info (for constituent management)
-    voter_status: str | None = Field(default=None)  # "active", "inactive", "unregistered"
-    party_affiliation: str | None = Field(default=None)  # "democrat", "republican", "independent", etc.
+    voter_status: str | None = Field(default=None, max_length=32)  # "active", "inactive", "unregistered"
+    party_affiliation: str | None = Field(default=None, max_length=32)  # "democrat", "republican", "independent", etc.
     voter_registration_date: date | None = Field(default=None)
     modeled_party: str | None = Field(default=None)  # For non-party-registration states
 
     # Socioeconomic indicators (inferred or from public data)
-    income_bracket: str | None = Field(default=None)  # "under_25k", "25k_50k", "50k_75k", "75k_100k", "100k_150k", "over_150k"
-    education_level: str | None = Field(default=None)  # "high_school", "some_college", "bachelors", "masters", "doctorate"
-    homeowner_status: str | None = Field(default=None)  # "owner", "renter", "unknown"
+    income_bracket: str | None = Field(default=None, max_length=32)  # "under_25k", "25k_50k", "50k_75k", "75k_100k", "100k_150k", "over_150k"
+    education_level: str | None = Field(default=None, max_length=32)  # "high_school", "some_college", "bachelors", "masters", "doctorate"
+    homeowner_status: str | None = Field(default=None, max_length=32)  # "owner", "renter", "unknown"
 
     # Household info
     household_size: int | None = Field(default=None)
     has_children: bool | None = Field(default=None)
-    marital_status: str | None = Field(default=None)  # "single", "married", "divorced", "widowed"
+    marital_status: str | None = Field(default=None, max_length=32)  # "single", "married", "divorced", "widowed"
 
     # Language/communication preferences
     preferred_language: str | None = Field(default=None)  # ISO 639-1 code, e.g., "en", "es"
-    communication_preference: str | None = Field(default=None)  # "email", "phone", "mail", "sms"
+    communication_preference: str | None = Field(default=None, max_length=32)  # "email", "phone", "mail", "sms"
 
     # Additional contact methods
     secondary_email: str | None = Field(default=None)
@@ -154,7 +154,8 @@ class Contact(ContactBase, TenantBaseModel, table=True):
 
     __tablename__ = "contact"
     # Note: Email uniqueness is now enforced via partial index in migration
-    # to allow multiple contacts with NULL email (common for voter imports)
+    # to allow multiple contacts with NULL email (common for voter imports).
+    # Upserts must use ON CONFLICT (tenant_id, email) WHERE email IS NOT NULL.
     __table_args__ = ()
 
     def __init__(self, **data):
@@ -187,11 +188,11 @@ class Contact(ContactBase, TenantBaseModel, table=True):
     # }
 
     # Geographic targeting (denormalized from address for efficient queries)
-    state: str | None = Field(default=None, index=True)  # 2-letter code
-    zip_code: str | None = Field(default=None, index=True)
-    county: str | None = Field(default=None, index=True)
-    congressional_district: str | None = Field(default=None, index=True)  # e.g., "CA-12"
-    state_legislative_district: str | None = Field(default=None, index=True)  # State senate/assembly
+    state: str | None = Field(default=None, index=True, max_length=2)  # 2-letter code
+    zip_code: str | None = Field(default=None, index=True, max_length=10)
+    county: str | None = Field(default=None, index=True, max_length=64)
+    congressional_district: str | None = Field(default=None, index=True, max_length=64)  # e.g., "CA-12"
+    state_legislative_district: str | None = Field(default=None, index=True, max_length=64)  # State senate/assembly
 
     # Voter file fields (indexed for matching)
     state_voter_id: str | None = Field(default=None, index=True)  # State-assigned voter ID
@@ -210,7 +211,7 @@ class Contact(ContactBase, TenantBaseModel, table=True):
 
     # Dominant tones across all messages from this contact
     # Computed from the most frequent tones in message analyses
-    dominant_tones: list[str] = Field(default_factory=list, sa_column=Column(ARRAY(String)))
+    dominant_tones: list[str] = Field(default_factory=list, sa_column=Column(JSONB))
 
     # Deprecated - kept for migration period
     avg_sentiment: float | None = Field(default=None)
@@ -380,8 +381,8 @@ class ContactUpdate(SQLModel):
     date_of_birth: date | None = None
     age_estimate: int | None = None
     age_estimate_source: str | None = None
-    gender: str | None = None
-    pronouns: str | None = None
+    gender: str | None = Field(default=None, max_length=32)
+    pronouns: str | None = Field(default=None, max_length=32)
 
     # Name components
     prefix: str | None = None
@@ -398,8 +399,8 @@ class ContactUpdate(SQLModel):
     industry: str | None = None
 
     # Voter/political
-    voter_status: str | None = None
-    party_affiliation: str | None = None
+    voter_status: str | None = Field(default=None, max_length=32)
+    party_affiliation: str | None = Field(default=None, max_length=32)
     voter_registration_date: date | None = None
     modeled_party: str | None = None
 
@@ -410,29 +411,29 @@ class ContactUpdate(SQLModel):
     municipal_district: str | None = None
 
     # Socioeconomic
-    income_bracket: str | None = None
-    education_level: str | None = None
-    homeowner_status: str | None = None
+    income_bracket: str | None = Field(default=None, max_length=32)
+    education_level: str | None = Field(default=None, max_length=32)
+    homeowner_status: str | None = Field(default=None, max_length=32)
 
     # Household
     household_size: int | None = None
     has_children: bool | None = None
-    marital_status: str | None = None
+    marital_status: str | None = Field(default=None, max_length=32)
 
     # Communication
     preferred_language: str | None = None
-    communication_preference: str | None = None
+    communication_preference: str | None = Field(default=None, max_length=32)
     secondary_email: str | None = None
     mobile_phone: str | None = None
     work_phone: str | None = None
 
     # Address and location
     address: dict | None = None
-    state: str | None = None
-    zip_code: str | None = None
-    county: str | None = None
-    congressional_district: str | None = None
-    state_legislative_district: str | None = None
+    state: str | None = Field(default=None, max_length=2)
+    zip_code: str | None = Field(default=None, max_length=10)
+    county: str | None = Field(default=None, max_length=64)
+    congressional_district: str | None = Field(default=None, max_length=64)
+    state_legislative_district: str | None = Field(default=None, max_length=64)
     latitude: float | None = None
     longitude: float | None = None
 
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Literal
 from uuid import UUID
 
-from sqlalchemy import Column, Text
+from sqlalchemy import Column, Index, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -360,6 +360,13 @@ class EmailSuppression(TenantBaseModel, table=True):
     """
 
     __tablename__ = "email_suppression"
+    __table_args__ = (
+        # Serves the per-tenant "is this address suppressed?" checks
+        Index("idx_email_suppression_tenant_email", "tenant_id", "email"),
+    )
+
+    # Covered by idx_email_suppression_tenant_email, so no single-column index
+    tenant_id: UUID = Field(foreign_key="tenant.id")
 
     # The suppressed email address
     email: str = Field(index=True)
@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.models.base import TenantBaseModel
@@ -38,9 +38,13 @@ class ListOfValues(TenantBaseModel, table=True):
     __tablename__ = "list_of_values"
     __table_args__ = (
         UniqueConstraint("tenant_id", "list_type", "value", name="uq_lov_tenant_type_value"),
+        Index("idx_lov_tenant_list_type", "tenant_id", "list_type"),
     )
 
-    list_type: str = Field(index=True)  # "prefix", "pronoun", "language", etc.
+    # Covered by idx_lov_tenant_list_type, so no single-column index
+    tenant_id: UUID = Field(foreign_key="tenant.id")
+
+    list_type: str  # "prefix", "pronoun", "language", etc.
     value: str = Field(index=True)       # Stored value (e.g., "mr", "he_him")
     label: str                           # Display label (e.g., "Mr.", "he/him")
     sort_order: int = Field(default=0)
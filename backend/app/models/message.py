@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Literal
 from uuid import UUID
 
-from sqlalchemy import Column, Text
+from sqlalchemy import Column, Index, Text, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -37,6 +37,27 @@ class Message(MessageBase, TenantBaseModel, table=True):
     """Message database model."""
 
     __tablename__ = "message"
+    __table_args__ = (
+        # Serves tenant-scoped received_at ranges (analytics trends, volume);
+        # the INCLUDE columns let the analytics aggregates and their join to
+        # analysis run as index-only scans
+        Index(
+            "idx_message_tenant_received_at",
+            "tenant_id",
+            "received_at",
+            postgresql_include=["id", "source", "is_coordinated", "processed_at"],
+        ),
+        # Pending backlog per tenant; small, since messages leave it once processed
+        Index(
+            "idx_message_tenant_pending",
+            "tenant_id",
+            "received_at",
+            postgresql_where=text("processing_status = 'pending'"),
+        ),
+    )
+
+    # Covered by idx_message_tenant_received_at, so no single-column index
+    tenant_id: UUID = Field(foreign_key="tenant.id")
 
     # Foreign keys
     contact_id: UUID | None = Field(default=None, foreign_key="contact.id", index=True)
@@ -75,6 +96,28 @@ class Message(MessageBase, TenantBaseModel, table=True):
     workflow_executions: list["WorkflowExecution"] = Relationship(back_populates="message")
 
 
+class MessageHourlyRollup(SQLModel, table=True):
+    """Message and sentiment totals per tenant, hour and source.
+
+    Lets the analytics trend and volume endpoints read a row per hour
+    instead of scanning every message in the range. Rows cover whole hours
+    only and are rebuilt from message and analysis by the
+    refresh_message_rollup and rebuild_message_rollup worker tasks, never
+    updated in place.
+    """
+
+    __tablename__ = "message_hourly_rollup"
+
+    tenant_id: UUID = Field(foreign_key="tenant.id", primary_key=True, ondelete="CASCADE")
+    hour: datetime = Field(primary_key=True)  # date_trunc('hour', received_at)
+    source: str = Field(primary_key=True)
+
+    message_count: int = Field(default=0)
+    analyzed_count: int = Field(default=0)  # Messages with an analysis row
+    sentiment_sum: float = Field(default=0)
+    sentiment_count: int = Field(default=0)  # Analyses with a sentiment_score
+
+
 class MessageCreate(MessageBase):
     """Schema for creating a message."""
 
@@ -26,8 +26,8 @@ PromptName = Literal[
 class PromptTemplateBase(SQLModel):
     """Base schema for prompt templates."""
 
-    name: str = Field(index=True)  # "message_analysis", "categorization", etc.
-    description: str | None = None
+    name: str = Field(index=True, max_length=255)  # "message_analysis", "categorization", etc.
+    description: str | None = Field(default=None, sa_column=Column(Text))
     is_active: bool = Field(default=True)
 
 
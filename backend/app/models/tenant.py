@@ -72,6 +72,10 @@ class Tenant(TenantBase, BaseModel, table=True):
     azure_tenant_id: str | None = Field(default=None, index=True)
     graph_subscription_id: str | None = Field(default=None)  # For webhook notifications
 
+    # Campaigns with status "active"; maintained by a trigger on campaign,
+    # never written by the application
+    active_campaign_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+
     # Relationships
     users: list["User"] = Relationship(back_populates="tenant")
     categories: list["Category"] = Relationship(back_populates="tenant")
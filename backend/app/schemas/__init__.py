@@ -1,5 +1,6 @@
 """Pydantic schemas for API requests and responses."""
 
+from app.schemas.base import APIModel
 from app.schemas.auth import (
     LoginRequest,
     RegisterRequest,
@@ -27,6 +28,8 @@ from app.schemas.roles import (
 )
 
 __all__ = [
+    # Base
+    "APIModel",
     # Auth
     "LoginRequest",
     "RegisterRequest",
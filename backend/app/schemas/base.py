@@ -0,0 +1,15 @@
+"""Shared base for API schemas."""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class APIModel(BaseModel):
+    """
+    Base for request and response schemas declared alongside endpoints.
+
+    defer_build postpones building each model's validator and serializer
+    from class definition to first use, so starting a process that imports
+    the routers does not pay for schemas it never validates.
+    """
+
+    model_config = ConfigDict(defer_build=True)
@@ -19,6 +19,7 @@ from app.models.prompt_template import PromptTemplate as PromptTemplateModel
 from app.services.ai.providers import get_provider, AIResponse
 from app.services.ai.providers.base import AIProviderError
 from app.services.ai.prompts.defaults import get_default_prompt, PromptTemplate
+from app.services.ai.usage_buffer import ai_usage_buffer
 
 
 class MessageAnalyzer:
@@ -238,7 +239,12 @@ class MessageAnalyzer:
         status: str = "success",
         error_message: str | None = None,
     ) -> None:
-        """Log AI API usage for analytics."""
+        """
+        Log AI API usage for analytics.
+
+        Goes through the batched ai_usage_buffer when the process runs one
+        (the worker does), and otherwise commits with the caller's session.
+        """
         log = AIUsageLog(
             tenant_id=self.tenant.id,
             operation_type=operation_type,
@@ -253,7 +259,8 @@ class MessageAnalyzer:
             error_message=error_message,
             user_id=self.user_id,
         )
-        self.session.add(log)
+        if not ai_usage_buffer.add(log.model_dump()):
+            self.session.add(log)
 
     def _normalize_entities(self, entities: dict[str, Any] | list) -> list[dict]:
         """
@@ -0,0 +1,107 @@
+"""Batched writes of AI usage log rows."""
+
+import asyncio
+from typing import Any
+
+import structlog
+from sqlalchemy import insert
+
+from app.core.database import async_session_maker
+from app.models.ai_usage_log import AIUsageLog
+
+logger = structlog.get_logger()
+
+# Queued by stop() to make the flush loop write what it holds and exit
+_STOP = object()
+
+
+class AIUsageBuffer:
+    """
+    Collects ai_usage_log rows and inserts them in batches.
+
+    Rows are written when max_batch have accumulated or flush_interval
+    seconds after the first row of a batch arrived, whichever comes first,
+    as one multi-row INSERT on the buffer's own session. Until start() is
+    called (or after stop()), add() refuses rows and callers write them
+    themselves.
+
+    Rows still queued when the process dies without calling stop() are
+    lost, so this is only for usage reporting, not for anything that must
+    commit with the caller's transaction.
+    """
+
+    def __init__(self, max_batch: int = 500, flush_interval: float = 1.0) -> None:
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        """Start the background flush loop on the running event loop."""
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write any queued rows and stop the flush loop."""
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        self._queue.put_nowait(_STOP)
+        await task
+        self._queue = None
+
+    def add(self, row: dict[str, Any]) -> bool:
+        """
+        Queue one row for insertion.
+
+        Args:
+            row: Column values for ai_usage_log, including id and timestamps
+
+        Returns:
+            False if the buffer is not running and the row was not queued
+        """
+        if self._task is None:
+            return False
+        self._queue.put_nowait(row)
+        return True
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            stopping = False
+            while len(batch) < self.max_batch:
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                except TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+            if stopping:
+                return
+
+    async def _flush(self, rows: list[dict[str, Any]]) -> None:
+        try:
+            async with async_session_maker() as session:
+                await session.execute(insert(AIUsageLog), rows)
+                await session.commit()
+        except Exception as e:
+            logger.error("Failed to write AI usage log batch", rows=len(rows), error=str(e))
+
+
+ai_usage_buffer = AIUsageBuffer()
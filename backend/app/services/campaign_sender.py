@@ -19,7 +19,7 @@ from app.services.email.template_renderer import (
     TemplateContext,
     render_subject_and_body,
 )
-from app.api.v1.email_webhooks import generate_tracking_token
+from app.services.email.tracking import generate_tracking_token
 
 logger = logging.getLogger(__name__)
 
@@ -0,0 +1,39 @@
+"""Atomic updates to campaign delivery counters."""
+
+from uuid import UUID
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.campaign import CampaignStats
+
+
+async def increment_campaign_stats(
+    session: AsyncSession,
+    campaign_id: UUID,
+    **increments: int,
+) -> None:
+    """
+    Add to one or more campaign counters in a single UPDATE.
+
+    The increment happens in SQL (``total_sent = total_sent + n``), so
+    concurrent webhooks and senders never lose each other's updates, and only
+    campaign_stats is written, which keeps the UPDATE HOT-eligible.
+
+    Args:
+        session: Database session (the caller commits)
+        campaign_id: Campaign whose counters to update
+        **increments: Counter name to amount, e.g. ``total_opened=1``
+    """
+    increments = {name: amount for name, amount in increments.items() if amount}
+    if not increments:
+        return
+
+    await session.execute(
+        update(CampaignStats)
+        .where(CampaignStats.campaign_id == campaign_id)
+        .values({
+            name: getattr(CampaignStats, name) + amount
+            for name, amount in increments.items()
+        })
+    )
@@ -8,6 +8,12 @@ from app.services.email.providers import (
 )
 from app.services.email.template_renderer import render_template
 from app.services.email.sender import send_email, send_template_email
+from app.services.email.tracking import (
+    generate_tracking_token,
+    validate_tracking_token,
+    generate_unsubscribe_token,
+    validate_unsubscribe_token,
+)
 
 __all__ = [
     "EmailProvider",
@@ -17,4 +23,8 @@ __all__ = [
     "render_template",
     "send_email",
     "send_template_email",
+    "generate_tracking_token",
+    "validate_tracking_token",
+    "generate_unsubscribe_token",
+    "validate_unsubscribe_token",
 ]
@@ -10,7 +10,7 @@ from typing import BinaryIO
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, text
 import structlog
 
 from app.models.contact import Contact
@@ -35,6 +35,32 @@ MATCHING_STRATEGIES = {
     "email_only": "Only match by email",
 }
 
+# USPS codes by lowercase name, for voter files that spell the state out
+STATE_CODES = {
+    "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR",
+    "california": "CA", "colorado": "CO", "connecticut": "CT", "delaware": "DE",
+    "district of columbia": "DC", "florida": "FL", "georgia": "GA", "hawaii": "HI",
+    "idaho": "ID", "illinois": "IL", "indiana": "IN", "iowa": "IA",
+    "kansas": "KS", "kentucky": "KY", "louisiana": "LA", "maine": "ME",
+    "maryland": "MD", "massachusetts": "MA", "michigan": "MI", "minnesota": "MN",
+    "mississippi": "MS", "missouri": "MO", "montana": "MT", "nebraska": "NE",
+    "nevada": "NV", "new hampshire": "NH", "new jersey": "NJ", "new mexico": "NM",
+    "new york": "NY", "north carolina": "NC", "north dakota": "ND", "ohio": "OH",
+    "oklahoma": "OK", "oregon": "OR", "pennsylvania": "PA", "rhode island": "RI",
+    "south carolina": "SC", "south dakota": "SD", "tennessee": "TN", "texas": "TX",
+    "utah": "UT", "vermont": "VT", "virginia": "VA", "washington": "WA",
+    "west virginia": "WV", "wisconsin": "WI", "wyoming": "WY",
+    "american samoa": "AS", "guam": "GU", "northern mariana islands": "MP",
+    "puerto rico": "PR", "u.s. virgin islands": "VI", "virgin islands": "VI",
+}
+
+# Length limits of the sized contact columns (codes and enum-like values)
+CONTACT_FIELD_MAX_LENGTHS = {
+    column.name: column.type.length
+    for column in Contact.__table__.columns
+    if getattr(column.type, "length", None)
+}
+
 
 class VoterImportService:
     """Service for handling voter file imports."""
@@ -221,6 +247,7 @@ class VoterImportService:
         job.status = "processing"
         job.started_at = datetime.utcnow()
         await self.session.commit()
+        await self._relax_commit_durability()
 
         try:
             # Read file
@@ -239,6 +266,7 @@ class VoterImportService:
                     job.rows_processed = i + 1
                     if i % 100 == 0:  # Commit every 100 rows
                         await self.session.commit()
+                        await self._relax_commit_durability()
                         await update_job_progress(
                             job.id,
                             {
@@ -292,6 +320,16 @@ class VoterImportService:
             await delete_job_progress(job.id)
             raise
 
+    async def _relax_commit_durability(self) -> None:
+        """
+        Let the current import batch commit without waiting for the WAL flush.
+
+        A crash can lose the last few committed batches but never corrupts
+        data, and the job can be re-run from its file. SET LOCAL scopes this
+        to the current transaction, so pooled connections are unaffected.
+        """
+        await self.session.execute(text("SET LOCAL synchronous_commit = off"))
+
     async def _process_row(self, job: Job, row: dict, row_num: int) -> None:
         """Process a single row from the import file."""
         mappings = job.confirmed_mappings
@@ -702,9 +740,22 @@ class VoterImportService:
         if field == "email":
             return value.lower().strip()
 
-        # State normalization
+        # State normalization: accept USPS codes and full names; anything
+        # else is dropped rather than cut down to a wrong two-letter code
         if field == "state":
-            return value.upper()[:2]
+            if len(value) == 2:
+                return value.upper()
+            return STATE_CODES.get(" ".join(value.lower().split()))
+
+        if field == "zip_code":
+            value = "".join(value.split())
+
+        # Voter files can carry longer values than the sized columns hold
+        # (long county or district names); cut them to fit instead of
+        # failing the row
+        max_length = CONTACT_FIELD_MAX_LENGTHS.get(field)
+        if max_length and len(value) > max_length:
+            return value[:max_length]
 
         return value
 
@@ -1,9 +1,10 @@
 """ARQ task definitions for background job processing."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from uuid import UUID
 
 import structlog
+from sqlalchemy import text
 from sqlmodel import select
 
 from app.core.database import async_session_maker
@@ -16,6 +17,14 @@ from app.services.ai import MessageAnalyzer, AIProviderError, AIBudgetExceededEr
 
 logger = structlog.get_logger()
 
+# How many months of audit_log partitions to keep created beyond the current one
+AUDIT_LOG_PARTITION_MONTHS_AHEAD = 3
+
+# How many trailing hours of message_hourly_rollup each refresh recomputes.
+# Messages are normally analyzed within minutes of arriving; changes to
+# older hours are picked up by the nightly full rebuild.
+MESSAGE_ROLLUP_WINDOW_HOURS = 48
+
 
 async def _mark_job_failed(job_id: str, tenant_id: str, error_message: str) -> None:
     """Mark a job as failed in the database.
@@ -133,6 +142,7 @@ async def send_campaign_emails(
     from app.models.email import EmailTemplate, TenantEmailConfig, SentEmail, EmailSuppression
     from app.models.contact import Contact
     from app.services.campaign_sender import CampaignSenderService
+    from app.services.campaign_stats import increment_campaign_stats
 
     logger.info(
         "Starting campaign send task",
@@ -247,6 +257,7 @@ async def send_campaign_emails(
                     # No more pending recipients
                     break
 
+                batch_start_sent, batch_start_failed = sent_count, failed_count
                 for recipient in recipients:
                     try:
                         # Check suppression
@@ -293,9 +304,6 @@ async def send_campaign_emails(
                         recipient.sent_at = datetime.utcnow()
                         sent_count += 1
 
-                        # Update campaign stats
-                        campaign.total_sent += 1
-
                     except Exception as e:
                         logger.error(
                             "Failed to send to recipient",
@@ -307,7 +315,14 @@ async def send_campaign_emails(
                         recipient.failed_at = datetime.utcnow()
                         recipient.error_message = str(e)[:500]
                         failed_count += 1
-                        campaign.total_failed += 1
+
+                # Update campaign stats once per batch
+                await increment_campaign_stats(
+                    session,
+                    campaign.id,
+                    total_sent=sent_count - batch_start_sent,
+                    total_failed=failed_count - batch_start_failed,
+                )
 
                 # Commit batch
                 await session.commit()
@@ -625,6 +640,161 @@ async def check_scheduled_campaigns(ctx: dict) -> dict:
         return {"status": "failed", "error": str(e)}
 
 
+async def maintain_audit_log_partitions(ctx: dict) -> dict:
+    """ARQ cron task to keep monthly audit_log partitions created ahead of time.
+
+    Calls the create_audit_log_partitions() SQL function, which is idempotent,
+    so rows land in their month's partition rather than audit_log_default.
+
+    Args:
+        ctx: ARQ context
+
+    Returns:
+        Result dictionary with status
+    """
+    try:
+        async with async_session_maker() as session:
+            await session.execute(
+                text("SELECT create_audit_log_partitions(:months_ahead)"),
+                {"months_ahead": AUDIT_LOG_PARTITION_MONTHS_AHEAD},
+            )
+            await session.commit()
+
+        logger.info("Audit log partitions maintained")
+        return {"status": "completed"}
+
+    except Exception as e:
+        logger.error("Audit log partition maintenance failed", error=str(e))
+        return {"status": "failed", "error": str(e)}
+
+
+async def refresh_dashboard_summary(ctx: dict) -> dict:
+    """ARQ cron task to refresh the tenant_dashboard_summary materialized view.
+
+    CONCURRENTLY lets dashboard reads continue against the previous
+    contents while the view is recomputed. A refresh still running when
+    the next one is due holds an advisory lock, and the new run is skipped
+    rather than queued behind it.
+
+    Args:
+        ctx: ARQ context
+
+    Returns:
+        Result dictionary with status
+    """
+    try:
+        async with async_session_maker() as session:
+            locked = await session.scalar(
+                text("SELECT pg_try_advisory_xact_lock(hashtext('tenant_dashboard_summary'))")
+            )
+            if not locked:
+                logger.info("Dashboard summary refresh skipped, previous refresh still running")
+                return {"status": "skipped"}
+
+            await session.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY tenant_dashboard_summary"))
+            await session.commit()
+
+        logger.debug("Dashboard summary refreshed")
+        return {"status": "completed"}
+
+    except Exception as e:
+        logger.error("Dashboard summary refresh failed", error=str(e))
+        return {"status": "failed", "error": str(e)}
+
+
+async def _recompute_message_rollup(since: datetime | None) -> None:
+    """Rebuild message_hourly_rollup rows from message and analysis.
+
+    Recomputes every hour from since (all hours if None) up to the start of
+    the current hour, which is still filling and is read from message
+    directly. Rows are replaced rather than incremented, so reruns and
+    overlapping windows never double count, and both statements run in one
+    transaction, so readers see the old rows or the new ones. A transaction
+    advisory lock serializes overlapping runs, such as a refresh firing
+    while the nightly rebuild is still going, so neither one inserts rows
+    the other has not yet deleted.
+    """
+    if since:
+        delete_where = "WHERE hour >= :since"
+        insert_where = "AND m.received_at >= :since"
+        params = {"since": since}
+    else:
+        delete_where = insert_where = ""
+        params = {}
+
+    async with async_session_maker() as session:
+        await session.execute(text("SELECT pg_advisory_xact_lock(hashtext('message_hourly_rollup'))"))
+        await session.execute(text(f"DELETE FROM message_hourly_rollup {delete_where}"), params)
+        await session.execute(
+            text(f"""
+                INSERT INTO message_hourly_rollup (
+                    tenant_id, hour, source,
+                    message_count, analyzed_count, sentiment_sum, sentiment_count
+                )
+                SELECT
+                    m.tenant_id,
+                    date_trunc('hour', m.received_at),
+                    m.source,
+                    count(*),
+                    count(a.message_id),
+                    coalesce(sum(a.sentiment_score), 0),
+                    count(a.sentiment_score)
+                FROM message m
+                LEFT JOIN analysis a ON a.message_id = m.id
+                WHERE m.received_at < date_trunc('hour', now() AT TIME ZONE 'UTC') {insert_where}
+                GROUP BY 1, 2, 3
+            """),
+            params,
+        )
+        await session.commit()
+
+
+async def refresh_message_rollup(ctx: dict) -> dict:
+    """ARQ cron task to bring recent hours of message_hourly_rollup up to date.
+
+    Args:
+        ctx: ARQ context
+
+    Returns:
+        Result dictionary with status
+    """
+    since = datetime.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=MESSAGE_ROLLUP_WINDOW_HOURS
+    )
+    try:
+        await _recompute_message_rollup(since)
+
+        logger.debug("Message rollup refreshed", since=since.isoformat())
+        return {"status": "completed"}
+
+    except Exception as e:
+        logger.error("Message rollup refresh failed", error=str(e))
+        return {"status": "failed", "error": str(e)}
+
+
+async def rebuild_message_rollup(ctx: dict) -> dict:
+    """ARQ cron task to rebuild all of message_hourly_rollup.
+
+    Catches what refresh_message_rollup's window misses: messages imported
+    with an old received_at, re-analysis of old messages, and deletes.
+
+    Args:
+        ctx: ARQ context
+
+    Returns:
+        Result dictionary with status
+    """
+    try:
+        await _recompute_message_rollup(None)
+
+        logger.info("Message rollup rebuilt")
+        return {"status": "completed"}
+
+    except Exception as e:
+        logger.error("Message rollup rebuild failed", error=str(e))
+        return {"status": "failed", "error": str(e)}
+
+
 async def analyze_message(ctx: dict, message_id: str, tenant_id: str) -> dict:
     """ARQ task to analyze a single message using AI.
 
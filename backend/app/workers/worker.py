@@ -11,12 +11,17 @@ from arq import cron
 from arq.connections import RedisSettings
 
 from app.core.config import get_settings
+from app.services.ai.usage_buffer import ai_usage_buffer
 from app.workers.tasks import (
     process_voter_import,
     export_contacts,
     send_campaign_emails,
     generate_campaign_recommendations,
     check_scheduled_campaigns,
+    maintain_audit_log_partitions,
+    refresh_dashboard_summary,
+    refresh_message_rollup,
+    rebuild_message_rollup,
     analyze_message,
 )
 
@@ -27,11 +32,13 @@ logger = structlog.get_logger()
 async def startup(ctx: dict) -> None:
     """Called when worker starts up."""
     logger.info("ARQ worker starting up")
+    ai_usage_buffer.start()
 
 
 async def shutdown(ctx: dict) -> None:
     """Called when worker shuts down."""
     logger.info("ARQ worker shutting down")
+    await ai_usage_buffer.stop()
 
 
 async def on_job_start(ctx: dict) -> None:
@@ -66,6 +73,10 @@ class WorkerSettings:
         send_campaign_emails,
         generate_campaign_recommendations,
         check_scheduled_campaigns,
+        maintain_audit_log_partitions,
+        refresh_dashboard_summary,
+        refresh_message_rollup,
+        rebuild_message_rollup,
         analyze_message,
     ]
 
@@ -99,6 +110,15 @@ class WorkerSettings:
     cron_jobs = [
         # Check for scheduled campaigns every 15 minutes
         cron(check_scheduled_campaigns, minute={0, 15, 30, 45}),
+        # Create upcoming audit_log partitions daily (idempotent)
+        cron(maintain_audit_log_partitions, hour=3, minute=0),
+        # Refresh the dashboard materialized view every five minutes, offset
+        # from the rollup refresh so the two full scans do not coincide
+        cron(refresh_dashboard_summary, minute=set(range(2, 60, 5))),
+        # Recompute recent hours of the message rollup every five minutes,
+        # and all of it nightly
+        cron(refresh_message_rollup, minute=set(range(0, 60, 5))),
+        cron(rebuild_message_rollup, hour=3, minute=30),
     ]
 
 
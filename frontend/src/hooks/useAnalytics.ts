@@ -37,7 +37,7 @@ export function useSentimentTrends(params: AnalyticsParams = {}) {
       Object.entries(params).forEach(([key, value]) => {
         if (value) searchParams.append(key, value);
       });
-      const { data } = await api.get<SentimentTrend[]>(
+      const { data } = await api.get<SentimentTrend>(
         `/analytics/sentiment?${searchParams.toString()}`
       );
       return data;
@@ -350,11 +350,15 @@ export interface DashboardStats {
 }
 
 export interface SentimentTrend {
-  date: string;
-  positive: number;
-  neutral: number;
-  negative: number;
-  avg_score: number;
+  // Parallel arrays, one entry per period; dates are unix seconds (UTC)
+  data: {
+    dates: number[];
+    avg_sentiment: number[];
+    message_count: number[];
+  };
+  period: string;
+  total_messages: number;
+  avg_sentiment: number;
 }
 
 export interface CategoryBreakdown {